@@ -1,4 +1,5 @@
 import asyncio
+from typing import Callable
 
 from src.constants.engine import (
     GAME_CONTEXT_SYNCHRONIZER,
@@ -37,6 +38,7 @@ class Engine(EnginePrototype):
         self._game_hidden: bool = False
 
         self._game_context = None
+        self._context_waiters = []
         self._game_context_synchronizer = self._init_game_context_synchronizer()
         self._function_triggerer = self._init_function_triggerer()
         self._operator = self._init_operator()
@@ -44,6 +46,52 @@ class Engine(EnginePrototype):
         self._world_map_handler = WorldMapHandler(engine=self)
         self._original_codes = {}
 
+    def publish_game_context(self, game_context: GameContext, unchanged_sections: set[str] = None) -> None:
+        # unchanged_sections were rebuilt but hold the same values, waiters on them aren't woken
+        previous = self._game_context
+        game_context.generation = previous.generation + 1 if previous else 0
+        self._game_context = game_context
+
+        sections = game_context.changed_sections(previous)
+        if unchanged_sections and previous is not None:
+            sections -= unchanged_sections
+        for waiter_sections, future in self._context_waiters:
+            if not future.done() and (waiter_sections is None or waiter_sections & sections):
+                future.set_result(sections)
+
+    async def wait_until(self,
+                         predicate: Callable[[], bool],
+                         sections: list[str] = None,
+                         timeout: float = None,
+                         ) -> bool:
+        # True once predicate holds, False if timeout seconds pass first. predicate is evaluated
+        # again only when one of the sections changes, on every update when sections is None
+        if predicate():
+            return True
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        watched = None if sections is None else set(sections)
+
+        while True:
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+
+            waiter = (watched, loop.create_future())
+            self._context_waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter[1], remaining)
+            except asyncio.TimeoutError:
+                return predicate()
+            finally:
+                self._context_waiters.remove(waiter)
+
+            if predicate():
+                return True
+
     def _init_simulated_data_memory(self) -> SimulatedDataMemory:
         raise NotImplementedError
 
@@ -110,20 +158,19 @@ class Engine(EnginePrototype):
         game_func_params = self._simulated_data_memory.game_func_params
         game_funcs = self._simulated_data_memory.game_funcs
 
-        try:
-            self.os_api.read_memory(address=self._simulated_data_memory.ptr_base, h_process=self.h_process, size=1)
-            self.os_api.dealloc_memory(address=self._simulated_data_memory.ptr_base, h_process=self.h_process)
-        except OSError:
-            pass
+        # check if process is still running or h_process is still valid, the region map
+        # _restore_functions refreshed answers all the checks below
+        if self.os_api.is_address_mapped(h_process=self.h_process, address=self._simulated_data_memory.ptr_base):
+            try:
+                self.os_api.dealloc_memory(address=self._simulated_data_memory.ptr_base, h_process=self.h_process)
+            except OSError:
+                pass
 
         for param_name, param_addr in game_func_params.model_dump().items():
             if param_name.startswith('ptr_') or not param_addr:
                 continue
 
-            # check if process is still running or h_process is still valid
-            try:
-                self.os_api.read_memory(address=param_addr, h_process=self.h_process, size=1)
-            except OSError:
+            if not self.os_api.is_address_mapped(h_process=self.h_process, address=param_addr):
                 continue
             self.os_api.dealloc_memory(address=param_addr, h_process=self.h_process)
 
@@ -131,27 +178,22 @@ class Engine(EnginePrototype):
             for callback_addr in game_func.callbacks.values():
                 if not callback_addr:
                     continue
-                # check if process is still running or h_process is still valid
-                try:
-                    self.os_api.read_memory(address=callback_addr, h_process=self.h_process, size=1)
-                except OSError:
+                if not self.os_api.is_address_mapped(h_process=self.h_process, address=callback_addr):
                     continue
                 self.os_api.dealloc_memory(address=callback_addr, h_process=self.h_process)
             for trigger_addr in game_func.triggers.values():
                 if not trigger_addr:
                     continue
-                # check if process is still running or h_process is still valid
-                try:
-                    self.os_api.read_memory(address=trigger_addr, h_process=self.h_process, size=1)
-                except OSError:
+                if not self.os_api.is_address_mapped(h_process=self.h_process, address=trigger_addr):
                     continue
                 self.os_api.dealloc_memory(address=trigger_addr, h_process=self.h_process)
 
     def _restore_functions(self):
+        # the process may be gone already
+        self.os_api.refresh_memory_regions(h_process=self.h_process)
+
         for addr, original_code in self._original_codes.items():
-            try:
-                self.os_api.read_memory(address=addr, h_process=self.h_process, size=1)
-            except OSError:
+            if not self.os_api.is_address_mapped(h_process=self.h_process, address=addr):
                 continue
             self.os_api.write_memory(
                 h_process=self.h_process,
@@ -227,6 +269,7 @@ class Engine(EnginePrototype):
 
         self._restore_functions()
         self._deallocate_simulated_data_memory()
+        self.os_api.shutdown_io_executor(h_process=self.h_process)
 
         self._started = False
 
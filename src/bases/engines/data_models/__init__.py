@@ -13,6 +13,7 @@ from src.constants.engine import (
     RUUH_BOX_ITEM_TYPE, KUNDUN_BOX_ITEM_TYPE,
     ANC_ITEM_RARITY, FIND_OTHER_SPOTS, STAY_AND_KS, GAME_EVENT_QUIZ, GAME_EVENT_DUNGEON_ZOMBIE,
     GAME_EVENT_LOREN_TREASURE, GAME_EVENT_MEGA_DROP, EVENT_PARTICIPATION_WAITING_STATUS, GAME_EVENT_STOP_OR_DIE,
+    CONTEXT_SECTION_WORLD,
 )
 
 
@@ -575,6 +576,11 @@ class Viewport(GameObject):
     summon_count: int = 0
     object_count: int = 0
 
+    # objects that showed up, were kept and left since the previous sync
+    added_count: int = 0
+    updated_count: int = 0
+    removed_count: int = 0
+
 
 class Dialog(GameObject):
     title: str
@@ -628,6 +634,31 @@ class GameContext(GameObject):
     lobby_screen: LobbyScreen | None = None
     notifications: list[GameNotification] = Field(default_factory=list)
     events: dict[str, GameEvent] = Field(default_factory=dict)
+    generation: int = 0  # increased by every published update
+
+    def changed_sections(self, previous: 'GameContext | None') -> set[str]:
+        # sub-objects are compared by identity, an update keeps what it didn't rebuild and comparing
+        # them by value would cost a walk of every object on every update
+        if previous is None:
+            return set(type(self).model_fields) | {CONTEXT_SECTION_WORLD}
+
+        results = set()
+        for name in type(self).model_fields:
+            if name == 'generation':
+                continue
+            old_value = getattr(previous, name)
+            new_value = getattr(self, name)
+            if old_value is new_value:
+                continue
+            if isinstance(old_value, BaseModel) or isinstance(new_value, BaseModel) or old_value != new_value:
+                results.add(name)
+
+        old_world_id = previous.screen.world_id if previous.screen else None
+        new_world_id = self.screen.world_id if self.screen else None
+        if old_world_id != new_world_id:
+            results.add(CONTEXT_SECTION_WORLD)
+
+        return results
 
 
 class EngineOperatorTrainingSpot(BaseModel):
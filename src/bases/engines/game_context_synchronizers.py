@@ -1,16 +1,231 @@
 import asyncio
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Hashable
+
+from pydantic import PrivateAttr
 
 from src.utils import capture_error
+from src.bases.engines.data_models import GameContext
+from src.bases.os import OperatingSystemAPIPrototype
+from src.os.page_cache import PageCacheAPI
+from src.os.pointer_chain_cache import PointerChainCacheAPI
+from src.os.read_counter import ReadCounterAPI
+from src.constants.engine import (
+    ENGINE_IDLE_MODE,
+    SYNC_INTERVAL,
+    SYNC_LOOP_LAG_WARNING,
+    SYNC_MIN_INTERVAL,
+    SYNC_MAX_INTERVAL,
+    SYNC_DANGER_PERIOD_FACTOR,
+    SYNC_PROTECTION_MARGIN,
+    SYNC_RATE_SMOOTHING,
+)
 
 from .prototypes import EngineGameContextSynchronizerPrototype
+from .sync_schedulers import SyncScheduler, SyncTask
 
 
 class EngineGameContextSynchronizer(EngineGameContextSynchronizerPrototype):
+    _os_api: OperatingSystemAPIPrototype = PrivateAttr()
+    _read_counter: ReadCounterAPI = PrivateAttr()
+    _scheduler: SyncScheduler = PrivateAttr()
+    _page_cache: PageCacheAPI | None = PrivateAttr()
+    _pointer_chain_cache: PointerChainCacheAPI | None = PrivateAttr()
+    _allocated_blocks: int | None = PrivateAttr()
+    _traced_memory: int | None = PrivateAttr()
+    _loop_lag: float = PrivateAttr()
+    _requested_delay: float | None = PrivateAttr()
+    _last_update_at: float | None = PrivateAttr()
+    _update_interval: float = PrivateAttr()
+    _context: GameContext | None = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        # innermost so only the reads that reach the process are counted
+        self._read_counter = ReadCounterAPI(os_api=self.engine.os_api)
+        self._os_api = self._read_counter
+
+        self._page_cache = None
+        if self.engine.sync_page_cache_enabled:
+            self._page_cache = PageCacheAPI(os_api=self._os_api)
+            self._os_api = self._page_cache
+
+        self._pointer_chain_cache = None
+        if self.engine.sync_pointer_chain_cache_enabled:
+            self._pointer_chain_cache = PointerChainCacheAPI(os_api=self._os_api)
+            self._os_api = self._pointer_chain_cache
+
+        # allocations of every tick are logged, tracemalloc makes the sync a lot slower
+        self._allocated_blocks = None
+        self._traced_memory = None
+        if self.engine.sync_allocation_tracking_enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        self._loop_lag = 0.0
+        self._requested_delay = None
+        self._last_update_at = None
+        self._update_interval = SYNC_INTERVAL
+        self._context = None
+
+        self._scheduler = SyncScheduler(read_counter=lambda: self._read_counter.read_count)
+
+    @property
+    def os_api(self) -> OperatingSystemAPIPrototype:
+        return self._os_api
+
+    @property
+    def context(self) -> GameContext:
+        # the context being built by the current update, the published one outside of updates
+        if self._context is not None:
+            return self._context
+        return self.engine.game_context
+
+    def begin_context(self) -> None:
+        # a shallow copy, the sections whose task isn't due are shared with the published context.
+        # an updater that runs rebuilds its section, its fingerprint tells whether it changed
+        self._context = self.engine.game_context.model_copy()
+
+    def publish_context(self) -> None:
+        if self._context is None:
+            return
+        self.engine.publish_game_context(self._context, unchanged_sections=self._scheduler.unchanged_sections)
+        self._context = None
+
+    @property
+    def scheduler(self) -> SyncScheduler:
+        return self._scheduler
+
+    @property
+    def effective_hz(self) -> float:
+        # smoothed number of updates per second
+        return 1.0 / self._update_interval
+
+    def delay_next_update(self, delay: float) -> None:
+        # the next update waits delay seconds whatever the tasks are due in
+        self._requested_delay = delay
+
+    def get_pace(self) -> float | None:
+        # period scale of the next update, None lets the tasks that don't change back off.
+        # full rate while fighting, faster when a protection threshold is near
+        if self.engine.mode == ENGINE_IDLE_MODE:
+            return None
+
+        player = self.engine.game_context.local_player
+        if player is None or player.in_safe_zone:
+            return None
+
+        recovery = self.engine.settings.protection.recovery
+        for current, maximum, threshold in (
+                (player.current_hp, player.max_hp, recovery.hp_percent_to_use_potion),
+                (player.current_mp, player.max_mp, recovery.mp_percent_to_use_potion),
+                (player.current_sd, player.max_sd, recovery.sd_percent_to_use_potion),
+        ):
+            if maximum and current * 100 <= maximum * (threshold + SYNC_PROTECTION_MARGIN):
+                return SYNC_DANGER_PERIOD_FACTOR
+
+        viewport = self.engine.game_context.viewport
+        if viewport and viewport.monster_count:
+            return 1.0
+
+        return None
+
+    def _get_next_delay(self) -> float:
+        delay = self._requested_delay
+        self._requested_delay = None
+        if delay is None:
+            delay = self._scheduler.next_delay()
+        if delay is None:
+            delay = SYNC_INTERVAL
+        return min(max(delay, SYNC_MIN_INTERVAL), SYNC_MAX_INTERVAL)
+
+    def _track_update_rate(self) -> None:
+        now = time.monotonic()
+        if self._last_update_at is not None:
+            self._update_interval += (now - self._last_update_at - self._update_interval) * SYNC_RATE_SMOOTHING
+        self._last_update_at = now
+
+    def register_sync_task(self,
+                           name: str,
+                           group: str,
+                           updater: Callable[[], Any],
+                           period: float,
+                           priority: int = 0,
+                           condition: Callable[[], bool] | None = None,
+                           fingerprint: Callable[[], Hashable] | None = None,
+                           section: str | None = None,
+                           ) -> None:
+        self._scheduler.register(SyncTask(
+            name=name,
+            group=group,
+            updater=updater,
+            period=period,
+            priority=priority,
+            condition=condition,
+            fingerprint=fingerprint,
+            section=section
+        ))
+
+    async def run_sync_tasks(self, group: str) -> list[str]:
+        return await self._scheduler.run(group=group)
+
+    @property
+    def loop_lag(self) -> float:
+        # how late the event loop resumed the last sleep between updates, blocking work
+        # on the loop (reads that don't go through the memory io threads) shows up here
+        return self._loop_lag
+
+    async def refresh_region_map(self) -> None:
+        # keeps the region map the batched reads split on fresh, the address space is
+        # walked on the memory io thread so a full refresh doesn't stall the event loop
+        await self.os_api.aget_region_map(h_process=self.engine.h_process)
+
+    def begin_snapshot(self) -> None:
+        if self._page_cache:
+            self._page_cache.begin_snapshot()
+
+        if self.engine.sync_allocation_tracking_enabled:
+            self._allocated_blocks = sys.getallocatedblocks()
+            tracemalloc.reset_peak()
+            self._traced_memory = tracemalloc.get_traced_memory()[0]
+
+    def end_snapshot(self) -> None:
+        if self._page_cache:
+            self._page_cache.end_snapshot()
+            self._logger.debug(
+                f'Page cache: {self._page_cache.hit_count} hits, {self._page_cache.miss_count} misses, '
+                f'{self._page_cache.kernel_read_count} kernel reads'
+            )
+
+        if self._allocated_blocks is not None:
+            _, peak = tracemalloc.get_traced_memory()
+            self._logger.debug(
+                f'Allocations: {peak - self._traced_memory} bytes peak, '
+                f'{sys.getallocatedblocks() - self._allocated_blocks} blocks kept'
+            )
+            self._allocated_blocks = None
+
+    def invalidate_snapshot(self) -> None:
+        if self._page_cache:
+            self._page_cache.invalidate()
+
+    def invalidate_pointer_chains(self) -> None:
+        if self._pointer_chain_cache:
+            self._pointer_chain_cache.invalidate()
 
     async def run(self) -> None:
         while not self.engine.shutdown_event.is_set():
             try:
+                self._track_update_rate()
+                self.os_api.begin_tick()
+                self._scheduler.begin_tick(mode=self.engine.mode, pace=self.get_pace())
+                await self.refresh_region_map()
+                self.begin_snapshot()
+                self.begin_context()
                 await self.update_context()
+                self.publish_context()
             except asyncio.CancelledError:
                 break
             except KeyboardInterrupt:
@@ -18,4 +233,16 @@ class EngineGameContextSynchronizer(EngineGameContextSynchronizerPrototype):
             except Exception as e:
                 capture_error(e)
             finally:
-                await asyncio.sleep(0.05)
+                # a failed update is dropped, readers keep the last published context
+                self._context = None
+                self.end_snapshot()
+                await self._sleep(self._get_next_delay())
+
+    async def _sleep(self, delay: float) -> None:
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        await asyncio.sleep(delay)
+
+        self._loop_lag = max(loop.time() - started_at - delay, 0.0)
+        if self._loop_lag > SYNC_LOOP_LAG_WARNING:
+            self._logger.warning(f'Event loop lag: {self._loop_lag * 1000:.0f}ms')
@@ -36,6 +36,9 @@ class EnginePrototype(BaseModel):
     game_database: GameDatabase
     os_api: OperatingSystemAPIPrototype
     max_threads: int = 100
+    sync_page_cache_enabled: bool = False
+    sync_pointer_chain_cache_enabled: bool = False
+    sync_allocation_tracking_enabled: bool = False
     func_offsets: dict[str, int]
     game_funcs: dict[str, GameFunction] = Field(default_factory=dict)
     game_modules: dict[str, int]
@@ -51,6 +54,7 @@ class EnginePrototype(BaseModel):
     _event_loop: asyncio.AbstractEventLoop = PrivateAttr()
     _original_codes: dict[int, bytes] = PrivateAttr()
     _game_hidden: bool = PrivateAttr()
+    _context_waiters: list[tuple[set[str] | None, asyncio.Future]] = PrivateAttr()
 
     @property
     def game_hidden(self) -> bool:
@@ -84,14 +88,30 @@ class EnginePrototype(BaseModel):
     def game_context_synchronizer(self) -> 'EngineGameContextSynchronizerPrototype':
         return self._game_context_synchronizer
 
+    @property
+    def sync_hz(self) -> float:
+        # how many times per second the game context is updated at the moment
+        return self._game_context_synchronizer.effective_hz
+
     @property
     def simulated_data_memory(self) -> SimulatedDataMemory:
         return self._simulated_data_memory
 
     @property
     def game_context(self) -> GameContext:
+        # the last published snapshot, the synchronizer never changes it after publishing
         return self._game_context
 
+    def publish_game_context(self, game_context: GameContext, unchanged_sections: set[str] = None) -> None:
+        raise NotImplementedError
+
+    async def wait_until(self,
+                         predicate: Callable[[], bool],
+                         sections: list[str] = None,
+                         timeout: float = None,
+                         ) -> bool:
+        raise NotImplementedError
+
     async def start_training(self):
         raise NotImplementedError
 
@@ -282,6 +302,13 @@ class EngineGameContextSynchronizerPrototype(BaseModel):
     async def run(self) -> None:
         raise NotImplementedError
 
+    def invalidate_snapshot(self) -> None:
+        raise NotImplementedError
+
+    @property
+    def effective_hz(self) -> float:
+        raise NotImplementedError
+
 
 class WorldMapHandlerPrototype(BaseModel):
     engine: EnginePrototype
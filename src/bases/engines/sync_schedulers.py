@@ -0,0 +1,237 @@
+import copy
+import inspect
+import time
+from typing import Any, Callable, Hashable
+
+from pydantic import PrivateAttr, Field
+
+from src.bases.models import BaseModel
+from src.utils import capture_error
+from src.constants.engine import (
+    SYNC_READ_BUDGET,
+    SYNC_MAX_DEFERRALS,
+    SYNC_MODE_PERIODS,
+    SYNC_MODE_READ_BUDGETS,
+    SYNC_MAX_BACKOFF,
+    SYNC_MAX_PERIOD,
+    SYNC_RATE_SMOOTHING,
+)
+
+
+class SyncTask(BaseModel):
+    # a part of the game context refreshed every period seconds, higher priorities run first.
+    # the updater may be a coroutine function, condition is checked before every run.
+    # fingerprint summarizes what the updater refreshed, a task whose fingerprint stays the same
+    # backs off, a task without one keeps its period. section is the game context field the
+    # updater rebuilds, it isn't reported as changed while the fingerprint stays the same
+    name: str
+    group: str
+    updater: Callable[[], Any]
+    period: float
+    priority: int = 0
+    condition: Callable[[], bool] | None = None
+    fingerprint: Callable[[], Hashable] | None = None
+    section: str | None = None
+
+    _last_run_at: float | None = PrivateAttr()
+    _deferrals: int = PrivateAttr()
+    _last_read_count: int = PrivateAttr()
+    _last_fingerprint: Hashable | None = PrivateAttr()
+    _backoff: int = PrivateAttr()
+    _change_rate: float = PrivateAttr()
+    _changed: bool = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._last_run_at = None
+        self._deferrals = 0
+        self._last_read_count = 0
+        self._last_fingerprint = None
+        self._backoff = 1
+        self._change_rate = 1.0
+        self._changed = True
+
+    @property
+    def last_run_at(self) -> float | None:
+        return self._last_run_at
+
+    @property
+    def last_read_count(self) -> int:
+        return self._last_read_count
+
+    @property
+    def backoff(self) -> int:
+        return self._backoff
+
+    @property
+    def changed(self) -> bool:
+        # whether the last run changed the fingerprint, always True without one
+        return self._changed
+
+    @property
+    def change_rate(self) -> float:
+        # smoothed share of the runs that changed something
+        return self._change_rate
+
+    def reset_backoff(self) -> None:
+        self._backoff = 1
+
+    def _track_changes(self, max_backoff: int) -> None:
+        if self.fingerprint is None:
+            self._changed = True
+            return
+
+        fingerprint = self.fingerprint()
+        changed = self._changed = fingerprint != self._last_fingerprint
+        self._last_fingerprint = fingerprint
+
+        self._change_rate += (float(changed) - self._change_rate) * SYNC_RATE_SMOOTHING
+        self._backoff = 1 if changed else min(self._backoff * 2, max_backoff)
+
+
+class SyncScheduler(BaseModel):
+    # runs the due tasks of a group by priority until the reads of the current update reach the
+    # budget of the engine mode. the first task of an update always runs and a task put off
+    # max_deferrals times runs whatever the budget, so the budget never starves a task.
+    # the pace of an update scales every period, without one the unchanged tasks back off
+    read_counter: Callable[[], int]
+    read_budget: int = SYNC_READ_BUDGET
+    max_deferrals: int = SYNC_MAX_DEFERRALS
+    max_backoff: int = SYNC_MAX_BACKOFF
+    max_period: float = SYNC_MAX_PERIOD
+    mode_periods: dict[str, dict[str, float | None]] = Field(default_factory=lambda: copy.deepcopy(SYNC_MODE_PERIODS))
+    mode_read_budgets: dict[str, int] = Field(default_factory=lambda: dict(SYNC_MODE_READ_BUDGETS))
+
+    _tasks: dict[str, SyncTask] = PrivateAttr()
+    _mode: str | None = PrivateAttr()
+    _pace: float | None = PrivateAttr()
+    _tick_read_count: int = PrivateAttr()
+    _tick_run_count: int = PrivateAttr()
+    _tick_tasks: list[SyncTask] = PrivateAttr()
+    _tick_unchanged_sections: set[str] = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._tasks = {}
+        self._mode = None
+        self._pace = None
+        self._tick_read_count = 0
+        self._tick_run_count = 0
+        self._tick_tasks = []
+        self._tick_unchanged_sections = set()
+
+    @property
+    def tasks(self) -> dict[str, SyncTask]:
+        return dict(self._tasks)
+
+    @property
+    def tick_read_count(self) -> int:
+        return self._tick_read_count
+
+    @property
+    def unchanged_sections(self) -> set[str]:
+        # sections rebuilt in the current update whose fingerprint stayed the same
+        return set(self._tick_unchanged_sections)
+
+    def register(self, task: SyncTask) -> None:
+        self._tasks[task.name] = task
+
+    def configure_mode(self,
+                       mode: str,
+                       periods: dict[str, float | None] = None,
+                       read_budget: int = None,
+                       ) -> None:
+        if periods is not None:
+            self.mode_periods.setdefault(mode, {}).update(periods)
+        if read_budget is not None:
+            self.mode_read_budgets[mode] = read_budget
+
+    def get_base_period(self, task: SyncTask) -> float | None:
+        periods = self.mode_periods.get(self._mode) or {}
+        if task.name in periods:
+            return periods[task.name]
+        return task.period
+
+    def get_period(self, task: SyncTask) -> float | None:
+        period = self.get_base_period(task)
+        if period is None:
+            return None
+        if self._pace is not None:
+            return period * self._pace
+        return min(period * task.backoff, max(period, self.max_period))
+
+    def begin_tick(self, mode: str, pace: float | None = None) -> None:
+        if mode != self._mode or pace is not None:
+            # what the tasks backed off from doesn't tell much about the new situation
+            for task in self._tasks.values():
+                task.reset_backoff()
+
+        self._mode = mode
+        self._pace = pace
+        self._tick_read_count = 0
+        self._tick_run_count = 0
+        self._tick_tasks = []
+        self._tick_unchanged_sections = set()
+
+    def next_delay(self) -> float | None:
+        # seconds until the first task of the groups run in this update is due again
+        now = time.monotonic()
+        delays = [
+            task.last_run_at + self.get_period(task) - now
+            for task in self._tick_tasks if task.last_run_at is not None
+        ]
+        return max(min(delays), 0.0) if delays else None
+
+    async def run(self, group: str) -> list[str]:
+        # names of the tasks that ran
+        now = time.monotonic()
+        budget = self.mode_read_budgets.get(self._mode, self.read_budget)
+
+        active = [
+            task for task in self._tasks.values()
+            if task.group == group
+            and self.get_period(task) is not None
+            and (task.condition is None or task.condition())
+        ]
+        self._tick_tasks.extend(active)
+
+        due = [
+            task for task in active
+            if task.last_run_at is None or now - task.last_run_at >= self.get_period(task)
+        ]
+        due.sort(key=lambda i: (-i.priority, i.last_run_at or 0.0))
+
+        results = []
+        for task in due:
+            if (self._tick_run_count
+                    and self._tick_read_count >= budget
+                    and task._deferrals < self.max_deferrals):
+                task._deferrals += 1
+                self._logger.debug(f'Sync task deferred: {task.name}, {self._tick_read_count} reads')
+                continue
+
+            read_count = self.read_counter()
+            try:
+                result = task.updater()
+                if inspect.isawaitable(result):
+                    await result
+                task._track_changes(max_backoff=self.max_backoff)
+                if task.section is not None:
+                    if task.changed:
+                        self._tick_unchanged_sections.discard(task.section)
+                    else:
+                        self._tick_unchanged_sections.add(task.section)
+            except Exception as e:
+                capture_error(e)
+            finally:
+                task._last_run_at = now
+                task._deferrals = 0
+                task._last_read_count = self.read_counter() - read_count
+                self._tick_read_count += task._last_read_count
+                self._tick_run_count += 1
+
+            results.append(task.name)
+
+        return results
@@ -1,9 +1,40 @@
-from typing import Callable
+import asyncio
+import contextlib
+import ctypes
+import functools
+import mmap
+import os
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
+
+from pydantic import PrivateAttr
 
 from src.bases.models import BaseModel
+from src.utils.memory import coalesce_spans, merge_writes, get_thread_buffer, read_status, INT_STRUCTS, U32, U64, F32
+from src.utils.regions import MemoryRegion, RegionMap
+from src.utils.scanners import BytePattern, BytePatternSet
+from src.utils.pe import parse_pe_headers, parse_exports
+from src.constants.os import (
+    READ_MANY_MAX_GAP,
+    READ_MANY_MAX_READ_SIZE,
+    MIN_USER_ADDRESS,
+    READ_OK,
+    READ_UNMAPPED,
+    MEMORY_REGIONS_MAX_AGE,
+    MAX_ADDRESS,
+    MEMORY_IO_MAX_WORKERS,
+)
 
 
 class OperatingSystemAPIPrototype(BaseModel):
+    _region_maps: dict[int, RegionMap] = PrivateAttr(default_factory=dict)
+    _listed_modules: dict[int, dict[str, int]] = PrivateAttr(default_factory=dict)
+    _write_batches: dict[int, list[tuple[int, bytes]]] = PrivateAttr(default_factory=dict)
+    _write_batch_depths: dict[int, int] = PrivateAttr(default_factory=dict)
+    _io_executors: dict[int, ThreadPoolExecutor] = PrivateAttr(default_factory=dict)
+    _module_exports: dict[tuple[int, int], dict[str, int]] = PrivateAttr(default_factory=dict)
 
     def toggle_window_visibility(self, pid: int, visible: bool = False, focus: bool = False) -> bool:
         raise NotImplementedError
@@ -16,7 +47,24 @@ class OperatingSystemAPIPrototype(BaseModel):
                   chunk_size: int = 1 * 1024 * 1024,
                   max_results: int = 1
                   ) -> list[int]:
-        raise NotImplementedError
+        # the file is mapped and searched in place, chunk_size is not needed
+        byte_pattern = BytePattern.from_hex(pattern)
+        if os.path.getsize(filepath) < byte_pattern.length:
+            return []
+
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return byte_pattern.find_all(data, max_results=max_results)
+
+    def scan_file_many(self, filepath: str,
+                       patterns: dict[str, str | list[str]],
+                       max_results: int = 1
+                       ) -> dict[str, list[int]]:
+        pattern_set = BytePatternSet.from_hex(patterns)
+        if os.path.getsize(filepath) < pattern_set.max_length:
+            return {key: [] for key in patterns}
+
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return pattern_set.find_all(data, max_results=max_results)
 
     def scan_memory(
             self,
@@ -26,9 +74,22 @@ class OperatingSystemAPIPrototype(BaseModel):
             end_address: int = None,
             max_results: int = 1,
             chunk_size: int = 1024 * 1024,  # 1MB chunks
+            max_workers: int = 1,
     ) -> list[int]:
         raise NotImplementedError
 
+    def scan_memory_many(
+            self,
+            h_process: int,
+            patterns: dict[str, str | list[str]],
+            start_address: int = None,
+            end_address: int = None,
+            max_results: int = 1,
+            chunk_size: int = 1024 * 1024,  # 1MB chunks
+            max_workers: int = 1,
+    ) -> dict[str, list[int]]:
+        raise NotImplementedError
+
     def set_process_termination_callback(self, h_process: int, callback: Callable, context: int = None) -> int:
         raise NotImplementedError
 
@@ -71,6 +132,44 @@ class OperatingSystemAPIPrototype(BaseModel):
     def read_memory(self, h_process: int, address: int, size: int, ) -> bytes:
         raise NotImplementedError
 
+    def read_into(self,
+                  h_process: int,
+                  address: int,
+                  buffer: bytearray | memoryview | ctypes.Array,
+                  offset: int = 0,
+                  size: int = None,
+                  ) -> int:
+        # read into buffer[offset:offset + size] and return the number of bytes read,
+        # backends override this to read in place
+        if size is None:
+            size = len(buffer) - offset
+        data = self.read_memory(h_process=h_process, address=address, size=size)
+        memoryview(buffer).cast('B')[offset:offset + len(data)] = data
+        return len(data)
+
+    def try_read_into(self,
+                      h_process: int,
+                      address: int,
+                      buffer: bytearray | memoryview | ctypes.Array,
+                      offset: int = 0,
+                      size: int = None,
+                      ) -> tuple[int, int]:
+        # read_into returning (status, bytes read) instead of raising, backends override this
+        # so failed reads in hot loops cost no exception
+        if size is None:
+            size = len(buffer) - offset
+        try:
+            read = self.read_into(h_process=h_process, address=address, buffer=buffer, offset=offset, size=size)
+        except OSError:
+            return READ_UNMAPPED, 0
+        return read_status(read, size), read
+
+    def try_read(self, h_process: int, address: int, size: int) -> tuple[int, bytes]:
+        # (status, the bytes that could be read)
+        buffer = get_thread_buffer(size, name='try_read')
+        status, read = self.try_read_into(h_process=h_process, address=address, buffer=buffer, size=size)
+        return status, ctypes.string_at(buffer, read)
+
     def write_memory(self, h_process: int, address: int, data: bytes) -> bool:
         raise NotImplementedError
 
@@ -100,6 +199,318 @@ class OperatingSystemAPIPrototype(BaseModel):
                       ) -> tuple[int, int | None]:
         raise NotImplementedError
 
+    def list_memory_regions(self,
+                            h_process: int,
+                            start_address: int = None,
+                            end_address: int = None,
+                            ) -> list[MemoryRegion]:
+        # committed regions overlapping [start_address, end_address) in address order
+        raise NotImplementedError
+
+    def get_region_map(self, h_process: int, max_age: float = MEMORY_REGIONS_MAX_AGE) -> RegionMap:
+        # the whole address space is queried again when the map is older than max_age,
+        # in between only the memory allocated or freed through this api is re-queried
+        region_map = self._region_maps.get(h_process)
+        if region_map is None or time.monotonic() - region_map.refreshed_at > max_age:
+            self.refresh_memory_regions(h_process=h_process)
+            region_map = self._region_maps[h_process]
+        return region_map
+
+    async def aget_region_map(self, h_process: int, max_age: float = MEMORY_REGIONS_MAX_AGE) -> RegionMap:
+        # get_region_map with the address space queried on the memory io thread of h_process.
+        # the map is only updated on the event loop, lookups never see it half replaced
+        region_map = self._region_maps.get(h_process)
+        if region_map is None or time.monotonic() - region_map.refreshed_at > max_age:
+            regions = await asyncio.get_running_loop().run_in_executor(
+                self._io_executor(h_process=h_process),
+                functools.partial(self._query_memory_regions, h_process=h_process)
+            )
+            self._apply_memory_regions(h_process=h_process, regions=regions)
+            region_map = self._region_maps[h_process]
+        return region_map
+
+    def cached_region_map(self, h_process: int) -> RegionMap | None:
+        # never queries, for the hot paths
+        return self._region_maps.get(h_process)
+
+    def refresh_memory_regions(self, h_process: int, start_address: int = None, end_address: int = None) -> None:
+        regions = self._query_memory_regions(
+            h_process=h_process,
+            start_address=start_address,
+            end_address=end_address
+        )
+        self._apply_memory_regions(
+            h_process=h_process,
+            regions=regions,
+            start_address=start_address,
+            end_address=end_address
+        )
+
+    def _query_memory_regions(self,
+                              h_process: int,
+                              start_address: int = None,
+                              end_address: int = None,
+                              ) -> list[MemoryRegion]:
+        try:
+            return self.list_memory_regions(
+                h_process=h_process,
+                start_address=start_address,
+                end_address=end_address
+            )
+        except OSError:
+            # the process is gone
+            return []
+
+    def _apply_memory_regions(self,
+                              h_process: int,
+                              regions: list[MemoryRegion],
+                              start_address: int = None,
+                              end_address: int = None,
+                              ) -> None:
+        region_map = self._region_maps.get(h_process)
+        if region_map is None:
+            region_map = self._region_maps[h_process] = RegionMap()
+
+        if start_address is None and end_address is None:
+            region_map.replace(regions)
+        else:
+            region_map.update_range(start_address, end_address, regions)
+
+    def _scan_ranges(self, h_process: int, start_address: int = None, end_address: int = None) -> list[tuple[int, int]]:
+        # readable ranges to scan, only the scanned range is queried again
+        if start_address is None and end_address is None:
+            self.refresh_memory_regions(h_process=h_process)
+        else:
+            self.refresh_memory_regions(
+                h_process=h_process,
+                start_address=start_address or 0,
+                end_address=MAX_ADDRESS if end_address is None else end_address
+            )
+        return self.cached_region_map(h_process=h_process).readable_ranges(start_address, end_address)
+
+    def _refresh_region_range(self, h_process: int, address: int, size: int = 0) -> None:
+        # called by the backends after allocating or freeing memory
+        region_map = self._region_maps.get(h_process)
+        if region_map is None:
+            return
+
+        if not size:
+            region = region_map.find(address)
+            size = region.end - address if region else 1
+        self.refresh_memory_regions(h_process=h_process, start_address=address, end_address=address + size)
+
+    def _track_modules(self, pid: int, modules: dict[str, int]) -> None:
+        # called by the backends when listing modules, a loaded or unloaded module
+        # makes every region map stale
+        if self._listed_modules.get(pid) == modules:
+            return
+        if pid in self._listed_modules:
+            for region_map in self._region_maps.values():
+                region_map.invalidate()
+        self._listed_modules[pid] = dict(modules)
+
+    def is_address_mapped(self,
+                          h_process: int,
+                          address: int,
+                          size: int = 1,
+                          max_age: float = MEMORY_REGIONS_MAX_AGE,
+                          ) -> bool:
+        return self.get_region_map(h_process=h_process, max_age=max_age).is_mapped(address, size)
+
+    def begin_tick(self) -> None:
+        # called by the game context synchronizer before every update
+        pass
+
+    @contextlib.contextmanager
+    def write_batch(self, h_process: int) -> Iterator[None]:
+        # writes to h_process are buffered until the outermost batch exits, then flushed as the
+        # fewest contiguous writes in address order. reads don't see the buffered writes.
+        # an exception discards what wasn't flushed yet
+        self._write_batches.setdefault(h_process, [])
+        self._write_batch_depths[h_process] = self._write_batch_depths.get(h_process, 0) + 1
+        try:
+            yield
+        except BaseException:
+            if self._write_batch_depths[h_process] == 1:
+                self._write_batches[h_process] = []
+            raise
+        finally:
+            self._write_batch_depths[h_process] -= 1
+            if not self._write_batch_depths[h_process]:
+                del self._write_batch_depths[h_process]
+                try:
+                    self.flush_writes(h_process=h_process)
+                finally:
+                    # a failed flush must not leave the process buffering
+                    self._write_batches.pop(h_process, None)
+
+    def flush_writes(self, h_process: int) -> int:
+        # write what the batch of h_process buffered so far, returns the number of writes issued
+        writes = self._write_batches.get(h_process)
+        if not writes:
+            return 0
+
+        merged = merge_writes(writes)
+
+        # the batch is set aside so write_memory writes through
+        del self._write_batches[h_process]
+        try:
+            for address, data in merged:
+                self.write_memory(h_process=h_process, address=address, data=data)
+        finally:
+            # only an open batch keeps buffering, the outermost exit flushes without one
+            if self._write_batch_depths.get(h_process):
+                self._write_batches[h_process] = []
+        return len(merged)
+
+    def _buffer_write(self, h_process: int, address: int, data: bytes) -> bool:
+        # called by write_memory first, True when a batch took the write
+        writes = self._write_batches.get(h_process)
+        if writes is None:
+            return False
+        writes.append((address, bytes(data)))
+        return True
+
+    def read_many(self,
+                  h_process: int,
+                  requests: list[tuple[int, int]],
+                  max_gap: int = READ_MANY_MAX_GAP,
+                  max_read_size: int = READ_MANY_MAX_READ_SIZE,
+                  ) -> list[memoryview | None]:
+        """Read (address, size) spans with the fewest reads, None marks a span that failed"""
+        results: list[memoryview | None] = [None] * len(requests)
+
+        # a region map, when one was built, keeps reads off known unreadable memory
+        boundaries = None
+        region_map = self.cached_region_map(h_process=h_process)
+        if region_map is not None:
+            boundaries = region_map.boundaries
+            requests_to_read = [
+                (0, 0) if region_map.is_unreadable(address) else (address, size)
+                for address, size in requests
+            ]
+        else:
+            requests_to_read = requests
+
+        groups = coalesce_spans(requests_to_read,
+                                max_gap=max_gap,
+                                max_read_size=max_read_size,
+                                min_address=MIN_USER_ADDRESS,
+                                boundaries=boundaries)
+        merged_data = self._read_spans(h_process=h_process, spans=[(start, size) for start, size, _ in groups])
+
+        for (start, size, indexes), data in zip(groups, merged_data):
+            if data is not None:
+                data = memoryview(data)
+
+            for index in indexes:
+                address, span_size = requests[index]
+                offset = address - start
+
+                if data is not None and offset + span_size <= len(data):
+                    results[index] = data[offset:offset + span_size]
+                    continue
+
+                # the merged read failed or was partial, retry the span on its own
+                if len(indexes) == 1:
+                    continue
+                status, span_data = self.try_read(h_process=h_process, address=address, size=span_size)
+                if status == READ_OK:
+                    results[index] = memoryview(span_data)
+
+        return results
+
+    async def aread_many(self,
+                         h_process: int,
+                         requests: list[tuple[int, int]],
+                         max_gap: int = READ_MANY_MAX_GAP,
+                         max_read_size: int = READ_MANY_MAX_READ_SIZE,
+                         ) -> list[memoryview | None]:
+        # read_many on the memory io thread of h_process, the event loop keeps running meanwhile
+        return await asyncio.get_running_loop().run_in_executor(
+            self._io_executor(h_process=h_process),
+            functools.partial(
+                self.read_many,
+                h_process=h_process,
+                requests=requests,
+                max_gap=max_gap,
+                max_read_size=max_read_size
+            )
+        )
+
+    def _io_executor(self, h_process: int) -> ThreadPoolExecutor:
+        executor = self._io_executors.get(h_process)
+        if executor is None:
+            executor = self._io_executors[h_process] = ThreadPoolExecutor(
+                max_workers=MEMORY_IO_MAX_WORKERS,
+                thread_name_prefix=f'memory-io-{h_process}'
+            )
+        return executor
+
+    def shutdown_io_executor(self, h_process: int) -> None:
+        executor = self._io_executors.pop(h_process, None)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _read_spans(self, h_process: int, spans: list[tuple[int, int]]) -> list[bytes | None]:
+        # one read per span, backends with vectored reads override this
+        results = []
+        for address, size in spans:
+            status, data = self.try_read(h_process=h_process, address=address, size=size)
+            results.append(data if status == READ_OK else None)
+        return results
+
+    def read_values(self,
+                    h_process: int,
+                    requests: list[tuple[int, int]],
+                    signed: bool = False,
+                    ) -> list[int | None]:
+        results = []
+        for data in self.read_many(h_process=h_process, requests=requests):
+            if data is None:
+                results.append(None)
+            else:
+                results.append(int.from_bytes(data, byteorder='little', signed=signed))
+        return results
+
+    def _read_struct(self, h_process: int, address: int, value_struct: struct.Struct) -> int | float:
+        buffer = get_thread_buffer(value_struct.size, name='values')
+        if self.read_into(h_process=h_process, address=address, buffer=buffer, size=value_struct.size) \
+                != value_struct.size:
+            raise OSError(f'Partial read at: {hex(address)}')
+        return value_struct.unpack_from(buffer)[0]
+
+    def read_u32(self, h_process: int, address: int) -> int:
+        return self._read_struct(h_process=h_process, address=address, value_struct=U32)
+
+    def read_u64(self, h_process: int, address: int) -> int:
+        return self._read_struct(h_process=h_process, address=address, value_struct=U64)
+
+    def read_f32(self, h_process: int, address: int) -> float:
+        return self._read_struct(h_process=h_process, address=address, value_struct=F32)
+
+    def read_int(self, h_process: int, address: int, size: int = 8, signed: bool = False) -> int:
+        value_struct = INT_STRUCTS.get((size, signed))
+        if value_struct is None:
+            return int.from_bytes(
+                self.read_memory(h_process=h_process, address=address, size=size),
+                byteorder='little',
+                signed=signed
+            )
+        return self._read_struct(h_process=h_process, address=address, value_struct=value_struct)
+
+    def try_read_int(self, h_process: int, address: int, size: int = 8, signed: bool = False) -> int | None:
+        # read_int returning None instead of raising
+        buffer = get_thread_buffer(size, name='values')
+        status, _ = self.try_read_into(h_process=h_process, address=address, buffer=buffer, size=size)
+        if status != READ_OK:
+            return None
+
+        value_struct = INT_STRUCTS.get((size, signed))
+        if value_struct is None:
+            return int.from_bytes(ctypes.string_at(buffer, size), byteorder='little', signed=signed)
+        return value_struct.unpack_from(buffer)[0]
+
     def get_value_from_pointer(self,
                                h_process: int,
                                pointer: int,
@@ -108,4 +519,255 @@ class OperatingSystemAPIPrototype(BaseModel):
                                value_signed: bool = False,
                                offsets: list[int] = None,
                                ) -> int | None:
-        raise NotImplementedError
+        if not value_size:
+            value_size = 8
+        if not addr_size:
+            addr_size = 8
+        if offsets:
+            result = self.try_read_int(h_process=h_process, address=pointer, size=addr_size)
+
+            for index, offset in enumerate(offsets):
+                if result is None:
+                    return None
+                if index + 1 == len(offsets):
+                    size = value_size
+                    signed = value_signed
+                else:
+                    size = addr_size
+                    signed = False
+                result = self.try_read_int(h_process=h_process, address=result + offset, size=size, signed=signed)
+            return result
+
+        return self.try_read_int(h_process=h_process, address=pointer, size=value_size, signed=value_signed)
+
+    def get_module_size(self, h_process: int, module_address: int) -> int:
+        # SizeOfImage of the mapped PE headers, the module spans [module_address, module_address + size)
+        return parse_pe_headers(self._image_reader(h_process=h_process, module_address=module_address)).size_of_image
+
+    def list_module_functions(self, pid: int, h_process: int, module_name: str) -> dict[str, int]:
+        # exported functions of a loaded module, parsed once per (module base, image timestamp)
+        module_addr = self.list_modules(pid=pid).get(module_name)
+        if not module_addr:
+            raise OSError(f'Module not found: {module_name}')
+
+        read = self._image_reader(h_process=h_process, module_address=module_addr)
+        headers = parse_pe_headers(read)
+
+        key = (module_addr, headers.timestamp)
+        exports = self._module_exports.get(key)
+        if exports is None:
+            exports = self._module_exports[key] = parse_exports(read, headers)
+
+        return {name: module_addr + rva for name, rva in exports.items()}
+
+    def _image_reader(self, h_process: int, module_address: int) -> Callable[[int, int], bytes]:
+        def read(rva: int, size: int) -> bytes:
+            return self.try_read(h_process=h_process, address=module_address + rva, size=size)[1]
+        return read
+
+
+class OperatingSystemAPIWrapper(OperatingSystemAPIPrototype):
+    # forwards everything to the wrapped api, subclasses override what they intercept
+    os_api: OperatingSystemAPIPrototype
+
+    def toggle_window_visibility(self, pid: int, visible: bool = False, focus: bool = False) -> bool:
+        return self.os_api.toggle_window_visibility(pid=pid, visible=visible, focus=focus)
+
+    def get_file_version(self, filepath: str) -> str:
+        return self.os_api.get_file_version(filepath=filepath)
+
+    def scan_file(self, filepath: str,
+                  pattern: list[str],
+                  chunk_size: int = 1 * 1024 * 1024,
+                  max_results: int = 1
+                  ) -> list[int]:
+        return self.os_api.scan_file(
+            filepath=filepath,
+            pattern=pattern,
+            chunk_size=chunk_size,
+            max_results=max_results
+        )
+
+    def scan_memory(
+            self,
+            h_process: int,
+            pattern: str,
+            start_address: int = None,
+            end_address: int = None,
+            max_results: int = 1,
+            chunk_size: int = 1024 * 1024,
+            max_workers: int = 1,
+    ) -> list[int]:
+        return self.os_api.scan_memory(
+            h_process=h_process,
+            pattern=pattern,
+            start_address=start_address,
+            end_address=end_address,
+            max_results=max_results,
+            chunk_size=chunk_size,
+            max_workers=max_workers
+        )
+
+    def scan_file_many(self, filepath: str,
+                       patterns: dict[str, str | list[str]],
+                       max_results: int = 1
+                       ) -> dict[str, list[int]]:
+        return self.os_api.scan_file_many(filepath=filepath, patterns=patterns, max_results=max_results)
+
+    def scan_memory_many(
+            self,
+            h_process: int,
+            patterns: dict[str, str | list[str]],
+            start_address: int = None,
+            end_address: int = None,
+            max_results: int = 1,
+            chunk_size: int = 1024 * 1024,
+            max_workers: int = 1,
+    ) -> dict[str, list[int]]:
+        return self.os_api.scan_memory_many(
+            h_process=h_process,
+            patterns=patterns,
+            start_address=start_address,
+            end_address=end_address,
+            max_results=max_results,
+            chunk_size=chunk_size,
+            max_workers=max_workers
+        )
+
+    def set_process_termination_callback(self, h_process: int, callback: Callable, context: int = None) -> int:
+        return self.os_api.set_process_termination_callback(h_process=h_process, callback=callback, context=context)
+
+    def close_h_process(self, h_process: int) -> bool:
+        return self.os_api.close_h_process(h_process=h_process)
+
+    def get_h_process(self, pid: int) -> int:
+        return self.os_api.get_h_process(pid=pid)
+
+    def get_pid(self, process_name: str) -> int:
+        return self.os_api.get_pid(process_name=process_name)
+
+    def suspend_thread(self, thread_id: int) -> bool:
+        return self.os_api.suspend_thread(thread_id=thread_id)
+
+    def suspend_all_threads(self, pid: int) -> None:
+        return self.os_api.suspend_all_threads(pid=pid)
+
+    def resume_thread(self, thread_id: int) -> bool:
+        return self.os_api.resume_thread(thread_id=thread_id)
+
+    def resume_all_threads(self, pid: int) -> bool:
+        return self.os_api.resume_all_threads(pid=pid)
+
+    def allocate_memory(self,
+                        h_process: int,
+                        size: int,
+                        address: int = None,
+                        protection: int = None
+                        ) -> int:
+        return self.os_api.allocate_memory(h_process=h_process, size=size, address=address, protection=protection)
+
+    def dealloc_memory(self,
+                       h_process: int,
+                       address: int,
+                       size: int = 0,
+                       free_type=None) -> bool:
+        return self.os_api.dealloc_memory(h_process=h_process, address=address, size=size, free_type=free_type)
+
+    def read_memory(self, h_process: int, address: int, size: int, ) -> bytes:
+        return self.os_api.read_memory(h_process=h_process, address=address, size=size)
+
+    def read_into(self,
+                  h_process: int,
+                  address: int,
+                  buffer: bytearray | memoryview | ctypes.Array,
+                  offset: int = 0,
+                  size: int = None,
+                  ) -> int:
+        return self.os_api.read_into(h_process=h_process, address=address, buffer=buffer, offset=offset, size=size)
+
+    def try_read_into(self,
+                      h_process: int,
+                      address: int,
+                      buffer: bytearray | memoryview | ctypes.Array,
+                      offset: int = 0,
+                      size: int = None,
+                      ) -> tuple[int, int]:
+        return self.os_api.try_read_into(
+            h_process=h_process,
+            address=address,
+            buffer=buffer,
+            offset=offset,
+            size=size
+        )
+
+    def list_memory_regions(self,
+                            h_process: int,
+                            start_address: int = None,
+                            end_address: int = None,
+                            ) -> list[MemoryRegion]:
+        return self.os_api.list_memory_regions(
+            h_process=h_process,
+            start_address=start_address,
+            end_address=end_address
+        )
+
+    def get_region_map(self, h_process: int, max_age: float = MEMORY_REGIONS_MAX_AGE) -> RegionMap:
+        return self.os_api.get_region_map(h_process=h_process, max_age=max_age)
+
+    async def aget_region_map(self, h_process: int, max_age: float = MEMORY_REGIONS_MAX_AGE) -> RegionMap:
+        return await self.os_api.aget_region_map(h_process=h_process, max_age=max_age)
+
+    def cached_region_map(self, h_process: int) -> RegionMap | None:
+        return self.os_api.cached_region_map(h_process=h_process)
+
+    def refresh_memory_regions(self, h_process: int, start_address: int = None, end_address: int = None) -> None:
+        return self.os_api.refresh_memory_regions(
+            h_process=h_process,
+            start_address=start_address,
+            end_address=end_address
+        )
+
+    def write_memory(self, h_process: int, address: int, data: bytes) -> bool:
+        if self._buffer_write(h_process=h_process, address=address, data=data):
+            return True
+
+        return self.os_api.write_memory(h_process=h_process, address=address, data=data)
+
+    def _read_spans(self, h_process: int, spans: list[tuple[int, int]]) -> list[bytes | None]:
+        return self.os_api._read_spans(h_process=h_process, spans=spans)
+
+    def begin_tick(self) -> None:
+        return self.os_api.begin_tick()
+
+    def _io_executor(self, h_process: int) -> ThreadPoolExecutor:
+        # one io thread per process whatever the number of wrappers
+        return self.os_api._io_executor(h_process=h_process)
+
+    def shutdown_io_executor(self, h_process: int) -> None:
+        return self.os_api.shutdown_io_executor(h_process=h_process)
+
+    def terminate_process(self, h_process: int) -> bool:
+        return self.os_api.terminate_process(h_process=h_process)
+
+    def list_processes(self) -> dict[int, str]:
+        return self.os_api.list_processes()
+
+    def list_modules(self, pid: int) -> dict[str, int]:
+        return self.os_api.list_modules(pid=pid)
+
+    def open_thread(self, thread_id: int) -> int:
+        return self.os_api.open_thread(thread_id=thread_id)
+
+    def list_threads(self, pid: int) -> dict:
+        return self.os_api.list_threads(pid=pid)
+
+    def get_thread_context(self, thread_id: int) -> any:
+        return self.os_api.get_thread_context(thread_id=thread_id)
+
+    def create_thread(self,
+                      address: int,
+                      h_process: int,
+                      params: int = None,
+                      wait: bool = False,
+                      ) -> tuple[int, int | None]:
+        return self.os_api.create_thread(address=address, h_process=h_process, params=params, wait=wait)
@@ -79,3 +79,68 @@ GAME_EVENT_LOST_TOWER_SURVIVAL: str = 'GameEventLostTowerSurvival'
 EVENT_PARTICIPATION_WAITING_STATUS: str = 'EventParticipationWaiting'
 EVENT_PARTICIPATION_STARTED_STATUS: str = 'EventParticipationStarted'
 EVENT_PARTICIPATION_ENDED_STATUS: str = 'EventParticipationEnded'
+
+# game context synchronization
+SYNC_INTERVAL: float = 0.05  # seconds between two updates of the game context
+SYNC_LOOP_LAG_WARNING: float = 0.1  # seconds an update may be resumed late before it's logged
+SYNC_READ_BUDGET: int = 4000  # reads an update may spend before the remaining due tasks wait for the next one
+SYNC_MAX_DEFERRALS: int = 5  # updates a due task may be put off for the read budget before it runs anyway
+
+# sync task groups, every group runs at its own stage of an update
+SYNC_GROUP_LOADED: str = 'SyncGroupLoaded'
+SYNC_GROUP_SCREEN: str = 'SyncGroupScreen'
+SYNC_GROUP_PLAYING: str = 'SyncGroupPlaying'
+
+# sync tasks
+SYNC_CHANNEL_LIST: str = 'SyncChannelList'
+SYNC_LOGIN_SCREEN: str = 'SyncLoginScreen'
+SYNC_LOBBY_SCREEN: str = 'SyncLobbyScreen'
+SYNC_CURRENT_DIALOG: str = 'SyncCurrentDialog'
+SYNC_LOCAL_PLAYER: str = 'SyncLocalPlayer'
+SYNC_VIEWPORT: str = 'SyncViewport'
+SYNC_NOTIFICATIONS: str = 'SyncNotifications'
+SYNC_CHAT_FRAME: str = 'SyncChatFrame'
+SYNC_PLAYER_INVENTORY: str = 'SyncPlayerInventory'
+SYNC_PARTY_MANAGER: str = 'SyncPartyManager'
+SYNC_MERCHANT: str = 'SyncMerchant'
+
+# per engine mode overrides of the task periods in seconds, None disables a task in that mode
+SYNC_MODE_PERIODS: dict[str, dict[str, float | None]] = {
+    ENGINE_IDLE_MODE: {
+        SYNC_VIEWPORT: 0.5,
+        SYNC_PARTY_MANAGER: 2.0,
+        SYNC_PLAYER_INVENTORY: 2.0,
+    },
+    ENGINE_TRAINING_MODE: {},
+    ENGINE_PARTICIPATING_EVENT_MODE: {
+        SYNC_VIEWPORT: 0.05,
+        SYNC_NOTIFICATIONS: 0.1,
+    },
+}
+# per engine mode overrides of SYNC_READ_BUDGET
+SYNC_MODE_READ_BUDGETS: dict[str, int] = {
+    ENGINE_IDLE_MODE: 1000,
+}
+
+# adaptive pacing of the game context updates
+SYNC_MIN_INTERVAL: float = 0.02  # seconds, shortest sleep between two updates
+SYNC_MAX_INTERVAL: float = 1.0  # seconds, longest sleep between two updates
+SYNC_WAITING_INTERVAL: float = 1.0  # seconds between updates while the game loads or is off the playing screen
+SYNC_MAX_BACKOFF: int = 16  # a task that keeps reading the same values runs up to this many times slower
+SYNC_MAX_PERIOD: float = 2.0  # seconds, backing off never makes a task slower than this
+SYNC_DANGER_PERIOD_FACTOR: float = 0.5  # periods are scaled by this when a protection threshold is near
+SYNC_PROTECTION_MARGIN: int = 15  # percents above the potion thresholds that count as near
+SYNC_RATE_SMOOTHING: float = 0.2  # weight of the latest sample in the change rates and the effective rate
+
+# game context sections that can be waited on, the fields of the game context plus the world
+CONTEXT_SECTION_SCREEN: str = 'screen'
+CONTEXT_SECTION_WORLD: str = 'world'
+CONTEXT_SECTION_LOCAL_PLAYER: str = 'local_player'
+CONTEXT_SECTION_VIEWPORT: str = 'viewport'
+CONTEXT_SECTION_INVENTORY: str = 'player_inventory'
+CONTEXT_SECTION_PARTY_MANAGER: str = 'party_manager'
+CONTEXT_SECTION_NOTIFICATIONS: str = 'notifications'
+CONTEXT_SECTION_CHANNEL_SWITCHING: str = 'is_channel_switching'
+CONTEXT_SECTION_CHANNELS: str = 'channels'
+CONTEXT_SECTION_LOGIN_SCREEN: str = 'login_screen'
+CONTEXT_SECTION_LOBBY_SCREEN: str = 'lobby_screen'
@@ -1,3 +1,5 @@
+import os
+
 # constants to get functions of the DLLs - PE format
 DOS_HEADER_SIZE = 0x40
 E_LFANEW_OFFSET = 0x3C
@@ -7,6 +9,8 @@ PE_SIGNATURE_SIZE = 4
 VALID_PE_SIGNATURE = 0x00004550
 OPTIONAL_HEADER_OFFSET = 0x18
 OPTIONAL_HEADER_SIZE = 2
+SIZE_OF_IMAGE_OFFSET = 0x38  # from the optional header, same for PE32 and PE32+
+SIZE_OF_IMAGE_SIZE = 4
 SYS32 = 0x10B
 SYS64 = 0x20B
 SYS32_DATA_DIR_OFFSET = 0x60
@@ -29,7 +33,59 @@ FUNC_NAME_SIZE = 256
 FUNC_ORDINAL_SIZE = 2
 FUNC_RVA_SIZE = 4
 FUNC_NAME_RAV_ARRAY_ITEM_SIZE = 4
+NUMBER_OF_SECTIONS_OFFSET = 0x6  # from the PE signature
+TIME_DATE_STAMP_OFFSET = 0x8
+SIZE_OF_OPTIONAL_HEADER_OFFSET = 0x14
+SECTION_HEADER_FORMAT = '<8sIIII16x'  # name, virtual size, virtual address, raw data size, raw data pointer
+SECTION_HEADER_SIZE = 40
 
 
 LITTLE_ENDIAN = 'little'
 BIG_ENDIAN = 'big'
+
+# batched reads
+MIN_USER_ADDRESS = 0x10000  # nothing is ever mapped below, reads there are null pointer hops
+MAX_ADDRESS = 0x7FFFFFFFFFFFFFFF
+READ_MANY_MAX_GAP = 0x40  # merge spans separated by up to this many bytes
+READ_MANY_MAX_READ_SIZE = 0x10000  # never merge spans into a read larger than this
+THREAD_BUFFER_MAX_SIZE = 0x10000  # reads up to this size reuse a per thread buffer
+
+# non raising reads
+READ_OK = 0
+READ_PARTIAL = 1  # only the first bytes could be read
+READ_UNMAPPED = 2  # nothing could be read
+
+# memory region maps
+MEMORY_REGIONS_MAX_AGE = 5.0  # seconds before the whole address space of a process is queried again
+
+# page cache
+PAGE_SIZE = 0x1000
+PAGE_CACHE_MAX_READ_SIZE = 0x10000  # bigger reads bypass the cache
+
+# pointer chain cache
+POINTER_CHAIN_CACHE_MAX_USES = 20  # re-walk a cached chain from its base after this many uses, bounds a stale hop
+
+# process snapshot files
+SNAPSHOT_MAGIC = b'MUSNAP01'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER_FORMAT = '<8sIII'  # magic, version, region count, module count
+SNAPSHOT_REGION_FORMAT = '<QQQI4x'  # base address, size, data file offset, protection
+SNAPSHOT_MODULE_FORMAT = '<QH'  # base address, name length, followed by the utf-8 name
+SNAPSHOT_DATA_ALIGNMENT = 0x1000
+
+# read traces
+TRACE_MAGIC = b'MUTRACE1'
+TRACE_VERSION = 1
+TRACE_HEADER_FORMAT = '<8sIIIII'  # magic, version, page size, page count, tick count, op count
+TRACE_PAGE_REF_FORMAT = '<QI'  # page address, page index
+TRACE_OP_FORMAT = '<IBQI'  # tick, op kind, address, size, writes are followed by their data
+TRACE_OP_READ = 0
+TRACE_OP_FAILED_READ = 1
+TRACE_OP_WRITE = 2
+
+# memory scans
+SCAN_SEGMENT_SIZE = 0x1000000  # regions are split into segments of this size for parallel scans
+SCAN_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# off event loop memory io
+MEMORY_IO_MAX_WORKERS = 1  # threads per process handle, reads of a process stay in order
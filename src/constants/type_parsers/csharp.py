@@ -7,6 +7,7 @@ LIST_FIRST_ITEM_OFFSET: int = 0X20
 GENERIC_LIST_ITEM_COUNT_OFFSET: int = 0X18
 GENERIC_LIST_ITEM_COUNT_LENGTH: int = 0X4
 GENERIC_LIST_ITEM_LIST_OFFSET: int = 0X10
+GENERIC_LIST_VERSION_OFFSET: int = 0X1C
 
 ## GENERIC DICT
 GENERIC_DICT_32BIT_HEADER_LENGTH: int = 0x8
@@ -14,6 +15,7 @@ GENERIC_DICT_64BIT_HEADER_LENGTH: int = 0x10
 GENERIC_DICT_BUCKET_ADDR_LENGTH: int = 0x8
 GENERIC_DICT_ENTRY_LIST_ADDR_LENGTH: int = 0x8
 GENERIC_DICT_COUNT_LENGTH: int = 0x4
+GENERIC_DICT_VERSION_LENGTH: int = 0x4  # follows the count
 # offsets from entry list
 GENERIC_DICT_ENTRY_LENGTH: int = 0x18  # every entry has 0x18-byte length
 GENERIC_DICT_ENTRY_LIST_FIRST_ITEM_OFFSET: int = 0x20  # first entry offset
@@ -21,8 +23,16 @@ GENERIC_DICT_ENTRY_HASH_CODE_LENGTH: int = 0x4
 GENERIC_DICT_ENTRY_NEXT_INDEX_LENGTH: int = 0x4
 GENERIC_DICT_ENTRY_VALUE_LENGTH: int = 0x8
 GENERIC_DICT_ENTRY_KEY_LENGTH: int = 0x8
+GENERIC_DICT_ENTRY_FORMAT: str = '<iiQQ'  # hash code, next index, key, value
+GENERIC_DICT_FREE_ENTRY_HASH_CODE: int = -1
+
+# items/entries address, count, version. List<T> and Dictionary<K, V> bump their version on every change
+GENERIC_COLLECTION_HEADER_FORMAT: str = '<QiI'
+GENERIC_COLLECTION_CACHE_MAX_SIZE: int = 256  # collections whose last decoded content is kept
 
 # STRING
 STRING_32BIT_HEADER_LENGTH = 0x8
 STRING_64BIT_HEADER_LENGTH = 0x10
 STRING_CHAR_COUNT_LENGTH = 0x4
+STRING_SPECULATIVE_CHAR_COUNT = 32  # characters read along with the header, shorter strings cost a single read
+STRING_CACHE_MAX_SIZE = 4096  # decoded strings kept by address
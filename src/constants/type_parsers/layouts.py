@@ -0,0 +1,10 @@
+# STRUCT LAYOUT
+STRUCT_LAYOUT_BYTE_ORDER: str = '<'
+STRUCT_LAYOUT_POINTER_FORMAT: str = 'Q'
+# unsigned formats for fields declared by length
+STRUCT_LAYOUT_LENGTH_FORMATS: dict[int, str] = {
+    0x1: 'B',
+    0x2: 'H',
+    0x4: 'I',
+    0x8: 'Q',
+}
@@ -7,7 +7,11 @@ from src.utils import assembly_to_bytes, bytes_to_assembly
 from src.bases.engines.data_models import SimulatedDataMemoryFunc, FuncCallback
 from src.utils.type_parsers.csharp import CSharpTypeParser
 from src.bases.errors import Error
-from src.constants.engine import GAME_CHAR_SELECTION_SCREEN, GAME_PLAYING_SCREEN, GAME_LOGIN_SCREEN
+from src.constants.engine import (
+    GAME_CHAR_SELECTION_SCREEN, GAME_PLAYING_SCREEN, GAME_LOGIN_SCREEN,
+    CONTEXT_SECTION_SCREEN, CONTEXT_SECTION_LOCAL_PLAYER, CONTEXT_SECTION_CHANNELS,
+    CONTEXT_SECTION_LOGIN_SCREEN, CONTEXT_SECTION_LOBBY_SCREEN,
+)
 
 from .game_context_synchronizers import UnityMegaMUEngineGameContextSynchronizer
 from .function_triggerers import UnityMegaMUEngineFunctionTriggerer
@@ -360,15 +364,18 @@ class UnityMegaMUEngine(Engine):
             )
 
     async def _handle_autologin(self):
-        while not self._game_context or not self._game_context.addr or not self._game_context.screen:
-            await asyncio.sleep(1)
+        await self.wait_until(
+            lambda: self._game_context and self._game_context.addr and self._game_context.screen
+        )
 
         login_screen_id = self.meta.screen_mappings[GAME_LOGIN_SCREEN]
 
-        while (not self._game_context.login_screen
-               or not self._game_context.screen.screen_id == login_screen_id
-               or not self._game_context.channels):
-            await asyncio.sleep(1)
+        await self.wait_until(
+            lambda: (self._game_context.login_screen
+                     and self._game_context.screen.screen_id == login_screen_id
+                     and self._game_context.channels),
+            sections=[CONTEXT_SECTION_LOGIN_SCREEN, CONTEXT_SECTION_SCREEN, CONTEXT_SECTION_CHANNELS]
+        )
 
         await self._function_triggerer.login_screen_submit_credential(
             username=self.autologin_settings.username,
@@ -377,8 +384,10 @@ class UnityMegaMUEngine(Engine):
 
         await asyncio.sleep(1)
 
-        while self._game_context.login_screen.login_locked:
-            await asyncio.sleep(1)
+        await self.wait_until(
+            lambda: not self._game_context.login_screen.login_locked,
+            sections=[CONTEXT_SECTION_LOGIN_SCREEN]
+        )
 
         server_response = self._game_context.login_screen.server_response
         if not server_response.get('Success'):
@@ -415,26 +424,33 @@ class UnityMegaMUEngine(Engine):
 
         print('target_channel', target_channel)
 
-        while target_channel.current_load >= 1:
+        if target_channel.current_load >= 1:
             print('target_channel.current_load', target_channel.current_load)
-            await asyncio.sleep(0.1)
-            target_channel = self._game_context.channels.get(target_channel.id)
+            channel_id = target_channel.id
+            await self.wait_until(
+                lambda: (self._game_context.channels.get(channel_id)
+                         and self._game_context.channels[channel_id].current_load < 1),
+                sections=[CONTEXT_SECTION_CHANNELS]
+            )
+            target_channel = self._game_context.channels[channel_id]
 
         await self._function_triggerer.login_screen_select_channel(target_channel.id)
         await asyncio.sleep(1)
 
         char_selection_screen_id = self.meta.screen_mappings[GAME_CHAR_SELECTION_SCREEN]
-        attempts = 0
         print('self._game_context.screen.screen_id', self._game_context.screen.screen_id)
-        while not self._game_context.screen.screen_id == char_selection_screen_id:
-            if attempts > 5:
-                self._logger.error(f'Failed to login: {self._game_context.screen}')
-                return None
-            await asyncio.sleep(1)
-            attempts += 1
+        if not await self.wait_until(
+                lambda: self._game_context.screen.screen_id == char_selection_screen_id,
+                sections=[CONTEXT_SECTION_SCREEN],
+                timeout=6
+        ):
+            self._logger.error(f'Failed to login: {self._game_context.screen}')
+            return None
 
-        while not self._game_context.lobby_screen:
-            await asyncio.sleep(1)
+        await self.wait_until(
+            lambda: self._game_context.lobby_screen,
+            sections=[CONTEXT_SECTION_LOBBY_SCREEN]
+        )
 
         print('character_slots', self._game_context.lobby_screen.character_slots)
 
@@ -452,17 +468,20 @@ class UnityMegaMUEngine(Engine):
         await self._function_triggerer.lobby_screen_select_character(character_slot)
         await asyncio.sleep(1)
 
-        attempts = 0
         game_player_screen_id = self.meta.screen_mappings[GAME_PLAYING_SCREEN]
-        while not self._game_context.screen.screen_id == game_player_screen_id:
-            if attempts > 5:
-                self._logger.error(f'Failed to login: {self._game_context.screen}')
-                return None
-            await asyncio.sleep(1)
+        if not await self.wait_until(
+                lambda: self._game_context.screen.screen_id == game_player_screen_id,
+                sections=[CONTEXT_SECTION_SCREEN],
+                timeout=6
+        ):
+            self._logger.error(f'Failed to login: {self._game_context.screen}')
+            return None
 
         if self.autologin_settings.start_training_after:
-            while not self._game_context.local_player:
-                await asyncio.sleep(1)
+            await self.wait_until(
+                lambda: self._game_context.local_player,
+                sections=[CONTEXT_SECTION_LOCAL_PLAYER]
+            )
             await self.start_training()
 
         self._logger.info('Autologin successfully')
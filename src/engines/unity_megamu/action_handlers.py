@@ -2,7 +2,13 @@ import asyncio
 
 from src.bases.errors import Error
 from src.bases.engines.data_models import Coord, WorldCell, WorldFastTravel, NPC
-from src.constants.engine import NPC_MERCHANT_TYPE
+from src.constants.engine import (
+    NPC_MERCHANT_TYPE,
+    CONTEXT_SECTION_SCREEN,
+    CONTEXT_SECTION_WORLD,
+    CONTEXT_SECTION_LOCAL_PLAYER,
+    CONTEXT_SECTION_CHANNEL_SWITCHING,
+)
 from src.utils import calculate_distance
 from src.bases.engines.action_handlers import ActionHandler
 
@@ -10,21 +16,27 @@ from src.bases.engines.action_handlers import ActionHandler
 class UnityMegaMUActionHandler(ActionHandler):
 
     async def change_world(self, world_id: int, fast_travel_code: str = None):
+        def is_in_world() -> bool:
+            return self.engine.game_context.screen.world_id == world_id
+
         await self.engine.function_triggerer.change_world(
             world_id,
             fast_travel_code=fast_travel_code
         )
-        await asyncio.sleep(3)
+        await self.engine.wait_until(is_in_world, sections=[CONTEXT_SECTION_WORLD], timeout=3)
 
-        while self.engine.game_context.screen.world_id != world_id:
+        while not is_in_world():
             await self.engine.function_triggerer.change_world(
                 world_id,
                 fast_travel_code=fast_travel_code
             )
-            await asyncio.sleep(3)
+            await self.engine.wait_until(is_in_world, sections=[CONTEXT_SECTION_WORLD], timeout=3)
 
-        while self.engine.game_context.screen.is_loading or self.engine.game_context.screen.is_world_loading:
-            await asyncio.sleep(1)
+        await self.engine.wait_until(
+            lambda: not (self.engine.game_context.screen.is_loading
+                         or self.engine.game_context.screen.is_world_loading),
+            sections=[CONTEXT_SECTION_SCREEN]
+        )
 
     async def go_to(self,
                     world_id: int,
@@ -34,11 +46,25 @@ class UnityMegaMUActionHandler(ActionHandler):
                     world_cells: dict[str: WorldCell] = None,
                     path_to_coord_from_fast_travel: list[Coord] = None,
                     ):
-        while self.engine.game_context.is_channel_switching:
-            await asyncio.sleep(1)
+        await self.engine.wait_until(
+            lambda: not self.engine.game_context.is_channel_switching,
+            sections=[CONTEXT_SECTION_CHANNEL_SWITCHING]
+        )
 
         player_levels = self.engine.game_context_synchronizer.get_player_levels()
 
+        def has_arrived() -> bool:
+            return calculate_distance(
+                (
+                    self.engine.game_context.local_player.current_coord.x,
+                    self.engine.game_context.local_player.current_coord.y
+                ),
+                (
+                    coord.x,
+                    coord.y
+                ),
+            ) <= distance_error
+
         already_change_world_with_fast_travel = False
         if self.engine.game_context.screen.world_id != world_id:
             if fast_travel and fast_travel.lvl_require <= player_levels:
@@ -46,16 +72,7 @@ class UnityMegaMUActionHandler(ActionHandler):
             else:
                 await self.change_world(world_id)
 
-        while calculate_distance(
-                (
-                        self.engine.game_context.local_player.current_coord.x,
-                        self.engine.game_context.local_player.current_coord.y
-                ),
-                (
-                        coord.x,
-                        coord.y
-                ),
-        ) > distance_error:
+        while not has_arrived():
 
             if world_cells:
                 path_to_coord_from_player = self.engine.world_map_handler.find_path(
@@ -101,7 +118,12 @@ class UnityMegaMUActionHandler(ActionHandler):
                 )
 
             await self.engine.function_triggerer.move_to_coord(coord)
-            await asyncio.sleep(0.1)
+            # the move is sent again if the player hasn't arrived in time
+            await self.engine.wait_until(
+                has_arrived,
+                sections=[CONTEXT_SECTION_LOCAL_PLAYER, CONTEXT_SECTION_WORLD],
+                timeout=0.1
+            )
 
         return None
 
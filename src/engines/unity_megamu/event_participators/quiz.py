@@ -6,6 +6,7 @@ import random
 from src.bases.engines.data_models import EngineOperatorQuiz
 from src.bases.engines.event_participators import QuizEventParticipator
 from src.constants.engine import EVENT_PARTICIPATION_STARTED_STATUS, EVENT_PARTICIPATION_ENDED_STATUS
+from src.constants.engine import CONTEXT_SECTION_NOTIFICATIONS
 from src.constants.engine import events as event_constants
 from src.utils import get_now, capture_error
 
@@ -35,12 +36,14 @@ class UnityMegaMUQuizEventParticipator(QuizEventParticipator):
         if self.participation.status == EVENT_PARTICIPATION_STARTED_STATUS:
             return
 
-        while self.participation.status != EVENT_PARTICIPATION_STARTED_STATUS:
+        def is_started() -> bool:
             for noti_title in self._get_notifications():
                 if noti_title in target_titles:
                     self.participation.status = EVENT_PARTICIPATION_STARTED_STATUS
-                    break
-            await asyncio.sleep(1)
+                    return True
+            return False
+
+        await self.engine.wait_until(is_started, sections=[CONTEXT_SECTION_NOTIFICATIONS])
 
         self._logger.info(f'{LOGGING_MSG_PREFIX} Event started')
 
@@ -58,30 +61,38 @@ class UnityMegaMUQuizEventParticipator(QuizEventParticipator):
 
         now = get_now()
 
-        while not quiz_title:
+        def find_quiz_title() -> bool:
+            nonlocal quiz_title
             if self._is_event_ended():
-                return None
-            notifications = self._get_notifications(now)
-            for noti in notifications:
+                return True
+            for noti in self._get_notifications(now):
                 if noti not in QUESTION_TITLES:
                     continue
 
                 quiz_title = noti
-                break
-
-            await asyncio.sleep(0.1)
+                return True
+            return False
 
-        while not quiz_content:
+        def find_quiz_content() -> bool:
+            nonlocal quiz_content
             if self._is_event_ended():
-                return None
+                return True
             notifications = self._get_notifications(now)
             for index, noti_title in enumerate(notifications):
                 if noti_title == quiz_title:
                     if index == 0:
                         break
                     quiz_content = notifications[index - 1]
-                    break
-            await asyncio.sleep(0.1)
+                    return True
+            return False
+
+        await self.engine.wait_until(find_quiz_title, sections=[CONTEXT_SECTION_NOTIFICATIONS])
+        if not quiz_title:
+            return None
+
+        await self.engine.wait_until(find_quiz_content, sections=[CONTEXT_SECTION_NOTIFICATIONS])
+        if not quiz_content:
+            return None
 
         if 'DISCOVER THE WORD' in quiz_title:
             if '_' in quiz_content:
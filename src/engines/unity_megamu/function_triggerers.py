@@ -48,8 +48,9 @@ def ensure_no_conflicts(func: Callable):
         ):
             await asyncio.sleep(0.01)
 
-        # trigger function
-        result = await func(self, *args, **kwargs)
+        # trigger function, its parameter writes are flushed together
+        with self.engine.os_api.write_batch(h_process=self.engine.h_process):
+            result = await func(self, *args, **kwargs)
 
         # wait until function completely triggered
         while self.engine.os_api.get_value_from_pointer(
@@ -58,6 +59,9 @@ def ensure_no_conflicts(func: Callable):
         ):
             await asyncio.sleep(0.01)
 
+        # the game has changed its memory, snapshot pages are stale
+        self.engine.game_context_synchronizer.invalidate_snapshot()
+
         return result
 
     return wrapper
@@ -702,8 +706,12 @@ class UnityMegaMUEngineFunctionTriggerer(EngineFunctionTriggerer):
         )
 
     def _register_function(self, address: int):
+        # the game may run the function as soon as the trigger is written,
+        # the parameters must be in memory before it
+        self.engine.os_api.flush_writes(h_process=self.engine.h_process)
         self.engine.os_api.write_memory(
             h_process=self.engine.h_process,
             address=self.engine.simulated_data_memory.game_func_params.ptr_target_func,
             data=address.to_bytes(8, 'little')
         )
+        self.engine.os_api.flush_writes(h_process=self.engine.h_process)
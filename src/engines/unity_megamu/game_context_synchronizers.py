@@ -5,6 +5,8 @@ import struct
 from json import JSONDecodeError
 from datetime import timedelta
 
+from pydantic import PrivateAttr
+
 from src.bases.engines.prototypes import EnginePrototype
 from src.bases.engines.game_context_synchronizers import EngineGameContextSynchronizer
 from src.bases.engines.data_models import (
@@ -14,10 +16,19 @@ from src.bases.engines.data_models import (
 )
 from src.utils import capture_error, get_now, get_local_timezone
 from src.bases.errors import Error
+from src.utils.type_parsers.csharp import CSharpTypeParser
+from src.utils.type_parsers.layouts import StructLayout, read_layouts
+from src.utils.type_parsers.graphs import ObjectSchema, ObjectGraphWalker, WalkedObject
 from src.constants.engine import (
     ITEM_LOCATION_INVENTORY,
     ITEM_LOCATION_GROUND,
-    ITEM_LOCATION_MERCHANT_STORAGE, OFFENSIVE_SKILL_TYPE, BUFF_SKILL_TYPE
+    ITEM_LOCATION_MERCHANT_STORAGE, OFFENSIVE_SKILL_TYPE, BUFF_SKILL_TYPE,
+    GAME_LOGIN_SCREEN, GAME_PLAYING_SCREEN,
+    SYNC_GROUP_LOADED, SYNC_GROUP_SCREEN, SYNC_GROUP_PLAYING,
+    SYNC_CHANNEL_LIST, SYNC_LOGIN_SCREEN, SYNC_LOBBY_SCREEN, SYNC_CURRENT_DIALOG, SYNC_LOCAL_PLAYER, SYNC_VIEWPORT,
+    SYNC_NOTIFICATIONS, SYNC_CHAT_FRAME, SYNC_PLAYER_INVENTORY, SYNC_PARTY_MANAGER, SYNC_MERCHANT,
+    SYNC_WAITING_INTERVAL,
+    CONTEXT_SECTION_LOCAL_PLAYER, CONTEXT_SECTION_VIEWPORT, CONTEXT_SECTION_INVENTORY, CONTEXT_SECTION_PARTY_MANAGER
 )
 from .data_models import (
     UnityMegaMUGameContext,
@@ -27,32 +38,213 @@ from .data_models import (
     UnityMegaMULocalPlayer,
     UnityMegaMUMerchant, UnityMegaMULoginScreen
 )
+from .layouts import (
+    LAYOUT_DECLARATIONS,
+    GAME_BODY_LAYOUT, BODY_MOVEMENT_LAYOUT, SKELETON_LAYOUT, MONSTER_INFO_LAYOUT, WORLD_CELL_LAYOUT,
+    COORD_LAYOUT, GAME_ITEM_LAYOUT, ITEM_INFO_LAYOUT, PARTY_MEMBER_LAYOUT,
+    STORAGE_LAYOUT, STORAGE_SLOT_LAYOUT, WINDOW_LAYOUT
+)
 
 
 class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
+    _layouts: dict[str, StructLayout] = PrivateAttr()
+    _cs_type_parser: CSharpTypeParser = PrivateAttr()
+    _object_walker: ObjectGraphWalker = PrivateAttr()
+    _coord_schema: ObjectSchema = PrivateAttr()
+    _body_state_schema: ObjectSchema = PrivateAttr()
+    _body_schema: ObjectSchema = PrivateAttr()
+    _item_schema: ObjectSchema = PrivateAttr()
+    _viewport_objects: dict[int, ViewportObject] = PrivateAttr(default_factory=dict)
+    _viewport_key: tuple[int, int | None] | None = PrivateAttr(default=None)
+    _local_player_addr: int = PrivateAttr(default=0)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        # reads through the synchronizer's api so they hit the page cache when enabled
+        self._cs_type_parser = CSharpTypeParser(
+            h_process=self.engine.h_process,
+            pid=self.engine.pid,
+            os_api=self.os_api,
+        )
+
+        # compiled once, the meta never changes while the engine is running
+        self._layouts = {
+            name: StructLayout.from_meta(name=name, meta=self.engine.meta, declaration=declaration)
+            for name, declaration in LAYOUT_DECLARATIONS.items()
+        }
+
+        # everything a body or an item points to, walked a depth at a time
+        self._object_walker = ObjectGraphWalker(cs_type_parser=self._cs_type_parser)
+        self._coord_schema = ObjectSchema(layout=self._layouts[COORD_LAYOUT])
+        # what changes during a body's lifetime, the rest is only read when it shows up
+        self._body_state_schema = ObjectSchema(
+            layout=self._layouts[GAME_BODY_LAYOUT],
+            children=dict(
+                current_coord_addr=self._coord_schema,
+                movement_addr=ObjectSchema(layout=self._layouts[BODY_MOVEMENT_LAYOUT]),
+                world_cell_addr=ObjectSchema(layout=self._layouts[WORLD_CELL_LAYOUT]),
+            )
+        )
+        self._body_schema = ObjectSchema(
+            layout=self._layouts[GAME_BODY_LAYOUT],
+            children=dict(
+                **self._body_state_schema.children,
+                skeleton_addr=ObjectSchema(
+                    layout=self._layouts[SKELETON_LAYOUT],
+                    children=dict(
+                        monster_info_addr=ObjectSchema(
+                            layout=self._layouts[MONSTER_INFO_LAYOUT],
+                            strings=['code_addr']
+                        ),
+                    )
+                ),
+            ),
+            strings=['name_addr', 'summon_owner_name_addr']
+        )
+        self._item_schema = ObjectSchema(
+            layout=self._layouts[GAME_ITEM_LAYOUT],
+            children=dict(
+                info_addr=ObjectSchema(
+                    layout=self._layouts[ITEM_INFO_LAYOUT],
+                    strings=['name_addr', 'code_addr']
+                ),
+            )
+        )
+
+        self._register_sync_tasks()
+
+    def _register_sync_tasks(self) -> None:
+        # periods are the training defaults, SYNC_MODE_PERIODS adjusts them for the other modes
+        screen_mappings = self.engine.meta.screen_mappings
+
+        def on_screen(screen_name: str):
+            return lambda: self.context.screen.screen_id == screen_mappings[screen_name]
+
+        def off_screen(screen_name: str):
+            return lambda: self.context.screen.screen_id != screen_mappings[screen_name]
+
+        self.register_sync_task(
+            name=SYNC_CHANNEL_LIST,
+            group=SYNC_GROUP_LOADED,
+            updater=self._update_channel_list,
+            period=0.5,
+            priority=10,
+            condition=on_screen(GAME_LOGIN_SCREEN)
+        )
+        self.register_sync_task(
+            name=SYNC_LOGIN_SCREEN,
+            group=SYNC_GROUP_LOADED,
+            updater=self._update_login_screen,
+            period=0.25,
+            priority=20,
+            condition=off_screen(GAME_PLAYING_SCREEN)
+        )
+        self.register_sync_task(
+            name=SYNC_LOBBY_SCREEN,
+            group=SYNC_GROUP_LOADED,
+            updater=self._update_lobby_screen,
+            period=0.5,
+            priority=10,
+            condition=off_screen(GAME_PLAYING_SCREEN)
+        )
+        self.register_sync_task(
+            name=SYNC_CURRENT_DIALOG,
+            group=SYNC_GROUP_SCREEN,
+            updater=self._update_current_dialog,
+            period=0.25,
+            priority=50
+        )
+        self.register_sync_task(
+            name=SYNC_LOCAL_PLAYER,
+            group=SYNC_GROUP_PLAYING,
+            updater=lambda: self._update_local_player(self._local_player_addr),
+            period=0.05,
+            priority=100,
+            fingerprint=self._local_player_fingerprint,
+            section=CONTEXT_SECTION_LOCAL_PLAYER
+        )
+        self.register_sync_task(
+            name=SYNC_VIEWPORT,
+            group=SYNC_GROUP_PLAYING,
+            updater=self._update_viewport,
+            period=0.1,
+            priority=90,
+            fingerprint=self._viewport_fingerprint,
+            section=CONTEXT_SECTION_VIEWPORT
+        )
+        self.register_sync_task(
+            name=SYNC_NOTIFICATIONS,
+            group=SYNC_GROUP_PLAYING,
+            updater=self._update_notifications,
+            period=0.25,
+            priority=40
+        )
+        self.register_sync_task(
+            name=SYNC_CHAT_FRAME,
+            group=SYNC_GROUP_PLAYING,
+            updater=self._update_chat_frame,
+            period=0.5,
+            priority=30
+        )
+        self.register_sync_task(
+            name=SYNC_PLAYER_INVENTORY,
+            group=SYNC_GROUP_PLAYING,
+            updater=self._update_player_inventory,
+            period=1.0,
+            priority=20,
+            fingerprint=self._player_inventory_fingerprint,
+            section=CONTEXT_SECTION_INVENTORY
+        )
+        self.register_sync_task(
+            name=SYNC_PARTY_MANAGER,
+            group=SYNC_GROUP_PLAYING,
+            updater=self._update_party_manager,
+            period=0.5,
+            priority=30,
+            condition=lambda: self.context.local_player is not None,
+            fingerprint=self._party_manager_fingerprint,
+            section=CONTEXT_SECTION_PARTY_MANAGER
+        )
+        self.register_sync_task(
+            name=SYNC_MERCHANT,
+            group=SYNC_GROUP_PLAYING,
+            updater=self._update_merchant,
+            period=0.5,
+            priority=30
+        )
+
+    @property
+    def cs_type_parser(self) -> CSharpTypeParser:
+        return self._cs_type_parser
+
+    def read_layout(self, name: str, address: int) -> dict[str, int | float] | None:
+        return self.read_layouts([(name, address)])[0]
+
+    def read_layouts(self, requests: list[tuple[str, int]]) -> list[dict[str, int | float] | None]:
+        return read_layouts(
+            os_api=self.os_api,
+            h_process=self.engine.h_process,
+            requests=[(self._layouts[name], address) for name, address in requests]
+        )
 
     def decrypt_obscured_int(self, address: int) -> int:
-        if not self.engine.os_api.get_value_from_pointer(
+        return self.decrypt_obscured_ints([address])[0]
+
+    def decrypt_obscured_ints(self, addresses: list[int]) -> list[int]:
+        results = []
+        # key (4 bytes), encrypted value (4 bytes), initialized flag (1 byte)
+        for data in self.os_api.read_many(
                 h_process=self.engine.h_process,
-                pointer=address + 0x8,
-                value_size=1
+                requests=[(address, 0x9) for address in addresses]
         ):
-            return 0
-
-        # current crypto key
-        key = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address,
-            value_size=4
-        )
-
-        # encrypted value
-        encrypted_value = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + 0x4,
-            value_size=4
-        )
-        return key ^ encrypted_value
+            if data is None or not data[0x8]:
+                results.append(0)
+                continue
+            key = int.from_bytes(data[:0x4], byteorder='little')
+            encrypted_value = int.from_bytes(data[0x4:0x8], byteorder='little')
+            results.append(key ^ encrypted_value)
+        return results
 
     @classmethod
     def init_context(cls, engine: EnginePrototype) -> UnityMegaMUGameContext:
@@ -66,89 +258,114 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
         return result
 
+    def _local_player_fingerprint(self) -> tuple | None:
+        player = self.context.local_player
+        if player is None:
+            return None
+        return (
+            player.current_hp, player.current_mp, player.current_sd, player.current_ag,
+            player.current_coord.x, player.current_coord.y, player.is_moving, player.is_destroying,
+            player.level, player.exp, player.in_safe_zone
+        )
+
+    def _viewport_fingerprint(self) -> tuple | None:
+        viewport = self.context.viewport
+        if viewport is None:
+            return None
+        return tuple(
+            (addr, viewport_object.object_coord.x, viewport_object.object_coord.y,
+             getattr(viewport_object.object, 'current_hp', None))
+            for addr, viewport_object in viewport.objects.items()
+        )
+
+    def _player_inventory_fingerprint(self) -> tuple | None:
+        inventory = self.context.player_inventory
+        if inventory is None:
+            return None
+        return inventory.zen, inventory.ruuh, tuple(
+            (addr, item.quantity, item.durability) for addr, item in inventory.items.items()
+        )
+
+    def _party_manager_fingerprint(self) -> tuple | None:
+        party_manager = self.context.party_manager
+        if party_manager is None:
+            return None
+        return party_manager.is_in_party, tuple(
+            (addr, member.hp_rate, member.mp_rate, member.coord.x, member.coord.y)
+            for addr, member in party_manager.members.items()
+        )
+
     async def update_context(self) -> None:
-        while not self.engine.game_context.addr:
+        while not self.context.addr:
             await self.engine.function_triggerer.get_game_context()
-            self.engine.game_context.addr = self.engine.os_api.get_value_from_pointer(
+            self.context.addr = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=self.engine.simulated_data_memory.game_func_params.ptr_game_context
             )
             await asyncio.sleep(2)
 
-        addr = self.engine.game_context.addr
+        addr = self.context.addr
 
-        is_loaded = self.engine.os_api.get_value_from_pointer(
+        is_loaded = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=addr + self.engine.meta.loaded_flag_offset,
             value_size=1
         ) == 1
 
-        self.engine.game_context.loaded = is_loaded
+        self.context.loaded = is_loaded
 
         if not is_loaded:
-            await asyncio.sleep(1)
+            self.delay_next_update(SYNC_WAITING_INTERVAL)
             return
 
-        self._update_channel_list()
+        await self.run_sync_tasks(SYNC_GROUP_LOADED)
 
-        self._update_login_screen()
-
-        self._update_lobby_screen()
-
-        is_channel_switching = self.engine.os_api.get_value_from_pointer(
+        is_channel_switching = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=addr + self.engine.meta.channel_switcher_offset,
             offsets=[self.engine.meta.channel_switching_flag_offset]
         ) == 1
 
-        self.engine.game_context.is_channel_switching = is_channel_switching
+        self.context.is_channel_switching = is_channel_switching
 
         if is_channel_switching:
-            await asyncio.sleep(1)
+            self.delay_next_update(SYNC_WAITING_INTERVAL)
             return
 
-        channel_id = self.engine.os_api.get_value_from_pointer(
+        channel_id = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=addr + self.engine.meta.channel_connection_offset,
             offsets=[self.engine.meta.channel_connection_channel_id_offset],
             value_size=0x4
         )
-        self.engine.game_context.channel_id = channel_id
+        self.context.channel_id = channel_id
 
         self._update_screen()
 
-        try:
-            self._update_current_dialog()
-        except Exception as e:
-            capture_error(e)
+        await self.run_sync_tasks(SYNC_GROUP_SCREEN)
 
-        if self.engine.game_context.screen.screen_id != 4:
-            await asyncio.sleep(1)
+        if self.context.screen.screen_id != 4:
+            self.delay_next_update(SYNC_WAITING_INTERVAL)
             return
 
-        if self.engine.game_context.screen.is_loading or self.engine.game_context.screen.is_world_loading:
-            await asyncio.sleep(1)
+        if self.context.screen.is_loading or self.context.screen.is_world_loading:
+            self.delay_next_update(SYNC_WAITING_INTERVAL)
             return
 
-        local_player_addr = self.engine.os_api.get_value_from_pointer(
+        local_player_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=addr + self.engine.meta.local_player_offset,
         )
         if local_player_addr:
-            player_body_object_class_addr = self.engine.os_api.get_value_from_pointer(
+            player_body_object_class_addr = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=local_player_addr,
                 offsets=[self.engine.meta.player_body_object_class_offset]
             )
-            self.engine.game_context.player_body_object_class_addr = player_body_object_class_addr
+            self.context.player_body_object_class_addr = player_body_object_class_addr
 
-            self._update_local_player(local_player_addr)
-            await self._update_viewport()
-            self._update_notifications()
-            self._update_chat_frame()
-            self._update_player_inventory()
-            self._update_party_manager()
-            self._update_merchant()
+            self._local_player_addr = local_player_addr
+            await self.run_sync_tasks(SYNC_GROUP_PLAYING)
 
     async def load_player_active_skills(self) -> dict[int, PlayerSkill]:
         if not self.engine.game_context.local_player:
@@ -156,7 +373,7 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
         await self.engine.function_triggerer.get_player_skills()
 
         return self._load_player_skills(
-            address=self.engine.os_api.get_value_from_pointer(
+            address=self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=self.engine.simulated_data_memory.game_func_params.ptr_player_active_skills
             )
@@ -164,14 +381,14 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
     def _update_party_manager(self) -> PartyManager | None:
 
-        address = self.engine.os_api.get_value_from_pointer(
+        address = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.local_player.addr + self.engine.meta.player_party_manager_offset
+            pointer=self.context.local_player.addr + self.engine.meta.player_party_manager_offset
         )
         if not address:
             return None
 
-        is_in_party = self.engine.os_api.get_value_from_pointer(
+        is_in_party = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=address + self.engine.meta.party_manager_in_party_flag_offset,
             value_size=0x1
@@ -179,7 +396,7 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
         is_leader = False
         if is_in_party:
-            is_leader = self.engine.os_api.get_value_from_pointer(
+            is_leader = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=address + self.engine.meta.party_manager_leader_flag_offset,
                 value_size=0x1
@@ -188,15 +405,16 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
         members = {}
 
         if is_in_party:
-            member_list_addr = self.engine.os_api.get_value_from_pointer(
+            member_list_addr = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=address + self.engine.meta.party_manager_member_list_offset,
             )
 
-            member_list = self.engine.cs_type_parser.parse_generic_list(member_list_addr)
+            member_list = self.cs_type_parser.parse_generic_list(member_list_addr, use_version=True)
+            member_fields = self.read_layouts([(PARTY_MEMBER_LAYOUT, i) for i in member_list.items])
 
-            for member_addr in member_list.items:
-                member = self._load_party_member(address=member_addr)
+            for member_addr, fields in zip(member_list.items, member_fields):
+                member = self._load_party_member(address=member_addr, fields=fields)
                 members[member.addr] = member
 
         result = PartyManager(
@@ -206,79 +424,36 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
             members=members,
         )
 
-        self.engine.game_context.party_manager = result
+        self.context.party_manager = result
 
         return result
 
-    def _load_party_member(self, address: int) -> PartyMember:
-        index = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.party_member_index_offset,
-            value_size=0x4
-        )
+    def _load_party_member(self, address: int, fields: dict[str, int | float] | None = None) -> PartyMember:
+        if fields is None:
+            fields = self.read_layout(PARTY_MEMBER_LAYOUT, address)
+        if fields is None:
+            raise OSError(f'Failed to read party member at: {hex(address)}')
 
-        is_leader = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.party_member_leader_flag_offset,
-            value_size=0x1
-        ) == 1
         player_name = ''
-        player_name_addr = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.party_member_name_offset,
-        )
-        if player_name_addr:
-            player_name = self.engine.cs_type_parser.parse_string(player_name_addr)
+        if fields['name_addr']:
+            player_name = self.cs_type_parser.parse_string(fields['name_addr'])
 
-        hp_rate = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.party_member_hp_rate_offset,
-            value_size=0x4
-        )
-        hp_rate = struct.unpack('f', struct.pack('I', hp_rate))[0]
+        coord = self._load_coord_from_addr(address=fields['coord_addr'])
 
-        mp_rate = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.party_member_mp_rate_offset,
-            value_size=0x4
-        )
-        mp_rate = struct.unpack('f', struct.pack('I', mp_rate))[0]
-
-        world_id = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.party_member_world_id_offset,
-            value_size=0x4
-        )
-
-        channel_id = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.party_member_channel_id_offset,
-            value_size=0x4
-        )
-
-        coord_addr = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.party_member_coord_offset,
-        )
-        coord = self._load_coord_from_addr(address=coord_addr)
-        viewport_index = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.party_member_viewport_index_offset,
-            value_size=0x4
-        )
+        viewport_index = fields['viewport_index']
         if viewport_index == ctypes.c_uint(-1).value:
             viewport_index = None
 
         return PartyMember(
             addr=address,
-            index=index,
-            is_leader=is_leader,
+            index=fields['index'],
+            is_leader=fields['is_leader'] == 1,
             coord=coord,
             viewport_index=viewport_index,
-            world_id=world_id,
-            channel_id=channel_id,
-            hp_rate=hp_rate,
-            mp_rate=mp_rate,
+            world_id=fields['world_id'],
+            channel_id=fields['channel_id'],
+            hp_rate=fields['hp_rate'],
+            mp_rate=fields['mp_rate'],
             player_name=player_name
         )
 
@@ -287,19 +462,19 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
         global_skills = self.engine.game_database.skills
 
-        skill_list = self.engine.cs_type_parser.parse_list(
+        skill_list = self.cs_type_parser.parse_list(
             address=address,
         )
         for skill_addr in skill_list.items:
-            skill_id = self.engine.os_api.get_value_from_pointer(
+            skill_id = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=skill_addr + self.engine.meta.skill_id_offset
             )
             if skill_id in global_skills:
                 skill = global_skills[skill_id]
             else:
-                skill_name = self.engine.cs_type_parser.parse_string(
-                    address=self.engine.os_api.get_value_from_pointer(
+                skill_name = self.cs_type_parser.parse_string(
+                    address=self.os_api.get_value_from_pointer(
                         h_process=self.engine.h_process,
                         pointer=skill_addr + self.engine.meta.skill_name_offset
                     )
@@ -310,8 +485,8 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                     name=skill_name,
                 )
             if not skill.desc:
-                skill_desc = self.engine.cs_type_parser.parse_string(
-                    address=self.engine.os_api.get_value_from_pointer(
+                skill_desc = self.cs_type_parser.parse_string(
+                    address=self.os_api.get_value_from_pointer(
                         h_process=self.engine.h_process,
                         pointer=skill_addr + self.engine.meta.skill_desc_pointer_offset,
                         offsets=[self.engine.meta.skill_desc_offset]
@@ -320,7 +495,7 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                 if skill_desc:
                     skill.desc = skill_desc
 
-            skill_elemental_id = self.engine.os_api.get_value_from_pointer(
+            skill_elemental_id = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=skill_addr + self.engine.meta.skill_elemental_id_offset,
                 value_size=self.engine.meta.skill_elemental_id_length
@@ -333,7 +508,7 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
             skill.elemental_id = skill_elemental_id
 
             if not skill.effect_id:
-                effect_id = self.engine.os_api.get_value_from_pointer(
+                effect_id = self.os_api.get_value_from_pointer(
                     h_process=self.engine.h_process,
                     pointer=skill_addr + self.engine.meta.skill_effect_id_offset,
                     value_size=0x4
@@ -346,7 +521,7 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
             skill_range = self.decrypt_obscured_int(
                 address=skill_addr + self.engine.meta.skill_range_offset
             )
-            cooldown = self.engine.os_api.get_value_from_pointer(
+            cooldown = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=skill_addr + self.engine.meta.skill_cooldown_offset,
                 value_size=0x4
@@ -364,25 +539,25 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
         return result
 
     def _update_merchant(self) -> UnityMegaMUMerchant | None:
-        addr = self.engine.os_api.get_value_from_pointer(
+        addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.game_ui_offset,
+            pointer=self.context.addr + self.engine.meta.game_ui_offset,
             offsets=[
                 self.engine.meta.merchant_offset
             ]
         )
         if not addr:
-            self.engine.game_context.merchant_window = None
+            self.context.merchant_window = None
             return None
 
         merchant_window = self._load_window(
-            address=self.engine.os_api.get_value_from_pointer(
+            address=self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=addr + self.engine.meta.merchant_window_offset
             )
         )
         merchant_storage = self._load_storage(
-            address=self.engine.os_api.get_value_from_pointer(
+            address=self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=addr + self.engine.meta.merchant_storage_offset
             )
@@ -394,22 +569,14 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
             storage=merchant_storage,
         )
 
-        self.engine.game_context.merchant = merchant
+        self.context.merchant = merchant
 
         return merchant
 
     def _load_window(self, address: int) -> Window:
-        is_open = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.window_open_flag_offset,
-            value_size=1
-        ) == 1
-
-        is_dialog = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.window_dialog_flag_offset,
-            value_size=1
-        ) == 1
+        fields = self.read_layout(WINDOW_LAYOUT, address) or {}
+        is_open = fields.get('is_open') == 1
+        is_dialog = fields.get('is_dialog') == 1
 
         return Window(
             addr=address,
@@ -418,48 +585,48 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
         )
 
     def load_merchant_storage_items(self) -> dict[int, GameItem]:
-        if not self.engine.game_context.merchant:
+        # loaded into a copy, the published context is never changed
+        merchant = self.engine.game_context.merchant
+        if not merchant:
             return dict()
 
-        if not self.engine.game_context.merchant.window.is_open:
+        if not merchant.window.is_open:
             return dict()
 
-        if not self.engine.game_context.merchant.storage:
+        if not merchant.storage:
             return dict()
 
-        self._load_storage_items(self.engine.game_context.merchant.storage)
-
-        return self.engine.game_context.merchant.storage.items
+        return self._load_storage_items(merchant.storage.model_copy())
 
     def _update_player_inventory(self) -> UnityMegaMUPlayerInventory | None:
-        inventory_window_addr = self.engine.os_api.get_value_from_pointer(
+        inventory_window_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.game_ui_offset,
+            pointer=self.context.addr + self.engine.meta.game_ui_offset,
             offsets=[
                 self.engine.meta.inventory_window_offset
             ]
         )
 
-        player_inventory_addr = self.engine.os_api.get_value_from_pointer(
+        player_inventory_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.local_player_offset,
+            pointer=self.context.addr + self.engine.meta.local_player_offset,
             offsets=[
                 self.engine.meta.player_inventory_offset
             ]
         )
 
         if not inventory_window_addr or not player_inventory_addr:
-            self.engine.game_context.player_inventory = None
+            self.context.player_inventory = None
             return None
 
         zen_addr = player_inventory_addr + self.engine.meta.player_inventory_zen_offset
-        zen = self.engine.os_api.get_value_from_pointer(
+        zen = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=zen_addr,
             value_size=4
         )
         ruuh_addr = player_inventory_addr + self.engine.meta.player_inventory_ruuh_offset
-        ruuh = self.engine.os_api.get_value_from_pointer(
+        ruuh = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=ruuh_addr,
             value_size=4
@@ -467,18 +634,20 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
         items: dict[int, GameItem] = {}
 
-        item_list_addr = self.engine.os_api.get_value_from_pointer(
+        item_list_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=player_inventory_addr + self.engine.meta.player_inventory_item_list_offset,
         )
-        item_list = self.engine.cs_type_parser.parse_list(address=item_list_addr, keep_none=True)
-        for slot_index, item_addr in enumerate(item_list.items):
+        item_list = self.cs_type_parser.parse_list(address=item_list_addr, keep_none=True)
+        walked_items = self._object_walker.walk([(self._item_schema, i) for i in item_list.items])
+        for slot_index, (item_addr, walked) in enumerate(zip(item_list.items, walked_items)):
             if not item_addr:
                 continue
             game_item = self._load_game_item(
                 location=ITEM_LOCATION_INVENTORY,
                 address=item_addr,
-                storage_slot_index=slot_index
+                storage_slot_index=slot_index,
+                walked=walked
             )
             items[item_addr] = game_item
 
@@ -489,63 +658,49 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
             ruuh=ruuh,
         )
 
-        self.engine.game_context.player_inventory = inventory
+        self.context.player_inventory = inventory
 
         return inventory
 
     def _load_storage(self, address: int) -> Storage:
-        enable = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.storage_enable_offset,
-            value_size=1
-        ) >= 1
-        row_count = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.storage_row_count_offset,
-            value_size=4
-        )
-        col_count = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.storage_col_count_offset,
-            value_size=4
-        )
+        fields = self.read_layout(STORAGE_LAYOUT, address)
+        if fields is None:
+            raise OSError(f'Failed to read storage at: {hex(address)}')
 
         return Storage(
             addr=address,
-            enable=enable,
-            row_count=row_count,
-            col_count=col_count
+            enable=fields['enable'] >= 1,
+            row_count=fields['row_count'],
+            col_count=fields['col_count']
         )
 
     def _load_storage_items(self, storage: Storage) -> dict[int, GameItem]:
 
         result = {}
 
-        slots_addr = self.engine.os_api.get_value_from_pointer(
+        slots_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=storage.addr + self.engine.meta.storage_slots_offset
         )
 
-        slots_dict = self.engine.cs_type_parser.parse_generic_dict(address=slots_addr)
-        for dict_entry in slots_dict.entries:
-            slot_addr = dict_entry.value
-            slot_index = self.engine.os_api.get_value_from_pointer(
-                h_process=self.engine.h_process,
-                pointer=slot_addr + self.engine.meta.storage_slot_index_offset,
-                value_size=self.engine.meta.storage_slot_index_length
-            )
-            item_addr = self.engine.os_api.get_value_from_pointer(
-                h_process=self.engine.h_process,
-                pointer=slot_addr + self.engine.meta.storage_slot_item_pointer_offset,
-            )
-            if not item_addr:
+        slots_dict = self.cs_type_parser.parse_generic_dict(address=slots_addr, use_version=True)
+        slot_addrs = [dict_entry.value for dict_entry in slots_dict.entries]
+        slots = self.read_layouts([(STORAGE_SLOT_LAYOUT, i) for i in slot_addrs])
+        walked_items = self._object_walker.walk([
+            (self._item_schema, slot['item_addr'] if slot else 0) for slot in slots
+        ])
+        for slot_addr, slot, walked in zip(slot_addrs, slots, walked_items):
+            if not slot or not slot['item_addr']:
                 continue
+            slot_index = slot['index']
+            item_addr = slot['item_addr']
 
             game_item = self._load_game_item(
                 location=ITEM_LOCATION_MERCHANT_STORAGE,
                 address=item_addr,
                 storage_slot_addr=slot_addr,
-                storage_slot_index=slot_index
+                storage_slot_index=slot_index,
+                walked=walked
             )
             result[item_addr] = game_item
 
@@ -554,69 +709,52 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
         return result
 
     def _update_local_player(self, address: int) -> UnityMegaMULocalPlayer:
-        reset_count = self.decrypt_obscured_int(
-            address=address + self.engine.meta.player_reset_count_offset
-        )
+        meta = self.engine.meta
+
+        reset_count, strength, agility, vitality, energy, command = self.decrypt_obscured_ints([
+            address + meta.player_reset_count_offset,
+            address + meta.player_strength_offset,
+            address + meta.player_agility_offset,
+            address + meta.player_vitality_offset,
+            address + meta.player_energy_offset,
+            address + meta.player_command_offset,
+        ])
 
         player_body = self._load_game_body(address=address, is_local_player=True)
 
-        exp_addr = address + self.engine.meta.player_exp_offset
-        exp = self.engine.os_api.get_value_from_pointer(
+        exp, free_stat_points, master_level, player_effect_addr = self.os_api.read_values(
             h_process=self.engine.h_process,
-            pointer=exp_addr,
-            value_size=8
+            requests=[
+                (address + meta.player_exp_offset, 8),
+                (address + meta.player_free_stat_point_offset, 0x4),
+                (address + meta.player_master_level_offset, 0x4),
+                (address + meta.player_effect_offset, 8),
+            ]
         )
+        master_level = master_level or 0
 
-        exp_rate = self.engine.os_api.get_value_from_pointer(
+        exp_rate = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.game_ui_offset,
+            pointer=self.context.addr + meta.game_ui_offset,
             offsets=[
-                self.engine.meta.player_frame_offset,
-                *self.engine.meta.player_exp_rate_offsets
+                meta.player_frame_offset,
+                *meta.player_exp_rate_offsets
             ],
             value_size=4
         )
         exp_rate = struct.unpack('f', struct.pack('I', exp_rate))[0]
 
-        strength = self.decrypt_obscured_int(
-            address=address + self.engine.meta.player_strength_offset
-        )
-        agility = self.decrypt_obscured_int(
-            address=address + self.engine.meta.player_agility_offset
-        )
-        vitality = self.decrypt_obscured_int(
-            address=address + self.engine.meta.player_vitality_offset
-        )
-        energy = self.decrypt_obscured_int(
-            address=address + self.engine.meta.player_energy_offset
-        )
-        command = self.decrypt_obscured_int(
-            address=address + self.engine.meta.player_command_offset
-        )
-        free_stat_points = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.player_free_stat_point_offset,
-            value_size=0x4
-        )
-
         effects = {}
         global_effects = self.engine.game_database.effects
 
-        effect_dict_addr = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.player_effect_offset,
-            offsets=[
-                self.engine.meta.player_effect_dict_offset
-            ]
-        )
-
-        master_level = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.player_master_level_offset,
-            value_size=0x4
-        ) or 0
+        effect_dict_addr = None
+        if player_effect_addr:
+            effect_dict_addr = self.os_api.get_value_from_pointer(
+                h_process=self.engine.h_process,
+                pointer=player_effect_addr + meta.player_effect_dict_offset,
+            )
 
-        effect_dict = self.engine.cs_type_parser.parse_generic_dict(address=effect_dict_addr)
+        effect_dict = self.cs_type_parser.parse_generic_dict(address=effect_dict_addr, use_version=True)
         for dict_entry in effect_dict.entries:
             effect_addr = dict_entry.value
             if not effect_addr:
@@ -630,8 +768,8 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
             if not effect.name:
                 try:
-                    effect.name = self.engine.cs_type_parser.parse_string(
-                        address=self.engine.os_api.get_value_from_pointer(
+                    effect.name = self.cs_type_parser.parse_string(
+                        address=self.os_api.get_value_from_pointer(
                             h_process=self.engine.h_process,
                             pointer=effect_addr + self.engine.meta.effect_data_offset,
                             offsets=[
@@ -644,8 +782,8 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                     raise e
             if not effect.desc:
                 try:
-                    effect.desc = self.engine.cs_type_parser.parse_string(
-                        address=self.engine.os_api.get_value_from_pointer(
+                    effect.desc = self.cs_type_parser.parse_string(
+                        address=self.os_api.get_value_from_pointer(
                             h_process=self.engine.h_process,
                             pointer=effect_addr + self.engine.meta.effect_data_offset,
                             offsets=[
@@ -680,23 +818,23 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
             free_stat_points=free_stat_points
         )
 
-        self.engine.game_context.local_player = local_player
+        self.context.local_player = local_player
 
         return local_player
 
     def _update_chat_frame(self) -> UnityMegaMUChatFrame | None:
-        addr = self.engine.os_api.get_value_from_pointer(
+        addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.game_ui_offset,
+            pointer=self.context.addr + self.engine.meta.game_ui_offset,
             offsets=[
                 self.engine.meta.chat_frame_offset
             ]
         )
         if not addr:
-            self.engine.game_context.chat_frame = None
+            self.context.chat_frame = None
             return None
 
-        char_limit = self.engine.os_api.get_value_from_pointer(
+        char_limit = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=addr + self.engine.meta.chat_frame_input_field_offset,
             offsets=[
@@ -704,21 +842,22 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
             ]
         )
 
-        self.engine.game_context.chat_frame = UnityMegaMUChatFrame(
+        self.context.chat_frame = UnityMegaMUChatFrame(
             addr=addr,
             char_limit=char_limit
         )
-        return self.engine.game_context.chat_frame
+        return self.context.chat_frame
 
     def _update_notifications(self):
+        notifications = []
         noti_list_addr = self.engine.simulated_data_memory.game_func_params.data_notification_list
-        for noti_title_addr in self.engine.cs_type_parser.parse_list(
+        for noti_title_addr in self.cs_type_parser.parse_list(
             address=noti_list_addr
         ).items:
             if not noti_title_addr:
                 continue
             try:
-                noti_title = self.engine.cs_type_parser.parse_string(noti_title_addr)
+                noti_title = self.cs_type_parser.parse_string(noti_title_addr)
             except Exception as e:
                 self._logger.error('Failed to load notification title at: ', hex(noti_title_addr))
                 capture_error(e)
@@ -732,33 +871,33 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                 title=noti_title.strip().upper(),
                 timestamp=get_now(),
             )
-            self.engine.game_context.notifications.insert(0, noti)
+            notifications.insert(0, noti)
             self._logger.info(noti.model_dump())
 
-        self.engine.cs_type_parser.write_list(
+        self.cs_type_parser.write_list(
             address=noti_list_addr,
             data=[]
         )
 
         # only cache for 50 notis
-        self.engine.game_context.notifications = self.engine.game_context.notifications[:50]
+        self.context.notifications = (notifications + self.context.notifications)[:50]
 
     def _update_current_dialog(self) -> Dialog | None:
-        dialog_addr = self.engine.os_api.get_value_from_pointer(
+        dialog_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=self.engine.simulated_data_memory.game_func_params.ptr_current_dialog
         )
         if not dialog_addr:
             return None
 
-        window_addr = self.engine.os_api.get_value_from_pointer(
+        window_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=dialog_addr + self.engine.meta.dialog_window_offset,
         )
 
-        focused_window_addr = self.engine.os_api.get_value_from_pointer(
+        focused_window_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.window_handler_offset,
+            pointer=self.context.addr + self.engine.meta.window_handler_offset,
             offsets=[
                 self.engine.meta.window_handler_focused_window_offset
             ]
@@ -771,27 +910,27 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
         )
 
         title = ''
-        title_addr = self.engine.os_api.get_value_from_pointer(
+        title_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=dialog_addr + self.engine.meta.dialog_title_offset,
             offsets=[self.engine.meta.text_value_offset]
         )
         if title_addr:
             try:
-                title = self.engine.cs_type_parser.parse_string(address=title_addr)
+                title = self.cs_type_parser.parse_string(address=title_addr)
             except Exception as e:
                 self._logger.error('Failed to load title at: ', hex(title_addr))
                 capture_error(e)
 
         message = ''
-        message_addr = self.engine.os_api.get_value_from_pointer(
+        message_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=dialog_addr + self.engine.meta.dialog_message_offset,
             offsets=[self.engine.meta.text_value_offset]
         )
         if message_addr:
             try:
-                message = self.engine.cs_type_parser.parse_string(address=message_addr)
+                message = self.cs_type_parser.parse_string(address=message_addr)
             except Exception as e:
                 self._logger.error('Failed to load message at: ', hex(message_addr))
                 capture_error(e)
@@ -803,28 +942,36 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
             window=window
         )
 
-        self.engine.game_context.current_dialog = result
+        self.context.current_dialog = result
 
         return result
 
     async def _update_viewport(self) -> UnityMegaMUViewport | None:
-        viewport_addr = self.engine.os_api.get_value_from_pointer(
+        viewport_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.viewport_offset,
+            pointer=self.context.addr + self.engine.meta.viewport_offset,
         )
         if not viewport_addr:
-            self.engine.game_context.viewport = None
+            self.context.viewport = None
             return None
 
-        object_list_addr = self.engine.os_api.get_value_from_pointer(
+        object_list_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=viewport_addr + self.engine.meta.viewport_object_list_offset
         )
 
-        object_list = self.engine.cs_type_parser.parse_generic_dict(
+        object_list = self.cs_type_parser.parse_generic_dict(
             address=object_list_addr,
         )
 
+        # objects are kept across ticks by viewport object addr, a known object only gets its
+        # state refreshed. the cache doesn't outlive the viewport or the world
+        viewport_key = (viewport_addr, self.context.screen.world_id)
+        if viewport_key != self._viewport_key:
+            self._viewport_objects = {}
+            self._viewport_key = viewport_key
+        cached_objects = self._viewport_objects
+
         objects = dict()
         object_count = object_list.count
         object_monsters = dict()
@@ -838,72 +985,127 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
         player_count = 0
         item_count = 0
         summon_count = 0
+        added_count = 0
+        updated_count = 0
+
+        # index, game object, class and item coord of every viewport object in one batch off the event loop
+        object_fields = await self.os_api.aread_many(
+            h_process=self.engine.h_process,
+            requests=[
+                span
+                for entry in object_list.entries
+                for span in (
+                    (entry.value + self.engine.meta.viewport_object_index_offset,
+                     self.engine.meta.viewport_object_index_length),
+                    (entry.value + self.engine.meta.viewport_game_object_offset, 0x8),
+                    (entry.value, 0x8),
+                    (entry.value + self.engine.meta.viewport_object_item_coord_offset, 0x8),
+                )
+            ]
+        )
+        object_fields = [
+            None if data is None else int.from_bytes(data, byteorder='little')
+            for data in object_fields
+        ]
 
-        for cs_dict_entry in object_list.entries:
-            if cs_dict_entry.hash_code == ctypes.c_uint(-1).value:
-                continue
+        entries = []
+        for entry_index, cs_dict_entry in enumerate(object_list.entries):
             viewport_object_addr = cs_dict_entry.value
-            object_index = self.engine.os_api.get_value_from_pointer(
-                h_process=self.engine.h_process,
-                pointer=viewport_object_addr + self.engine.meta.viewport_object_index_offset,
-                value_size=self.engine.meta.viewport_object_index_length
-            )
-            game_object_addr = self.engine.os_api.get_value_from_pointer(
-                h_process=self.engine.h_process,
-                pointer=viewport_object_addr + self.engine.meta.viewport_game_object_offset,
+            object_index, game_object_addr, viewport_object_class_addr, item_coord_addr = (
+                object_fields[entry_index * 4:entry_index * 4 + 4]
             )
 
-            viewport_body_object_class_addr = self.engine.game_context.viewport_body_object_class_addr
+            cached_object = cached_objects.get(viewport_object_addr)
+            if cached_object is not None and cached_object.object_addr == game_object_addr:
+                entries.append((
+                    viewport_object_addr, object_index, game_object_addr, item_coord_addr,
+                    isinstance(cached_object.object, GameItem), cached_object
+                ))
+                continue
+
+            viewport_body_object_class_addr = self.context.viewport_body_object_class_addr
             if viewport_body_object_class_addr is None:
                 await self.engine.function_triggerer.is_viewport_object_item(
                     address=viewport_object_addr
                 )
-                is_item = self.engine.os_api.get_value_from_pointer(
+                is_item = self.os_api.get_value_from_pointer(
                     h_process=self.engine.h_process,
                     pointer=self.engine.simulated_data_memory.game_func_params.ptr_viewport_object_is_item,
                     value_size=0x1
                 ) == 1
             else:
-                viewport_object_class_addr = self.engine.os_api.get_value_from_pointer(
-                    h_process=self.engine.h_process,
-                    pointer=viewport_object_addr
-                )
                 is_item = viewport_object_class_addr != viewport_body_object_class_addr
 
-            if is_item:
-                # Viewport.ObjectItem
-                try:
-                    object_coord = self._load_coord_from_addr(
-                        address=self.engine.os_api.get_value_from_pointer(
-                            h_process=self.engine.h_process,
-                            pointer=viewport_object_addr + self.engine.meta.viewport_object_item_coord_offset
+            if not is_item and self.context.viewport_body_object_class_addr is None:
+                self.context.viewport_body_object_class_addr = viewport_object_class_addr
+
+            entries.append((viewport_object_addr, object_index, game_object_addr, item_coord_addr, is_item, None))
+
+        # new bodies, new items, their coords and the state of the known bodies are walked together,
+        # a body's coord and an item's coord share the second slot. known items are kept as they are
+        walk_requests = []
+        for _, _, game_object_addr, item_coord_addr, is_item, cached_object in entries:
+            if cached_object is not None:
+                walk_requests.append((self._body_state_schema, 0 if is_item else game_object_addr))
+                walk_requests.append((self._coord_schema, 0))
+            else:
+                walk_requests.append((self._item_schema if is_item else self._body_schema, game_object_addr))
+                walk_requests.append((self._coord_schema, item_coord_addr if is_item else 0))
+        walked_objects = await self._object_walker.awalk(walk_requests)
+
+        for entry_index, (
+                viewport_object_addr, object_index, game_object_addr, item_coord_addr, is_item, cached_object
+        ) in enumerate(entries):
+            walked, walked_coord = walked_objects[entry_index * 2:entry_index * 2 + 2]
+
+            if cached_object is not None:
+                if is_item:
+                    game_object = cached_object.object
+                else:
+                    try:
+                        game_object = cached_object.object.model_copy(
+                            update=self._load_game_body_state(address=game_object_addr, walked=walked)
                         )
+                    except Exception as e:
+                        self._logger.error(f'Failed to refresh viewport body: {hex(viewport_object_addr)}')
+                        capture_error(e)
+                        continue
+                object_coord = game_object.coord if is_item else game_object.current_coord
+                updated_count += 1
+            elif is_item:
+                # Viewport.ObjectItem
+                if walked_coord is None:
+                    # skipped like a body that failed to load, the next update tries it again
+                    self._logger.error(
+                        f'Failed to load viewport item coord: {hex(viewport_object_addr)}, '
+                        f'coord at: {hex(item_coord_addr or 0)}'
                     )
-                except Exception as e:
-                    print('Failed to load viewport item coord', hex(viewport_object_addr))
-                    raise e
+                    continue
+                object_coord = GameCoord(
+                    x=walked_coord.fields['x'],
+                    y=walked_coord.fields['y'],
+                    addr=item_coord_addr
+                )
                 game_object = self._load_game_item(
                     address=game_object_addr,
                     coord=object_coord,
-                    location=ITEM_LOCATION_GROUND
+                    location=ITEM_LOCATION_GROUND,
+                    walked=walked
                 )
+                added_count += 1
             else:
                 # Viewport.ObjectBody
-                if self.engine.game_context.viewport_body_object_class_addr is None:
-                    self.engine.game_context.viewport_body_object_class_addr = self.engine.os_api.get_value_from_pointer(
-                        h_process=self.engine.h_process,
-                        pointer=viewport_object_addr
-                    )
-
                 try:
                     game_object = self._load_viewport_body(
                         address=game_object_addr,
+                        walked=walked
                     )
                 except Exception as e:
-                    print('Failed to load viewport body', hex(viewport_object_addr))
+                    self._logger.error(f'Failed to load viewport body: {hex(viewport_object_addr)}')
                     capture_error(e)
                     continue
                 object_coord = game_object.current_coord
+                added_count += 1
 
             viewport_object = ViewportObject(
                 index=object_index,
@@ -945,24 +1147,21 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
             monster_count=monster_count,
             item_count=item_count,
             summon_count=summon_count,
+            added_count=added_count,
+            updated_count=updated_count,
+            removed_count=sum(1 for i in cached_objects if i not in objects),
             object_list_addr=object_list_addr,
         )
-        self.engine.game_context.viewport = viewport
+        self.context.viewport = viewport
+        self._viewport_objects = objects
 
-        return self.engine.game_context.viewport
+        return self.context.viewport
 
     def _load_coord_from_addr(self, address: int) -> GameCoord:
-        x = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.coord_x_offset,
-            value_size=self.engine.meta.coord_x_length
-        )
-        y = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.coord_y_offset,
-            value_size=self.engine.meta.coord_y_length
-        )
-        return GameCoord(x=x, y=y, addr=address)
+        fields = self.read_layout(COORD_LAYOUT, address)
+        if fields is None:
+            raise OSError(f'Failed to read coord at: {hex(address)}')
+        return GameCoord(x=fields['x'], y=fields['y'], addr=address)
 
     def get_player_levels(self) -> int:
         player = self.engine.game_context.local_player
@@ -981,7 +1180,7 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                 or self.engine.game_context.screen.is_world_loading):
             return result
 
-        if not self.engine.os_api.get_value_from_pointer(
+        if not self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=self.engine.game_context.addr + self.engine.meta.game_ui_offset,
             offsets=[self.engine.meta.event_window_offset]
@@ -990,24 +1189,24 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
         await self.engine.function_triggerer.get_game_events()
 
-        list_addr = self.engine.os_api.get_value_from_pointer(
+        list_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=self.engine.simulated_data_memory.game_func_params.ptr_game_events
         )
 
         now = get_now(local=True)
 
-        for event_addr in self.engine.cs_type_parser.parse_generic_list(list_addr).items:
+        for event_addr in self.cs_type_parser.parse_generic_list(list_addr).items:
             if not event_addr:
                 continue
-            time = self.engine.cs_type_parser.parse_datetime(event_addr + self.engine.meta.event_time_offset)
+            time = self.cs_type_parser.parse_datetime(event_addr + self.engine.meta.event_time_offset)
             time = time.replace(tzinfo=get_local_timezone())
 
             if taking_place_in:
                 if not (now < time <= (now + timedelta(seconds=taking_place_in))):
                     continue
 
-            eid = self.engine.os_api.get_value_from_pointer(
+            eid = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=event_addr + self.engine.meta.event_data_offset,
                 offsets=[ self.engine.meta.event_id_offset],
@@ -1016,12 +1215,12 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
             code = self.engine.meta.event_mappings.get(eid, str(eid))
 
-            name_addr = self.engine.os_api.get_value_from_pointer(
+            name_addr = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=event_addr + self.engine.meta.event_data_offset,
                 offsets=[self.engine.meta.event_name_offset]
             )
-            name = self.engine.cs_type_parser.parse_string(name_addr)
+            name = self.cs_type_parser.parse_string(name_addr)
 
             result[code] = GameEvent(
                 time=time,
@@ -1034,18 +1233,18 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
     def _update_screen(self) -> GameScreen:
 
-        addr = self.engine.os_api.get_value_from_pointer(
+        addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.screen_offset,
+            pointer=self.context.addr + self.engine.meta.screen_offset,
         )
         if addr:
-            screen_id = self.engine.os_api.get_value_from_pointer(
+            screen_id = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=addr + self.engine.meta.screen_id_offset,
                 value_size=4
             )
             screen = self.engine.game_database.screens.get(screen_id)
-            world_id = self.engine.os_api.get_value_from_pointer(
+            world_id = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=addr + self.engine.meta.screen_world_id_offset,
                 value_size=0x4
@@ -1056,9 +1255,9 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                 if not world:
                     world = World(id=world_id)
                 if not world.default_coord:
-                    world_default_coord_addr = self.engine.os_api.get_value_from_pointer(
+                    world_default_coord_addr = self.os_api.get_value_from_pointer(
                         h_process=self.engine.h_process,
-                        pointer=self.engine.game_context.addr + self.engine.meta.world_manager_offset,
+                        pointer=self.context.addr + self.engine.meta.world_manager_offset,
                         offsets=[
                             self.engine.meta.game_world_data_offset,
                             self.engine.meta.game_world_default_coord_offset,
@@ -1068,237 +1267,140 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                         default_coord = self._load_coord_from_addr(world_default_coord_addr)
                         world.default_coord = Coord(x=default_coord.x, y=default_coord.y)
 
-            is_loading = self.engine.os_api.get_value_from_pointer(
+            is_loading = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=addr + self.engine.meta.screen_loading_flag_offset,
                 value_size=0x1
             ) == 1
 
-            is_world_loading = self.engine.os_api.get_value_from_pointer(
+            is_world_loading = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=addr + self.engine.meta.world_loading_flag_offset,
                 value_size=0x1
             ) == 1
 
-            game_screen = GameScreen(
-                addr=addr,
-                screen=screen,
-                screen_id=screen_id,
-                world_id=world_id,
-                world=world,
-                is_loading=is_loading,
-                is_world_loading=is_world_loading,
-            )
-
-            self.engine.game_context.screen = game_screen
+            # objects behind cached pointer chains are rebuilt on screen and world changes
+            previous_screen = self.context.screen
+            if (is_loading or is_world_loading
+                    or (previous_screen.addr, previous_screen.screen_id, previous_screen.world_id)
+                    != (addr, screen_id, world_id)):
+                self.invalidate_pointer_chains()
+
+            # rebuilt until the world's default coord could be read
+            if (not self._is_same_screen(previous_screen, addr, screen_id, world_id, is_loading, is_world_loading)
+                    or (world is not None and not (previous_screen.world and previous_screen.world.default_coord))):
+                self.context.screen = GameScreen(
+                    addr=addr,
+                    screen=screen,
+                    screen_id=screen_id,
+                    world_id=world_id,
+                    world=world,
+                    is_loading=is_loading,
+                    is_world_loading=is_world_loading,
+                )
         else:
-            screen_id = 0
-            screen = self.engine.game_database.screens.get(screen_id)
-            game_screen = GameScreen(
-                addr=0,
-                screen=screen,
-                screen_id=screen_id,
-                is_loading=True,
-                is_world_loading=True,
-            )
-            self.engine.game_context.screen = game_screen
-
-        return self.engine.game_context.screen
-
-    def _load_game_body(self, address: int,
-                        is_local_player: bool = False) -> NPCBody | SummonBody | PlayerBody | MonsterBody:
-        object_class_addr = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address,
-        )
-
-        index = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.game_body_index_offset,
-            value_size=0x4
-        )
+            self.invalidate_pointer_chains()
 
-        name_addr = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_name_offset,
-                size=8
-            ),
-            byteorder='little'
-        )
-        if name_addr:
-            name = self.engine.cs_type_parser.parse_string(
-                address=name_addr
-            )
-        else:
-            name = ''
+            screen_id = 0
+            if not self._is_same_screen(self.context.screen, 0, screen_id, None, True, True):
+                screen = self.engine.game_database.screens.get(screen_id)
+                self.context.screen = GameScreen(
+                    addr=0,
+                    screen=screen,
+                    screen_id=screen_id,
+                    is_loading=True,
+                    is_world_loading=True,
+                )
 
-        class_id = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_class_id_offset,
-                size=4
-            ),
-            byteorder='little'
-        )
-        level = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_level_offset,
-                size=4
-            ),
-            byteorder='little'
-        )
-        current_hp = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_current_hp_offset,
-                size=4
-            ),
-            byteorder='little'
-        )
-        max_hp = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_max_hp_offset,
-                size=4
-            ),
-            byteorder='little'
-        )
-        current_mp = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_current_mp_offset,
-                size=4
-            ),
-            byteorder='little'
-        )
-        max_mp = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_max_mp_offset,
-                size=4
-            ),
-            byteorder='little'
-        )
-        current_sd = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_current_sd_offset,
-                size=4
-            ),
-            byteorder='little'
-        )
-        max_sd = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_max_sd_offset,
-                size=4
-            ),
-            byteorder='little'
-        )
-        current_ag = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_current_ag_offset,
-                size=4
-            ),
-            byteorder='little'
-        )
-        max_ag = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_max_ag_offset,
-                size=4
-            ),
-            byteorder='little'
-        )
-        current_coord_addr = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_current_coord_offset,
-                size=8
-            ),
-            byteorder='little'
+        return self.context.screen
+
+    @staticmethod
+    def _is_same_screen(game_screen: GameScreen | None,
+                        addr: int,
+                        screen_id: int | None,
+                        world_id: int | None,
+                        is_loading: bool,
+                        is_world_loading: bool,
+                        ) -> bool:
+        # an unchanged screen is kept as it is, the published context then tells it didn't change
+        return game_screen is not None and (
+            game_screen.addr, game_screen.screen_id, game_screen.world_id,
+            game_screen.is_loading, game_screen.is_world_loading
+        ) == (addr, screen_id, world_id, is_loading, is_world_loading)
+
+    @staticmethod
+    def _walked_fields(walked: WalkedObject, field: str) -> dict[str, int | float] | None:
+        child = walked.children.get(field)
+        return child.fields if child else None
+
+    def _load_game_body_state(self, address: int, walked: WalkedObject | None) -> dict:
+        # the fields of a body that change while it's alive
+        if walked is None:
+            raise OSError(f'Failed to read game body at: {hex(address)}')
+
+        body = walked.fields
+        coord = self._walked_fields(walked, 'current_coord_addr')
+        movement = self._walked_fields(walked, 'movement_addr')
+        world_cell = self._walked_fields(walked, 'world_cell_addr')
+        if coord is None:
+            raise OSError(f'Failed to read game body coord at: {hex(address)}')
+
+        in_safe_zone = False
+        if world_cell:
+            in_safe_zone = self._world_cell_is_safezone(body['world_cell_addr'], world_cell['flags'])
+
+        return dict(
+            current_coord=GameCoord(x=coord['x'], y=coord['y'], addr=body['current_coord_addr']),
+            is_destroying=body['is_destroying'] == 1,
+            is_moving=bool(movement) and movement['moving_flag'] == 1,
+            level=body['level'],
+            current_hp=body['current_hp'],
+            max_hp=body['max_hp'],
+            current_mp=body['current_mp'],
+            max_mp=body['max_mp'],
+            current_sd=body['current_sd'],
+            max_sd=body['max_sd'],
+            current_ag=body['current_ag'],
+            max_ag=body['max_ag'],
+            in_safe_zone=in_safe_zone,
+            last_update=get_now(),
         )
-        current_coord = self._load_coord_from_addr(address=current_coord_addr)
 
-        is_destroying = int.from_bytes(
-            self.engine.os_api.read_memory(
-                h_process=self.engine.h_process,
-                address=address + self.engine.meta.game_body_is_destroying_offset,
-                size=1
-            ),
-            byteorder='little'
-        ) == 1
-        is_moving = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.game_body_movement_offset,
-            offsets=[self.engine.meta.game_body_moving_flag_offset]
-        ) == 1
+    def _load_game_body(self, address: int,
+                        is_local_player: bool = False,
+                        walked: WalkedObject | None = None) -> NPCBody | SummonBody | PlayerBody | MonsterBody:
+        if walked is None:
+            walked = self._object_walker.walk([(self._body_schema, address)])[0]
+        if walked is None:
+            raise OSError(f'Failed to read game body at: {hex(address)}')
 
-        world_cell_addr = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.game_body_world_cell_offset,
-        )
+        body = walked.fields
+        walked_skeleton = walked.children.get('skeleton_addr')
 
-        in_safe_zone = self._world_cell_is_safezone(world_cell_addr)
+        class_id = body['class_id']
+        level = body['level']
+        name = walked.strings['name_addr']
 
         body_data = dict(
             addr=address,
-            index=index,
-            current_coord=current_coord,
-            is_destroying=is_destroying,
-            is_moving=is_moving,
+            index=body['index'],
             name=name,
             class_id=class_id,
-            level=level,
-            current_hp=current_hp,
-            max_hp=max_hp,
-            current_mp=current_mp,
-            max_mp=max_mp,
-            current_sd=current_sd,
-            max_sd=max_sd,
-            current_ag=current_ag,
-            max_ag=max_ag,
-            in_safe_zone=in_safe_zone
-        )
-
-        body_skeleton_addr = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.game_body_skeleton_offset,
+            **self._load_game_body_state(address=address, walked=walked)
         )
+        current_coord = body_data['current_coord']
 
-        if object_class_addr == self.engine.game_context.player_body_object_class_addr or is_local_player:
+        if body['object_class_addr'] == self.context.player_body_object_class_addr or is_local_player:
             body_sub_class = PlayerBody
         else:
-            monster_id = self.engine.os_api.get_value_from_pointer(
-                h_process=self.engine.h_process,
-                pointer=body_skeleton_addr + self.engine.meta.skeleton_monster_id_offset,
-                value_size=0x4
-            )
-
-            monster_info_addr = self.engine.os_api.get_value_from_pointer(
-                h_process=self.engine.h_process,
-                pointer=body_skeleton_addr + self.engine.meta.skeleton_monster_info_offset,
-            )
-            monster_unknown2 = self.engine.os_api.get_value_from_pointer(
-                h_process=self.engine.h_process,
-                pointer=monster_info_addr + self.engine.meta.monster_unknown2_offset,
-                value_size=self.engine.meta.monster_unknown2_length
-            )
-            monster_code_addr = self.engine.os_api.get_value_from_pointer(
-                h_process=self.engine.h_process,
-                pointer=monster_info_addr + self.engine.meta.monster_code_offset,
-            )
-            monster_code = self.engine.cs_type_parser.parse_string(monster_code_addr)
+            skeleton = walked_skeleton.fields if walked_skeleton else {}
+            monster_id = skeleton.get('monster_id')
+            walked_monster_info = walked_skeleton.children.get('monster_info_addr') if walked_skeleton else None
+            monster_info = walked_monster_info.fields if walked_monster_info else {}
+            monster_unknown2 = monster_info.get('unknown2')
+            monster_code = walked_monster_info.strings['code_addr'] if walked_monster_info else ''
 
             if 'monster' in monster_code.lower() or not monster_unknown2:
-                summon_owner_name_addr = self.engine.os_api.get_value_from_pointer(
-                    h_process=self.engine.h_process,
-                    pointer=address + self.engine.meta.game_body_summon_owner_name_offset,
-                )
-
                 monsters = self.engine.game_database.monsters
 
                 if monster_id in monsters:
@@ -1314,17 +1416,17 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                 if not monster.level:
                     monster.level = level
 
-                if self.engine.game_context.screen.world_id not in monster.world_ids:
-                    monster.world_ids.append(self.engine.game_context.screen.world_id)
+                if self.context.screen.world_id not in monster.world_ids:
+                    monster.world_ids.append(self.context.screen.world_id)
 
                 monsters[monster_id] = monster
 
                 body_data['monster'] = monster
                 body_data['monster_id'] = monster_id
 
-                if summon_owner_name_addr:
+                if body['summon_owner_name_addr']:
                     body_sub_class = SummonBody
-                    body_data['owner_name'] = self.engine.cs_type_parser.parse_string(summon_owner_name_addr)
+                    body_data['owner_name'] = walked.strings['summon_owner_name_addr']
                 else:
                     body_sub_class = MonsterBody
             else:
@@ -1344,7 +1446,7 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                         name=npc_name,
                         code=npc_code,
                     )
-                world_id = self.engine.game_context.screen.world_id
+                world_id = self.context.screen.world_id
                 coords = npc.worlds.get(world_id) or []
                 npc_coord = Coord(
                     x=current_coord.x,
@@ -1367,30 +1469,37 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
         return body_sub_class(**body_data)
 
-    def _load_world_cells(self) -> dict[str, WorldCell]:
+    async def _load_world_cells(self) -> dict[str, WorldCell]:
 
-        cell_list_addr = self.engine.os_api.get_value_from_pointer(
+        cell_list_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.world_manager_offset,
+            pointer=self.context.addr + self.engine.meta.world_manager_offset,
             offsets=[
                 self.engine.meta.game_world_data_offset,
                 self.engine.meta.game_world_cell_list_offset,
             ]
         )
 
-        cell_list = self.engine.cs_type_parser.parse_list(cell_list_addr)
+        cell_list = self.cs_type_parser.parse_list(cell_list_addr)
 
         result = dict()
 
+        # the flags of the 65536 cells are read in batches off the event loop
+        flags_list = await self.os_api.aread_many(
+            h_process=self.engine.h_process,
+            requests=[
+                (cell_addr + self.engine.meta.world_cell_flags_offset, self.engine.meta.world_cell_flags_length)
+                for cell_addr in cell_list.items[:256 * 256]
+            ]
+        )
+
         for x in range(256):
             for y in range(256):
                 cell_index = x * 256 + y
                 cell_addr = cell_list.items[cell_index]
-                flags = self.engine.os_api.get_value_from_pointer(
-                    h_process=self.engine.h_process,
-                    pointer=cell_addr + self.engine.meta.world_cell_flags_offset,
-                    value_size=self.engine.meta.world_cell_flags_length
-                )
+                flags = flags_list[cell_index]
+                if flags is not None:
+                    flags = int.from_bytes(flags, byteorder='little')
                 cell = WorldCell(
                     is_safezone=self._world_cell_is_safezone(cell_addr, flags),
                     walkable=self._world_cell_walkable(cell_addr, flags),
@@ -1402,7 +1511,7 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
     def _world_cell_is_safezone(self, address: int, flags: int = None) -> bool:
         if flags is None:
-            flags = self.engine.os_api.get_value_from_pointer(
+            flags = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=address + self.engine.meta.world_cell_flags_offset,
                 value_size=self.engine.meta.world_cell_flags_length
@@ -1411,7 +1520,7 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
     def _world_cell_walkable(self, address: int, flags: int = None) -> bool:
         if flags is None:
-            flags = self.engine.os_api.get_value_from_pointer(
+            flags = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=address + self.engine.meta.world_cell_flags_offset,
                 value_size=self.engine.meta.world_cell_flags_length
@@ -1430,50 +1539,29 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
     def _load_viewport_body(self,
                             address: int,
+                            walked: WalkedObject | None = None,
                             ) -> MonsterBody | PlayerBody | NPCBody | SummonBody:
-        return self._load_game_body(address=address)
-
-    def _parse_item_info(self, address: int) -> Item:
-        item_id = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.item_id_offset,
-            value_size=0x4
-        )
-        item_name_addr = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.item_name_offset,
-        )
-        item_name = self.engine.cs_type_parser.parse_string(item_name_addr)
+        return self._load_game_body(address=address, walked=walked)
 
-        item_code_addr = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.item_code_offset,
-        )
-        item_code = self.engine.cs_type_parser.parse_string(item_code_addr)
+    def _parse_item_info(self, address: int, walked: WalkedObject | None = None) -> Item:
+        if walked is None:
+            walked = self._object_walker.walk([(self._item_schema.children['info_addr'], address)])[0]
+        if walked is None:
+            raise OSError(f'Failed to read item info at: {hex(address)}')
 
-        item_width = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.item_width_offset,
-            value_size=0x4
-        )
-
-        item_height = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.item_height_offset,
-            value_size=0x4
-        )
+        fields = walked.fields
         return Item(
-            id=item_id,
-            name=item_name,
-            code=item_code,
-            width=item_width,
-            height=item_height,
+            id=fields['id'],
+            name=walked.strings['name_addr'],
+            code=walked.strings['code_addr'],
+            width=fields['width'],
+            height=fields['height'],
         )
 
     async def _load_game_data_tables(self) -> int:
         await self.engine.function_triggerer.get_game_data_tables()
 
-        return self.engine.os_api.get_value_from_pointer(
+        return self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=self.engine.simulated_data_memory.game_func_params.ptr_game_data_tables,
         )
@@ -1484,6 +1572,7 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                         coord: GameCoord | None = None,
                         storage_slot_index: int | None = None,
                         storage_slot_addr: int | None = None,
+                        walked: WalkedObject | None = None,
                         ) -> GameItem:
 
         if location == ITEM_LOCATION_GROUND:
@@ -1492,10 +1581,13 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                     message=f'Missing coord for location: {location}'
                 )
 
-        item_info = self._parse_item_info(address=self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.game_item_info_offset,
-        ))
+        if walked is None:
+            walked = self._object_walker.walk([(self._item_schema, address)])[0]
+        if walked is None or not walked.fields['info_addr']:
+            raise OSError(f'Failed to read game item at: {hex(address)}')
+
+        fields = walked.fields
+        item_info = self._parse_item_info(address=fields['info_addr'], walked=walked.children['info_addr'])
         item_id = item_info.id
 
         global_context_items = self.engine.game_database.items
@@ -1517,30 +1609,12 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
 
         global_context_items[item_id] = item
 
-        improvement = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.game_item_improvement_offset,
-            value_size=self.engine.meta.game_item_improvement_length
-        )
-
-        quantity = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.game_item_quantity_offset,
-            value_size=self.engine.meta.game_item_quantity_length
-        )
-
-        durability = self.engine.os_api.get_value_from_pointer(
-            h_process=self.engine.h_process,
-            pointer=address + self.engine.meta.game_item_durability_offset,
-            value_size=self.engine.meta.game_item_durability_length
-        )
-
         return GameItem(
             item=item,
             item_id=item_id,
-            improvement=improvement,
-            quantity=quantity,
-            durability=durability,
+            improvement=fields['improvement'],
+            quantity=fields['quantity'],
+            durability=fields['durability'],
             addr=address,
             coord=coord,
             location=location,
@@ -1549,42 +1623,42 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
         )
 
     def _update_login_screen(self):
-        addr = self.engine.os_api.get_value_from_pointer(
+        addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.login_screen_offset,
+            pointer=self.context.addr + self.engine.meta.login_screen_offset,
         )
         if not addr:
             return
 
-        last_state = self.engine.os_api.get_value_from_pointer(
+        last_state = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=addr + self.engine.meta.login_screen_last_state_offset,
             value_size=0x4
         )
-        current_state = self.engine.os_api.get_value_from_pointer(
+        current_state = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=addr + self.engine.meta.login_screen_current_state_offset,
             value_size=0x4
         )
-        login_locked = self.engine.os_api.get_value_from_pointer(
+        login_locked = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=addr + self.engine.meta.login_screen_lock_flag_offset,
             value_size=0x1
         ) == 1
-        server_response_addr = self.engine.os_api.get_value_from_pointer(
+        server_response_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.login_screen_offset,
+            pointer=self.context.addr + self.engine.meta.login_screen_offset,
             offsets=self.engine.meta.login_screen_server_response_offsets
         )
         if server_response_addr:
             try:
-                server_response = json.loads(self.engine.cs_type_parser.parse_string(server_response_addr))
+                server_response = json.loads(self.cs_type_parser.parse_string(server_response_addr))
             except JSONDecodeError:
                 server_response = dict()
         else:
             server_response = dict()
 
-        self.engine.game_context.login_screen = UnityMegaMULoginScreen(
+        self.context.login_screen = UnityMegaMULoginScreen(
             addr=addr,
             server_response=server_response,
             login_locked=login_locked,
@@ -1593,62 +1667,62 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
         )
 
     def _update_lobby_screen(self):
-        addr = self.engine.os_api.get_value_from_pointer(
+        addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.lobby_screen_offset,
+            pointer=self.context.addr + self.engine.meta.lobby_screen_offset,
         )
         if not addr:
             return
 
         character_slots = dict()
 
-        character_slot_list_addr = self.engine.os_api.get_value_from_pointer(
+        character_slot_list_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
             pointer=addr + self.engine.meta.lobby_screen_character_slot_list_offset,
         )
-        for character_slot_addr in self.engine.cs_type_parser.parse_list(character_slot_list_addr).items:
-            character_info_addr = self.engine.os_api.get_value_from_pointer(
+        for character_slot_addr in self.cs_type_parser.parse_list(character_slot_list_addr).items:
+            character_info_addr = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=character_slot_addr + self.engine.meta.lobby_screen_character_slot_character_info_offset,
             )
             if not character_info_addr:
                 continue
-            character_slot = self.engine.os_api.get_value_from_pointer(
+            character_slot = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=character_info_addr + self.engine.meta.character_slot_offset,
                 value_size=0x4
             )
-            character_name_addr = self.engine.os_api.get_value_from_pointer(
+            character_name_addr = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=character_info_addr + self.engine.meta.character_name_offset,
             )
-            character_name = self.engine.cs_type_parser.parse_string(character_name_addr)
+            character_name = self.cs_type_parser.parse_string(character_name_addr)
             character_slots[character_name.lower().strip()] = character_slot
 
-        self.engine.game_context.lobby_screen = LobbyScreen(
+        self.context.lobby_screen = LobbyScreen(
             addr=addr,
             character_slots=character_slots
         )
 
     def _update_channel_list(self) -> dict[int, ServerChannel]:
         result = dict()
-        list_addr = self.engine.os_api.get_value_from_pointer(
+        list_addr = self.os_api.get_value_from_pointer(
             h_process=self.engine.h_process,
-            pointer=self.engine.game_context.addr + self.engine.meta.channel_list_offsets[0],
+            pointer=self.context.addr + self.engine.meta.channel_list_offsets[0],
             offsets=self.engine.meta.channel_list_offsets[1:]
         )
         if not list_addr:
             return result
 
-        channel_list = self.engine.cs_type_parser.parse_generic_list(list_addr)
+        channel_list = self.cs_type_parser.parse_generic_list(list_addr, use_version=True)
         for channel_addr in channel_list.items:
-            channel_current_load = self.engine.os_api.get_value_from_pointer(
+            channel_current_load = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=channel_addr + self.engine.meta.channel_current_load_offset,
                 value_size=0x4
             )
 
-            channel_id = self.engine.os_api.get_value_from_pointer(
+            channel_id = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=channel_addr + self.engine.meta.channel_info_offset,
                 offsets=[
@@ -1657,23 +1731,23 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                 value_size=0x4
             )
 
-            channel_code_addr = self.engine.os_api.get_value_from_pointer(
+            channel_code_addr = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=channel_addr + self.engine.meta.channel_info_offset,
                 offsets=[
                     self.engine.meta.channel_code_offset
                 ],
             )
-            channel_code = self.engine.cs_type_parser.parse_string(channel_code_addr)
+            channel_code = self.cs_type_parser.parse_string(channel_code_addr)
 
-            channel_name_addr = self.engine.os_api.get_value_from_pointer(
+            channel_name_addr = self.os_api.get_value_from_pointer(
                 h_process=self.engine.h_process,
                 pointer=channel_addr + self.engine.meta.channel_info_offset,
                 offsets=[
                     self.engine.meta.channel_code_offset
                 ],
             )
-            channel_name = self.engine.cs_type_parser.parse_string(channel_name_addr)
+            channel_name = self.cs_type_parser.parse_string(channel_name_addr)
 
             result[channel_id] = ServerChannel(
                 addr=channel_addr,
@@ -1683,6 +1757,6 @@ class UnityMegaMUEngineGameContextSynchronizer(EngineGameContextSynchronizer):
                 code=channel_code,
             )
 
-        self.engine.game_context.channels = result
+        self.context.channels = result
 
         return result
@@ -0,0 +1,94 @@
+# object layouts: field name -> (meta offset, struct format or meta length)
+
+GAME_BODY_LAYOUT = 'game_body'
+BODY_MOVEMENT_LAYOUT = 'body_movement'
+SKELETON_LAYOUT = 'skeleton'
+MONSTER_INFO_LAYOUT = 'monster_info'
+WORLD_CELL_LAYOUT = 'world_cell'
+COORD_LAYOUT = 'coord'
+GAME_ITEM_LAYOUT = 'game_item'
+ITEM_INFO_LAYOUT = 'item_info'
+PARTY_MEMBER_LAYOUT = 'party_member'
+STORAGE_LAYOUT = 'storage'
+STORAGE_SLOT_LAYOUT = 'storage_slot'
+WINDOW_LAYOUT = 'window'
+
+LAYOUT_DECLARATIONS: dict[str, dict[str, tuple[str | int, str]]] = {
+    GAME_BODY_LAYOUT: {
+        'object_class_addr': (0x0, 'Q'),
+        'index': ('game_body_index_offset', 'I'),
+        'name_addr': ('game_body_name_offset', 'Q'),
+        'class_id': ('game_body_class_id_offset', 'I'),
+        'level': ('game_body_level_offset', 'I'),
+        'current_hp': ('game_body_current_hp_offset', 'I'),
+        'max_hp': ('game_body_max_hp_offset', 'I'),
+        'current_mp': ('game_body_current_mp_offset', 'I'),
+        'max_mp': ('game_body_max_mp_offset', 'I'),
+        'current_sd': ('game_body_current_sd_offset', 'I'),
+        'max_sd': ('game_body_max_sd_offset', 'I'),
+        'current_ag': ('game_body_current_ag_offset', 'I'),
+        'max_ag': ('game_body_max_ag_offset', 'I'),
+        'current_coord_addr': ('game_body_current_coord_offset', 'Q'),
+        'is_destroying': ('game_body_is_destroying_offset', 'B'),
+        'movement_addr': ('game_body_movement_offset', 'Q'),
+        'world_cell_addr': ('game_body_world_cell_offset', 'Q'),
+        'skeleton_addr': ('game_body_skeleton_offset', 'Q'),
+        'summon_owner_name_addr': ('game_body_summon_owner_name_offset', 'Q'),
+    },
+    BODY_MOVEMENT_LAYOUT: {
+        'moving_flag': ('game_body_moving_flag_offset', 'Q'),
+    },
+    SKELETON_LAYOUT: {
+        'monster_id': ('skeleton_monster_id_offset', 'I'),
+        'monster_info_addr': ('skeleton_monster_info_offset', 'Q'),
+    },
+    MONSTER_INFO_LAYOUT: {
+        'unknown2': ('monster_unknown2_offset', 'monster_unknown2_length'),
+        'code_addr': ('monster_code_offset', 'Q'),
+    },
+    WORLD_CELL_LAYOUT: {
+        'flags': ('world_cell_flags_offset', 'world_cell_flags_length'),
+    },
+    COORD_LAYOUT: {
+        'x': ('coord_x_offset', 'coord_x_length'),
+        'y': ('coord_y_offset', 'coord_y_length'),
+    },
+    GAME_ITEM_LAYOUT: {
+        'info_addr': ('game_item_info_offset', 'Q'),
+        'improvement': ('game_item_improvement_offset', 'game_item_improvement_length'),
+        'quantity': ('game_item_quantity_offset', 'game_item_quantity_length'),
+        'durability': ('game_item_durability_offset', 'game_item_durability_length'),
+    },
+    ITEM_INFO_LAYOUT: {
+        'id': ('item_id_offset', 'I'),
+        'name_addr': ('item_name_offset', 'Q'),
+        'code_addr': ('item_code_offset', 'Q'),
+        'width': ('item_width_offset', 'I'),
+        'height': ('item_height_offset', 'I'),
+    },
+    PARTY_MEMBER_LAYOUT: {
+        'index': ('party_member_index_offset', 'I'),
+        'is_leader': ('party_member_leader_flag_offset', 'B'),
+        'name_addr': ('party_member_name_offset', 'Q'),
+        'hp_rate': ('party_member_hp_rate_offset', 'f'),
+        'mp_rate': ('party_member_mp_rate_offset', 'f'),
+        'world_id': ('party_member_world_id_offset', 'I'),
+        'channel_id': ('party_member_channel_id_offset', 'I'),
+        'coord_addr': ('party_member_coord_offset', 'Q'),
+        'viewport_index': ('party_member_viewport_index_offset', 'I'),
+    },
+    STORAGE_LAYOUT: {
+        'enable': ('storage_enable_offset', 'B'),
+        'row_count': ('storage_row_count_offset', 'I'),
+        'col_count': ('storage_col_count_offset', 'I'),
+        'slots_addr': ('storage_slots_offset', 'Q'),
+    },
+    STORAGE_SLOT_LAYOUT: {
+        'index': ('storage_slot_index_offset', 'storage_slot_index_length'),
+        'item_addr': ('storage_slot_item_pointer_offset', 'Q'),
+    },
+    WINDOW_LAYOUT: {
+        'is_open': ('window_open_flag_offset', 'B'),
+        'is_dialog': ('window_dialog_flag_offset', 'B'),
+    },
+}
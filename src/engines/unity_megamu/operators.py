@@ -20,6 +20,9 @@ from src.bases.engines.prototypes import EventParticipatorPrototype
 from src.constants import DATA_DIR
 from src.constants.engine import (
     ENGINE_TRAINING_MODE,
+    CONTEXT_SECTION_WORLD,
+    CONTEXT_SECTION_LOCAL_PLAYER,
+    CONTEXT_SECTION_CHANNEL_SWITCHING,
     SD_POTION_ITEM_TYPE,
     MP_POTION_ITEM_TYPE,
     HP_POTION_ITEM_TYPE,
@@ -1173,8 +1176,10 @@ class UnityMegaMUEngineOperator(EngineOperator):
     async def _ensure_within_training_area(self,
                                            training_spot: EngineOperatorTrainingSpot,
                                            ):
-        while self.engine.game_context.is_channel_switching:
-            await asyncio.sleep(1)
+        await self.engine.wait_until(
+            lambda: not self.engine.game_context.is_channel_switching,
+            sections=[CONTEXT_SECTION_CHANNEL_SWITCHING]
+        )
 
         fast_travel = training_spot.fast_travel
         path_to_ms_from_tf = training_spot.monster_spot.fast_travels[fast_travel.code]
@@ -1189,11 +1194,14 @@ class UnityMegaMUEngineOperator(EngineOperator):
                 await self.engine.action_handler.change_world(training_spot.world.id)
             await self._refresh_auto_accept_pt_settings()
 
-        while not self._within_area(
+        def is_within_area() -> bool:
+            return self._within_area(
                 world=training_spot.world,
                 coord=training_spot.monster_spot.coord,
                 radius=self.engine.settings.location.training_radius,
-        ):
+            )
+
+        while not is_within_area():
 
             if (fast_travel.lvl_require <= player_levels
                     and not already_change_world_with_fast_travel):
@@ -1217,7 +1225,12 @@ class UnityMegaMUEngineOperator(EngineOperator):
 
             await self.engine.function_triggerer.move_to_coord(training_spot.monster_spot.coord)
 
-            await asyncio.sleep(1)
+            # the move is sent again if the player isn't there in time
+            await self.engine.wait_until(
+                is_within_area,
+                sections=[CONTEXT_SECTION_LOCAL_PLAYER, CONTEXT_SECTION_WORLD],
+                timeout=1
+            )
 
         return None
 
@@ -0,0 +1,224 @@
+import bisect
+import ctypes
+
+from pydantic import PrivateAttr
+
+from src.bases.os import OperatingSystemAPIPrototype
+from src.utils.memory import read_status
+from src.utils.regions import MemoryRegion
+from src.constants.os import READ_UNMAPPED, MAX_ADDRESS
+
+
+class InMemoryProcessAPI(OperatingSystemAPIPrototype):
+    # fake address space of a single process, h_process is ignored
+    allocation_base: int = 0x7FF000000000
+    allocation_granularity: int = 0x10000
+
+    _region_bases: list[int] = PrivateAttr()
+    _regions: dict[int, bytearray | memoryview] = PrivateAttr()
+    _modules: dict[str, int] = PrivateAttr()
+    _next_allocation: int = PrivateAttr()
+    _read_count: int = PrivateAttr()
+    _write_count: int = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._region_bases = []
+        self._regions = {}
+        self._modules = {}
+        self._next_allocation = self.allocation_base
+        self._read_count = 0
+        self._write_count = 0
+
+    @property
+    def read_count(self) -> int:
+        return self._read_count
+
+    @property
+    def write_count(self) -> int:
+        return self._write_count
+
+    def reset_counters(self) -> None:
+        self._read_count = 0
+        self._write_count = 0
+
+    def map_region(self, address: int, data: bytes | bytearray | memoryview) -> int:
+        if not isinstance(data, (bytearray, memoryview)):
+            data = bytearray(data)
+
+        next_index = bisect.bisect_left(self._region_bases, address)
+        overlaps_next = (next_index < len(self._region_bases)
+                         and self._region_bases[next_index] < address + len(data))
+        if overlaps_next or self._find_region(address, 1):
+            raise OSError(f'Region overlaps an existing region at: {hex(address)}')
+
+        bisect.insort(self._region_bases, address)
+        self._regions[address] = data
+
+        self._refresh_region_maps(address, len(data))
+        return address
+
+    def unmap_region(self, address: int) -> bool:
+        if address not in self._regions:
+            return False
+        size = len(self._regions[address])
+        self._region_bases.remove(address)
+        del self._regions[address]
+
+        self._refresh_region_maps(address, size)
+        return True
+
+    def _refresh_region_maps(self, address: int, size: int) -> None:
+        # there is one address space whatever the h_process the maps were built for
+        for h_process in list(self._region_maps):
+            self._refresh_region_range(h_process, address, size)
+
+    def add_module(self, name: str, address: int) -> None:
+        self._modules[name] = address
+
+    def _find_region(self, address: int, size: int) -> tuple[int, bytearray | memoryview] | None:
+        index = bisect.bisect_right(self._region_bases, address) - 1
+        if index < 0:
+            return None
+
+        base = self._region_bases[index]
+        region = self._regions[base]
+        if address + size > base + len(region):
+            return None
+        return base, region
+
+    def get_h_process(self, pid: int) -> int:
+        return pid
+
+    def close_h_process(self, h_process: int) -> bool:
+        return True
+
+    def list_modules(self, pid: int) -> dict[str, int]:
+        return dict(self._modules)
+
+    def allocate_memory(self,
+                        h_process: int,
+                        size: int,
+                        address: int = None,
+                        protection: int = None
+                        ) -> int:
+        if address is None:
+            address = self._next_allocation
+            granularity = self.allocation_granularity
+            self._next_allocation += (size + granularity - 1) // granularity * granularity
+
+        return self.map_region(address, bytearray(size))
+
+    def dealloc_memory(self,
+                       h_process: int,
+                       address: int,
+                       size: int = 0,
+                       free_type=None) -> bool:
+        if not self.unmap_region(address):
+            raise OSError(f'No allocation at: {hex(address)}')
+        return True
+
+    def read_memory(self, h_process: int, address: int, size: int) -> bytes:
+        self._read_count += 1
+
+        found = self._find_region(address, size)
+        if not found:
+            raise OSError(f'Unmapped memory at: {hex(address)}')
+
+        base, region = found
+        offset = address - base
+        return bytes(region[offset:offset + size])
+
+    def read_into(self,
+                  h_process: int,
+                  address: int,
+                  buffer: bytearray | memoryview | ctypes.Array,
+                  offset: int = 0,
+                  size: int = None,
+                  ) -> int:
+        self._read_count += 1
+
+        if size is None:
+            size = len(buffer) - offset
+
+        found = self._find_region(address, size)
+        if not found:
+            raise OSError(f'Unmapped memory at: {hex(address)}')
+
+        base, region = found
+        region_offset = address - base
+        memoryview(buffer).cast('B')[offset:offset + size] = memoryview(region)[region_offset:region_offset + size]
+        return size
+
+    def try_read_into(self,
+                      h_process: int,
+                      address: int,
+                      buffer: bytearray | memoryview | ctypes.Array,
+                      offset: int = 0,
+                      size: int = None,
+                      ) -> tuple[int, int]:
+        self._read_count += 1
+
+        if size is None:
+            size = len(buffer) - offset
+
+        found = self._find_region(address, 1)
+        if not found:
+            return READ_UNMAPPED, 0
+
+        # a read running past the end of its region is partial
+        base, region = found
+        region_offset = address - base
+        read = min(size, len(region) - region_offset)
+        memoryview(buffer).cast('B')[offset:offset + read] = memoryview(region)[region_offset:region_offset + read]
+        return read_status(read, size), read
+
+    def list_memory_regions(self,
+                            h_process: int,
+                            start_address: int = None,
+                            end_address: int = None,
+                            ) -> list[MemoryRegion]:
+        if start_address is None:
+            start_address = 0x0
+        if end_address is None:
+            end_address = MAX_ADDRESS
+
+        results = []
+        for base in self._region_bases:
+            end = base + len(self._regions[base])
+            if end <= start_address or base >= end_address:
+                continue
+            results.append(MemoryRegion(base, end, 0, True))
+        return results
+
+    def _read_spans(self, h_process: int, spans: list[tuple[int, int]]) -> list[memoryview | None]:
+        # views into the regions, nothing is copied
+        results = []
+        for address, size in spans:
+            self._read_count += 1
+
+            found = self._find_region(address, size)
+            if not found:
+                results.append(None)
+                continue
+
+            base, region = found
+            offset = address - base
+            results.append(memoryview(region)[offset:offset + size])
+        return results
+
+    def write_memory(self, h_process: int, address: int, data: bytes) -> bool:
+        if self._buffer_write(h_process=h_process, address=address, data=data):
+            return True
+
+        self._write_count += 1
+
+        found = self._find_region(address, len(data))
+        if not found:
+            raise OSError(f'Unmapped memory at: {hex(address)}')
+
+        base, region = found
+        offset = address - base
+        region[offset:offset + len(data)] = data
+        return True
@@ -0,0 +1,255 @@
+import ctypes
+import errno
+import mmap
+import os
+import signal
+
+from src.bases.os import OperatingSystemAPIPrototype
+from src.utils.memory import get_thread_buffer, as_ctypes_buffer, read_status
+from src.utils.regions import MemoryRegion
+from src.utils.scanners import BytePattern, BytePatternSet, scan_regions, scan_regions_many
+from src.constants.os import MAX_ADDRESS
+from src.os.linux.libc import (
+    IOV_MAX,
+    IOVec,
+    process_vm_readv,
+    process_vm_writev,
+)
+
+
+class LinuxProcessAPI(OperatingSystemAPIPrototype):
+    # processes are addressed by pid, h_process is the pid itself.
+    # works for wine/proton clients since their memory is ordinary process memory
+
+    @staticmethod
+    def _raise_errno(message: str) -> None:
+        error = ctypes.get_errno()
+        raise OSError(error, f'{os.strerror(error)}: {message}')
+
+    @staticmethod
+    def _read_maps(pid: int) -> list[tuple[int, int, str, int, str]]:
+        # (start, end, permissions, file offset, path) of every mapping
+        results = []
+        with open(f'/proc/{pid}/maps', 'r') as rf:
+            for line in rf:
+                parts = line.split(maxsplit=5)
+                start, end = parts[0].split('-')
+                path = parts[5].strip() if len(parts) > 5 else ''
+                results.append((int(start, 16), int(end, 16), parts[1], int(parts[2], 16), path))
+        return results
+
+    def get_h_process(self, pid: int) -> int:
+        if not os.path.exists(f'/proc/{pid}'):
+            raise OSError(errno.ESRCH, f'No such process: {pid}')
+        return pid
+
+    def close_h_process(self, h_process: int) -> bool:
+        return True
+
+    def get_pid(self, process_name: str) -> int | None:
+        for pid, proc_name in self.list_processes().items():
+            if proc_name == process_name:
+                return pid
+        return None
+
+    def list_processes(self) -> dict[int, str]:
+        results = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/cmdline', 'rb') as rf:
+                    executable = rf.read().split(b'\x00')[0].decode(errors='replace')
+                if not executable:
+                    with open(f'/proc/{entry}/comm', 'r') as rf:
+                        executable = rf.read().strip()
+            except OSError:
+                continue
+            # wine keeps the windows path of the exe in argv[0]
+            results[int(entry)] = executable.replace('\\', '/').rsplit('/', 1)[-1]
+        return results
+
+    def list_modules(self, pid: int) -> dict[str, int]:
+        # a module is based at the mapping of its first file page
+        results = {}
+        for start, end, permissions, offset, path in self._read_maps(pid):
+            if offset or not path.startswith('/'):
+                continue
+            name = os.path.basename(path)
+            if name not in results or start < results[name]:
+                results[name] = start
+
+        self._track_modules(pid, results)
+        return results
+
+    def terminate_process(self, h_process: int) -> bool:
+        os.kill(h_process, signal.SIGKILL)
+        return True
+
+    def suspend_all_threads(self, pid: int) -> None:
+        os.kill(pid, signal.SIGSTOP)
+
+    def resume_all_threads(self, pid: int) -> bool:
+        os.kill(pid, signal.SIGCONT)
+        return True
+
+    def read_memory(self, h_process: int, address: int, size: int) -> bytes:
+        buffer = get_thread_buffer(size, name='read_memory')
+        if self.read_into(h_process=h_process, address=address, buffer=buffer, size=size) != size:
+            raise OSError(errno.EFAULT, f'Partial read at: {hex(address)}')
+        return ctypes.string_at(buffer, size)
+
+    def read_into(self,
+                  h_process: int,
+                  address: int,
+                  buffer: bytearray | memoryview | ctypes.Array,
+                  offset: int = 0,
+                  size: int = None,
+                  ) -> int:
+        if size is None:
+            size = len(buffer) - offset
+
+        local_iov = IOVec(ctypes.addressof(as_ctypes_buffer(buffer, offset, size)), size)
+        remote_iov = IOVec(address, size)
+
+        read = process_vm_readv(h_process, ctypes.byref(local_iov), 1, ctypes.byref(remote_iov), 1, 0)
+        if read < 0:
+            self._raise_errno(f'read at {hex(address)}')
+        return read
+
+    def try_read_into(self,
+                      h_process: int,
+                      address: int,
+                      buffer: bytearray | memoryview | ctypes.Array,
+                      offset: int = 0,
+                      size: int = None,
+                      ) -> tuple[int, int]:
+        if size is None:
+            size = len(buffer) - offset
+
+        local_iov = IOVec(ctypes.addressof(as_ctypes_buffer(buffer, offset, size)), size)
+        remote_iov = IOVec(address, size)
+
+        read = max(process_vm_readv(h_process, ctypes.byref(local_iov), 1, ctypes.byref(remote_iov), 1, 0), 0)
+        return read_status(read, size), read
+
+    def _read_spans(self, h_process: int, spans: list[tuple[int, int]]) -> list[bytes | None]:
+        # vectored reads, a whole batch of spans costs a single syscall
+        results: list[bytes | None] = [None] * len(spans)
+
+        index = 0
+        while index < len(spans):
+            batch = spans[index:index + IOV_MAX]
+            count = len(batch)
+
+            buffers = [ctypes.create_string_buffer(size) for _, size in batch]
+            local_iovs = (IOVec * count)(*[
+                IOVec(ctypes.cast(buffer, ctypes.c_void_p), size)
+                for buffer, (_, size) in zip(buffers, batch)
+            ])
+            remote_iovs = (IOVec * count)(*[IOVec(address, size) for address, size in batch])
+
+            read = process_vm_readv(h_process, local_iovs, count, remote_iovs, count, 0)
+            if read < 0 and ctypes.get_errno() == errno.ESRCH:
+                self._raise_errno(f'read from {h_process}')
+
+            # the transfer stops at the first span that can't be read completely
+            remaining = max(read, 0)
+            done = 0
+            for buffer, (_, size) in zip(buffers, batch):
+                if remaining < size:
+                    break
+                results[index + done] = buffer.raw
+                remaining -= size
+                done += 1
+
+            # skip the span that stopped the transfer, it stays None
+            index += done if done == count else done + 1
+
+        return results
+
+    def write_memory(self, h_process: int, address: int, data: bytes) -> bool:
+        if self._buffer_write(h_process=h_process, address=address, data=data):
+            return True
+
+        size = len(data)
+        buffer = ctypes.create_string_buffer(data, size)
+        local_iov = IOVec(ctypes.cast(buffer, ctypes.c_void_p), size)
+        remote_iov = IOVec(address, size)
+
+        written = process_vm_writev(h_process, ctypes.byref(local_iov), 1, ctypes.byref(remote_iov), 1, 0)
+        if written == size:
+            return True
+
+        # process_vm_writev honours page protection, /proc/<pid>/mem writes through read-only code pages
+        fd = os.open(f'/proc/{h_process}/mem', os.O_RDWR)
+        try:
+            written = os.pwrite(fd, data, address)
+        finally:
+            os.close(fd)
+
+        if written != size:
+            raise OSError(errno.EFAULT, f'Partial write at: {hex(address)}')
+        return True
+
+    def list_memory_regions(self,
+                            h_process: int,
+                            start_address: int = None,
+                            end_address: int = None,
+                            ) -> list[MemoryRegion]:
+        # every mapping is committed memory, the protection holds PROT_READ/PROT_WRITE/PROT_EXEC bits
+        if start_address is None:
+            start_address = 0x0
+        if end_address is None:
+            end_address = MAX_ADDRESS
+
+        results = []
+        for region_start, region_end, permissions, _, _ in self._read_maps(h_process):
+            if region_end <= start_address or region_start >= end_address:
+                continue
+            protection = (
+                    (mmap.PROT_READ if permissions[0] == 'r' else 0)
+                    | (mmap.PROT_WRITE if permissions[1] == 'w' else 0)
+                    | (mmap.PROT_EXEC if permissions[2] == 'x' else 0)
+            )
+            results.append(MemoryRegion(region_start, region_end, protection, permissions[0] == 'r'))
+        return results
+
+    def scan_memory(
+            self,
+            h_process: int,
+            pattern: list[str] | str,
+            start_address: int = None,
+            end_address: int = None,
+            max_results: int = 1,
+            chunk_size: int = 1 * 1024 * 1024,  # 1MB chunks
+            max_workers: int = 1,
+    ) -> list[int]:
+        return scan_regions(
+            read=lambda address, size: self.read_memory(h_process, address, size),
+            pattern=BytePattern.from_hex(pattern),
+            regions=self._scan_ranges(h_process, start_address, end_address),
+            max_results=max_results,
+            chunk_size=chunk_size,
+            max_workers=max_workers
+        )
+
+    def scan_memory_many(
+            self,
+            h_process: int,
+            patterns: dict[str, str | list[str]],
+            start_address: int = None,
+            end_address: int = None,
+            max_results: int = 1,
+            chunk_size: int = 1 * 1024 * 1024,  # 1MB chunks
+            max_workers: int = 1,
+    ) -> dict[str, list[int]]:
+        # every region is read once whatever the number of patterns
+        return scan_regions_many(
+            read=lambda address, size: self.read_memory(h_process, address, size),
+            patterns=BytePatternSet.from_hex(patterns),
+            regions=self._scan_ranges(h_process, start_address, end_address),
+            max_results=max_results,
+            chunk_size=chunk_size,
+            max_workers=max_workers
+        )
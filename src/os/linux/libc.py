@@ -0,0 +1,33 @@
+import ctypes
+import ctypes.util
+
+# max iovecs per process_vm_readv/process_vm_writev call
+IOV_MAX = 1024
+
+
+class IOVec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len', ctypes.c_size_t),
+    ]
+
+
+libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+
+process_vm_readv = libc.process_vm_readv
+process_vm_readv.argtypes = [
+    ctypes.c_int,
+    ctypes.POINTER(IOVec), ctypes.c_ulong,
+    ctypes.POINTER(IOVec), ctypes.c_ulong,
+    ctypes.c_ulong
+]
+process_vm_readv.restype = ctypes.c_ssize_t
+
+process_vm_writev = libc.process_vm_writev
+process_vm_writev.argtypes = [
+    ctypes.c_int,
+    ctypes.POINTER(IOVec), ctypes.c_ulong,
+    ctypes.POINTER(IOVec), ctypes.c_ulong,
+    ctypes.c_ulong
+]
+process_vm_writev.restype = ctypes.c_ssize_t
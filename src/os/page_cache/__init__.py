@@ -0,0 +1,193 @@
+import ctypes
+
+from pydantic import PrivateAttr
+
+from src.bases.os import OperatingSystemAPIPrototype, OperatingSystemAPIWrapper
+from src.utils.memory import coalesce_spans
+from src.constants.os import PAGE_SIZE, PAGE_CACHE_MAX_READ_SIZE
+
+
+class PageCacheAPI(OperatingSystemAPIWrapper):
+    # caches whole pages while a snapshot is active, outside of a snapshot reads go straight through
+    page_size: int = PAGE_SIZE
+    max_read_size: int = PAGE_CACHE_MAX_READ_SIZE
+
+    _pages: dict[tuple[int, int], bytes | None] = PrivateAttr()
+    _active: bool = PrivateAttr()
+    _generation: int = PrivateAttr()
+    _hit_count: int = PrivateAttr()
+    _miss_count: int = PrivateAttr()
+    _kernel_read_count: int = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._pages = {}
+        self._active = False
+        self._generation = 0
+        self._hit_count = 0
+        self._miss_count = 0
+        self._kernel_read_count = 0
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def hit_count(self) -> int:
+        return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        return self._miss_count
+
+    @property
+    def kernel_read_count(self) -> int:
+        return self._kernel_read_count
+
+    def reset_counters(self) -> None:
+        self._hit_count = 0
+        self._miss_count = 0
+        self._kernel_read_count = 0
+
+    def begin_snapshot(self) -> int:
+        self.invalidate()
+        self.reset_counters()
+        self._active = True
+        return self._generation
+
+    def end_snapshot(self) -> None:
+        self._active = False
+        self._pages.clear()
+
+    def invalidate(self) -> int:
+        self._pages.clear()
+        self._generation += 1
+        return self._generation
+
+    def _load_pages(self, h_process: int, page_addresses: list[int]) -> None:
+        # every run of contiguous missing pages is fetched with a single read
+        for start, size, _ in coalesce_spans([(i, self.page_size) for i in page_addresses], min_address=0):
+            self._kernel_read_count += 1
+            try:
+                data = self.os_api.read_memory(h_process=h_process, address=start, size=size)
+            except OSError:
+                data = b''
+
+            if len(data) == size:
+                for offset in range(0, size, self.page_size):
+                    self._pages[(h_process, start + offset)] = data[offset:offset + self.page_size]
+                continue
+
+            # part of the run is not readable, find out which pages are.
+            # unreadable pages are cached as None so they fail fast until the next snapshot
+            if size == self.page_size:
+                self._pages[(h_process, start)] = None
+                continue
+
+            for page_address in range(start, start + size, self.page_size):
+                self._kernel_read_count += 1
+                try:
+                    page = self.os_api.read_memory(h_process=h_process, address=page_address, size=self.page_size)
+                except OSError:
+                    page = None
+                if page is not None and len(page) != self.page_size:
+                    page = None
+                self._pages[(h_process, page_address)] = page
+
+    def read_memory(self, h_process: int, address: int, size: int, ) -> bytes:
+        if not self._active or size <= 0 or size > self.max_read_size:
+            self._kernel_read_count += 1
+            return self.os_api.read_memory(h_process=h_process, address=address, size=size)
+
+        first_page = address - address % self.page_size
+        page_addresses = range(first_page, address + size, self.page_size)
+
+        missing = [i for i in page_addresses if (h_process, i) not in self._pages]
+        self._hit_count += len(page_addresses) - len(missing)
+        self._miss_count += len(missing)
+        if missing:
+            self._load_pages(h_process=h_process, page_addresses=missing)
+
+        pages = []
+        for page_address in page_addresses:
+            page = self._pages[(h_process, page_address)]
+            if page is None:
+                raise OSError(f'Unreadable memory at: {hex(page_address)}')
+            pages.append(page)
+
+        offset = address - first_page
+        if len(pages) == 1:
+            return pages[0][offset:offset + size]
+        return b''.join(pages)[offset:offset + size]
+
+    def read_into(self,
+                  h_process: int,
+                  address: int,
+                  buffer: bytearray | memoryview | ctypes.Array,
+                  offset: int = 0,
+                  size: int = None,
+                  ) -> int:
+        # served from the cache like read_memory
+        return OperatingSystemAPIPrototype.read_into(
+            self,
+            h_process=h_process,
+            address=address,
+            buffer=buffer,
+            offset=offset,
+            size=size
+        )
+
+    def try_read_into(self,
+                      h_process: int,
+                      address: int,
+                      buffer: bytearray | memoryview | ctypes.Array,
+                      offset: int = 0,
+                      size: int = None,
+                      ) -> tuple[int, int]:
+        return OperatingSystemAPIPrototype.try_read_into(
+            self,
+            h_process=h_process,
+            address=address,
+            buffer=buffer,
+            offset=offset,
+            size=size
+        )
+
+    def _read_spans(self, h_process: int, spans: list[tuple[int, int]]) -> list[bytes | None]:
+        # served page by page from the cache instead of the wrapped api's batched reads
+        return OperatingSystemAPIPrototype._read_spans(self, h_process=h_process, spans=spans)
+
+    def write_memory(self, h_process: int, address: int, data: bytes) -> bool:
+        if self._buffer_write(h_process=h_process, address=address, data=data):
+            return True
+
+        result = self.os_api.write_memory(h_process=h_process, address=address, data=data)
+
+        first_page = address - address % self.page_size
+        for page_address in range(first_page, address + len(data), self.page_size):
+            self._pages.pop((h_process, page_address), None)
+
+        return result
+
+    def allocate_memory(self,
+                        h_process: int,
+                        size: int,
+                        address: int = None,
+                        protection: int = None
+                        ) -> int:
+        # pages cached as unreadable may become readable
+        self.invalidate()
+        return super().allocate_memory(h_process=h_process, size=size, address=address, protection=protection)
+
+    def dealloc_memory(self,
+                       h_process: int,
+                       address: int,
+                       size: int = 0,
+                       free_type=None) -> bool:
+        self.invalidate()
+        return super().dealloc_memory(h_process=h_process, address=address, size=size, free_type=free_type)
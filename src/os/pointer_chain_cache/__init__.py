@@ -0,0 +1,132 @@
+from pydantic import PrivateAttr
+
+from src.bases.os import OperatingSystemAPIWrapper
+from src.constants.os import POINTER_CHAIN_CACHE_MAX_USES
+
+
+class PointerChainCacheAPI(OperatingSystemAPIWrapper):
+    # remembers the last object of pointer chains, a cached chain is validated by
+    # re-reading the object's class pointer together with the final value, a single read.
+    # the intermediate hops aren't checked: an object along the chain replaced by another
+    # of the same class goes unnoticed until the chain is re-walked after max_uses or the
+    # synchronizer invalidates the cache on a screen or world change
+    max_uses: int = POINTER_CHAIN_CACHE_MAX_USES
+
+    # (h_process, pointer, offsets prefix, addr_size) -> [object addr, class addr, uses]
+    _chains: dict[tuple[int, int, tuple[int, ...], int], list[int]] = PrivateAttr()
+    _hit_count: int = PrivateAttr()
+    _miss_count: int = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._chains = {}
+        self._hit_count = 0
+        self._miss_count = 0
+
+    @property
+    def hit_count(self) -> int:
+        return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        return self._miss_count
+
+    def reset_counters(self) -> None:
+        self._hit_count = 0
+        self._miss_count = 0
+
+    def invalidate(self) -> None:
+        self._chains.clear()
+
+    def _resolve_chain(self,
+                       h_process: int,
+                       pointer: int,
+                       offsets: tuple[int, ...],
+                       addr_size: int,
+                       ) -> int | None:
+        result = self.os_api.get_value_from_pointer(
+            h_process=h_process,
+            pointer=pointer,
+            value_size=addr_size
+        )
+        for offset in offsets:
+            if not result:
+                return None
+            result = self.os_api.get_value_from_pointer(
+                h_process=h_process,
+                pointer=result + offset,
+                value_size=addr_size
+            )
+        return result
+
+    def get_value_from_pointer(self,
+                               h_process: int,
+                               pointer: int,
+                               addr_size: int = None,
+                               value_size: int = None,
+                               value_signed: bool = False,
+                               offsets: list[int] = None,
+                               ) -> int | None:
+        # a single hop costs the same as its validation, not worth caching
+        if not offsets or len(offsets) < 2:
+            return super().get_value_from_pointer(
+                h_process=h_process,
+                pointer=pointer,
+                addr_size=addr_size,
+                value_size=value_size,
+                value_signed=value_signed,
+                offsets=offsets
+            )
+
+        if not value_size:
+            value_size = 8
+        if not addr_size:
+            addr_size = 8
+
+        key = (h_process, pointer, tuple(offsets[:-1]), addr_size)
+
+        chain = self._chains.get(key)
+        if chain:
+            object_addr, class_addr, uses = chain
+            class_data, value_data = self.read_many(
+                h_process=h_process,
+                requests=[(object_addr, addr_size), (object_addr + offsets[-1], value_size)]
+            )
+            if (class_data is not None
+                    and value_data is not None
+                    and int.from_bytes(class_data, byteorder='little') == class_addr):
+                self._hit_count += 1
+                if uses + 1 >= self.max_uses:
+                    del self._chains[key]
+                else:
+                    chain[2] = uses + 1
+                return int.from_bytes(value_data, byteorder='little', signed=value_signed)
+
+            # the object moved or died
+            del self._chains[key]
+
+        self._miss_count += 1
+
+        object_addr = self._resolve_chain(
+            h_process=h_process,
+            pointer=pointer,
+            offsets=key[2],
+            addr_size=addr_size
+        )
+        if not object_addr:
+            return None
+
+        class_data, value_data = self.read_many(
+            h_process=h_process,
+            requests=[(object_addr, addr_size), (object_addr + offsets[-1], value_size)]
+        )
+        if value_data is None:
+            return None
+
+        class_addr = int.from_bytes(class_data, byteorder='little') if class_data is not None else 0
+        # objects without a class pointer can't be validated later
+        if class_addr:
+            self._chains[key] = [object_addr, class_addr, 0]
+
+        return int.from_bytes(value_data, byteorder='little', signed=value_signed)
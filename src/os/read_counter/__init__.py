@@ -0,0 +1,56 @@
+import ctypes
+
+from pydantic import PrivateAttr
+
+from src.bases.os import OperatingSystemAPIWrapper
+
+
+class ReadCounterAPI(OperatingSystemAPIWrapper):
+    # counts the reads that reach the wrapped api, a batched span counts as one read
+    _read_count: int = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._read_count = 0
+
+    @property
+    def read_count(self) -> int:
+        return self._read_count
+
+    def reset_counters(self) -> None:
+        self._read_count = 0
+
+    def read_memory(self, h_process: int, address: int, size: int, ) -> bytes:
+        self._read_count += 1
+        return self.os_api.read_memory(h_process=h_process, address=address, size=size)
+
+    def read_into(self,
+                  h_process: int,
+                  address: int,
+                  buffer: bytearray | memoryview | ctypes.Array,
+                  offset: int = 0,
+                  size: int = None,
+                  ) -> int:
+        self._read_count += 1
+        return self.os_api.read_into(h_process=h_process, address=address, buffer=buffer, offset=offset, size=size)
+
+    def try_read_into(self,
+                      h_process: int,
+                      address: int,
+                      buffer: bytearray | memoryview | ctypes.Array,
+                      offset: int = 0,
+                      size: int = None,
+                      ) -> tuple[int, int]:
+        self._read_count += 1
+        return self.os_api.try_read_into(
+            h_process=h_process,
+            address=address,
+            buffer=buffer,
+            offset=offset,
+            size=size
+        )
+
+    def _read_spans(self, h_process: int, spans: list[tuple[int, int]]) -> list[bytes | None]:
+        self._read_count += len(spans)
+        return self.os_api._read_spans(h_process=h_process, spans=spans)
@@ -0,0 +1,137 @@
+import mmap
+import struct
+
+from pydantic import PrivateAttr
+
+from src.bases.os import OperatingSystemAPIPrototype
+from src.os.in_memory import InMemoryProcessAPI
+from src.constants.os import (
+    SNAPSHOT_MAGIC,
+    SNAPSHOT_VERSION,
+    SNAPSHOT_HEADER_FORMAT,
+    SNAPSHOT_REGION_FORMAT,
+    SNAPSHOT_MODULE_FORMAT,
+    SNAPSHOT_DATA_ALIGNMENT,
+)
+
+
+class SnapshotProcessAPI(InMemoryProcessAPI):
+    # serves a process dump file, regions are zero-copy views of a private (copy on write) mmap
+    # so writes never reach the file. allocations come from a scratch arena above the dump
+    filepath: str
+
+    _file = PrivateAttr()
+    _mmap: mmap.mmap | None = PrivateAttr()
+    _protections: dict[int, int] = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._protections = {}
+
+        self._file = open(self.filepath, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        self._load()
+
+    def _load(self) -> None:
+        data = memoryview(self._mmap)
+
+        header_size = struct.calcsize(SNAPSHOT_HEADER_FORMAT)
+        magic, version, region_count, module_count = struct.unpack_from(SNAPSHOT_HEADER_FORMAT, data, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise OSError(f'Invalid snapshot file: {self.filepath}')
+
+        position = header_size
+        region_size = struct.calcsize(SNAPSHOT_REGION_FORMAT)
+        highest_address = 0
+
+        for _ in range(region_count):
+            base, size, file_offset, protection = struct.unpack_from(SNAPSHOT_REGION_FORMAT, data, position)
+            position += region_size
+
+            self.map_region(base, data[file_offset:file_offset + size])
+            self._protections[base] = protection
+            highest_address = max(highest_address, base + size)
+
+        module_size = struct.calcsize(SNAPSHOT_MODULE_FORMAT)
+        for _ in range(module_count):
+            base, name_length = struct.unpack_from(SNAPSHOT_MODULE_FORMAT, data, position)
+            position += module_size
+            self.add_module(bytes(data[position:position + name_length]).decode('utf-8'), base)
+            position += name_length
+
+        # keep the scratch arena clear of the dumped address space
+        granularity = self.allocation_granularity
+        self._next_allocation = max(
+            self._next_allocation,
+            (highest_address + granularity - 1) // granularity * granularity
+        )
+
+    @property
+    def protections(self) -> dict[int, int]:
+        return dict(self._protections)
+
+    def close(self) -> None:
+        for base in list(self._regions):
+            if isinstance(self._regions[base], memoryview):
+                self._regions[base].release()
+            self.unmap_region(base)
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+            self._file.close()
+
+    @classmethod
+    def dump(cls,
+             os_api: OperatingSystemAPIPrototype,
+             h_process: int,
+             filepath: str,
+             regions: list[tuple[int, int] | tuple[int, int, int]],
+             modules: dict[str, int] = None,
+             ) -> int:
+        # write (base, size[, protection]) regions of a live process to a snapshot file,
+        # regions that can't be read are left out. returns the number of dumped regions
+        dumped = []
+        for region in regions:
+            base, size = region[:2]
+            protection = region[2] if len(region) > 2 else 0
+            try:
+                data = os_api.read_memory(h_process=h_process, address=base, size=size)
+            except OSError:
+                continue
+            if len(data) != size:
+                continue
+            dumped.append((base, protection, data))
+
+        modules = modules or {}
+
+        encoded_modules = [(name.encode('utf-8'), base) for name, base in modules.items()]
+        table_size = (
+                struct.calcsize(SNAPSHOT_HEADER_FORMAT)
+                + struct.calcsize(SNAPSHOT_REGION_FORMAT) * len(dumped)
+                + sum(struct.calcsize(SNAPSHOT_MODULE_FORMAT) + len(name) for name, _ in encoded_modules)
+        )
+
+        def align(value: int) -> int:
+            return (value + SNAPSHOT_DATA_ALIGNMENT - 1) // SNAPSHOT_DATA_ALIGNMENT * SNAPSHOT_DATA_ALIGNMENT
+
+        with open(filepath, 'wb') as wf:
+            wf.write(struct.pack(SNAPSHOT_HEADER_FORMAT, SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+                                 len(dumped), len(encoded_modules)))
+
+            file_offset = align(table_size)
+            for base, protection, data in dumped:
+                wf.write(struct.pack(SNAPSHOT_REGION_FORMAT, base, len(data), file_offset, protection))
+                file_offset = align(file_offset + len(data))
+
+            for name, base in encoded_modules:
+                wf.write(struct.pack(SNAPSHOT_MODULE_FORMAT, base, len(name)))
+                wf.write(name)
+
+            for base, protection, data in dumped:
+                wf.seek(align(wf.tell()))
+                wf.write(data)
+
+        return len(dumped)
@@ -0,0 +1,373 @@
+import ctypes
+import hashlib
+import struct
+
+from pydantic import PrivateAttr
+
+from src.bases.os import OperatingSystemAPIPrototype, OperatingSystemAPIWrapper
+from src.utils import compress_data, decompress_data
+from src.constants.os import (
+    PAGE_SIZE,
+    TRACE_MAGIC,
+    TRACE_VERSION,
+    TRACE_HEADER_FORMAT,
+    TRACE_PAGE_REF_FORMAT,
+    TRACE_OP_FORMAT,
+    TRACE_OP_READ,
+    TRACE_OP_FAILED_READ,
+    TRACE_OP_WRITE,
+)
+
+
+class RecordingAPI(OperatingSystemAPIWrapper):
+    # records reads and writes of max_ticks synchronizer ticks. every tick keeps a sparse image of
+    # the pages it read, identical pages are stored once. reads before the first tick are not recorded
+    filepath: str | None = None
+    max_ticks: int | None = None
+    page_size: int = PAGE_SIZE
+
+    _tick: int = PrivateAttr()
+    _recording: bool = PrivateAttr()
+    _stopped: bool = PrivateAttr()
+    _tick_pages: dict[int, tuple[bytearray, bytearray]] = PrivateAttr()
+    _ticks: list[dict[int, int]] = PrivateAttr()
+    _page_indexes: dict[bytes, int] = PrivateAttr()
+    _pages: list[bytes] = PrivateAttr()
+    _ops: list[tuple[int, int, int, int, bytes | None]] = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._tick = -1
+        self._recording = False
+        self._stopped = False
+        self._tick_pages = {}
+        self._ticks = []
+        self._page_indexes = {}
+        self._pages = []
+        self._ops = []
+
+    @property
+    def recording(self) -> bool:
+        return self._recording
+
+    @property
+    def tick_count(self) -> int:
+        return len(self._ticks) + (1 if self._recording else 0)
+
+    @property
+    def ops(self) -> list[tuple[int, int, int, int, bytes | None]]:
+        # (tick, kind, address, size, data), data is only kept for writes
+        return list(self._ops)
+
+    def begin_tick(self) -> None:
+        if self._recording:
+            self._finish_tick()
+            if self.max_ticks is not None and len(self._ticks) >= self.max_ticks:
+                self.stop()
+
+        if not self._stopped:
+            self._tick += 1
+            self._recording = True
+
+        return self.os_api.begin_tick()
+
+    def stop(self) -> None:
+        if self._stopped:
+            return
+
+        if self._recording:
+            self._finish_tick()
+        self._recording = False
+        self._stopped = True
+
+        if self.filepath:
+            self.save(self.filepath)
+
+    def _finish_tick(self) -> None:
+        self._recording = False
+
+        refs = {}
+        for page_address, (content, mask) in self._tick_pages.items():
+            page = bytes(content) + bytes(mask)
+            digest = hashlib.blake2b(page, digest_size=16).digest()
+            index = self._page_indexes.get(digest)
+            if index is None:
+                index = len(self._pages)
+                self._page_indexes[digest] = index
+                self._pages.append(page)
+            refs[page_address] = index
+
+        self._ticks.append(refs)
+        self._tick_pages = {}
+
+    def _capture(self, address: int, data: bytes | memoryview) -> None:
+        position = 0
+        while position < len(data):
+            current = address + position
+            page_address = current - current % self.page_size
+            offset = current - page_address
+            length = min(self.page_size - offset, len(data) - position)
+
+            page = self._tick_pages.get(page_address)
+            if page is None:
+                page = self._tick_pages[page_address] = (bytearray(self.page_size), bytearray(self.page_size))
+            page[0][offset:offset + length] = data[position:position + length]
+            page[1][offset:offset + length] = b'\x01' * length
+
+            position += length
+
+    def read_memory(self, h_process: int, address: int, size: int, ) -> bytes:
+        if not self._recording:
+            return self.os_api.read_memory(h_process=h_process, address=address, size=size)
+
+        try:
+            data = self.os_api.read_memory(h_process=h_process, address=address, size=size)
+        except OSError:
+            self._ops.append((self._tick, TRACE_OP_FAILED_READ, address, size, None))
+            raise
+
+        self._ops.append((self._tick, TRACE_OP_READ, address, size, None))
+        self._capture(address, data)
+        return data
+
+    def read_into(self,
+                  h_process: int,
+                  address: int,
+                  buffer: bytearray | memoryview | ctypes.Array,
+                  offset: int = 0,
+                  size: int = None,
+                  ) -> int:
+        # recorded like read_memory
+        return OperatingSystemAPIPrototype.read_into(
+            self,
+            h_process=h_process,
+            address=address,
+            buffer=buffer,
+            offset=offset,
+            size=size
+        )
+
+    def try_read_into(self,
+                      h_process: int,
+                      address: int,
+                      buffer: bytearray | memoryview | ctypes.Array,
+                      offset: int = 0,
+                      size: int = None,
+                      ) -> tuple[int, int]:
+        return OperatingSystemAPIPrototype.try_read_into(
+            self,
+            h_process=h_process,
+            address=address,
+            buffer=buffer,
+            offset=offset,
+            size=size
+        )
+
+    def _read_spans(self, h_process: int, spans: list[tuple[int, int]]) -> list[bytes | None]:
+        results = self.os_api._read_spans(h_process=h_process, spans=spans)
+        if not self._recording:
+            return results
+
+        for (address, size), data in zip(spans, results):
+            if data is None or len(data) != size:
+                self._ops.append((self._tick, TRACE_OP_FAILED_READ, address, size, None))
+                continue
+            self._ops.append((self._tick, TRACE_OP_READ, address, size, None))
+            self._capture(address, data)
+        return results
+
+    def write_memory(self, h_process: int, address: int, data: bytes) -> bool:
+        if self._buffer_write(h_process=h_process, address=address, data=data):
+            return True
+
+        if self._recording:
+            self._ops.append((self._tick, TRACE_OP_WRITE, address, len(data), bytes(data)))
+        return self.os_api.write_memory(h_process=h_process, address=address, data=data)
+
+    def save(self, filepath: str) -> None:
+        chunks = [struct.pack(
+            TRACE_HEADER_FORMAT,
+            TRACE_MAGIC, TRACE_VERSION, self.page_size,
+            len(self._pages), len(self._ticks), len(self._ops)
+        )]
+        chunks.extend(self._pages)
+
+        for refs in self._ticks:
+            chunks.append(struct.pack('<I', len(refs)))
+            for page_address, index in refs.items():
+                chunks.append(struct.pack(TRACE_PAGE_REF_FORMAT, page_address, index))
+
+        for tick, kind, address, size, data in self._ops:
+            chunks.append(struct.pack(TRACE_OP_FORMAT, tick, kind, address, size))
+            if kind == TRACE_OP_WRITE:
+                chunks.append(data)
+
+        with open(filepath, 'wb') as wf:
+            wf.write(compress_data(b''.join(chunks)))
+
+
+class ReplayProcessAPI(OperatingSystemAPIPrototype):
+    # serves the recorded page images of a trace, begin_tick moves to the next recorded tick.
+    # reads must be fully covered by bytes recorded in the current tick
+    filepath: str
+    loop: bool = False
+
+    _page_size: int = PrivateAttr()
+    _pages: list[bytes] = PrivateAttr()
+    _ticks: list[dict[int, int]] = PrivateAttr()
+    _ops: list[tuple[int, int, int, int, bytes | None]] = PrivateAttr()
+    _tick: int = PrivateAttr()
+    _overlay: dict[int, tuple[bytearray, bytearray]] = PrivateAttr()
+    _read_count: int = PrivateAttr()
+    _write_count: int = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._pages = []
+        self._ticks = []
+        self._ops = []
+        self._tick = -1
+        self._overlay = {}
+        self._read_count = 0
+        self._write_count = 0
+
+        self._load()
+
+    def _load(self) -> None:
+        with open(self.filepath, 'rb') as rf:
+            data = memoryview(decompress_data(rf.read()))
+
+        magic, version, page_size, page_count, tick_count, op_count = struct.unpack_from(TRACE_HEADER_FORMAT, data, 0)
+        if magic != TRACE_MAGIC or version != TRACE_VERSION:
+            raise OSError(f'Invalid trace file: {self.filepath}')
+
+        self._page_size = page_size
+        position = struct.calcsize(TRACE_HEADER_FORMAT)
+
+        for _ in range(page_count):
+            self._pages.append(bytes(data[position:position + page_size * 2]))
+            position += page_size * 2
+
+        ref_size = struct.calcsize(TRACE_PAGE_REF_FORMAT)
+        for _ in range(tick_count):
+            ref_count, = struct.unpack_from('<I', data, position)
+            position += 4
+            refs = {}
+            for page_address, index in struct.iter_unpack(
+                    TRACE_PAGE_REF_FORMAT, data[position:position + ref_size * ref_count]
+            ):
+                refs[page_address] = index
+            position += ref_size * ref_count
+            self._ticks.append(refs)
+
+        op_size = struct.calcsize(TRACE_OP_FORMAT)
+        for _ in range(op_count):
+            tick, kind, address, size = struct.unpack_from(TRACE_OP_FORMAT, data, position)
+            position += op_size
+            op_data = None
+            if kind == TRACE_OP_WRITE:
+                op_data = bytes(data[position:position + size])
+                position += size
+            self._ops.append((tick, kind, address, size, op_data))
+
+    @property
+    def tick(self) -> int:
+        return self._tick
+
+    @property
+    def tick_count(self) -> int:
+        return len(self._ticks)
+
+    @property
+    def read_count(self) -> int:
+        return self._read_count
+
+    @property
+    def write_count(self) -> int:
+        return self._write_count
+
+    def reset_counters(self) -> None:
+        self._read_count = 0
+        self._write_count = 0
+
+    def recorded_ops(self, tick: int = None) -> list[tuple[int, int, int, int, bytes | None]]:
+        if tick is None:
+            return list(self._ops)
+        return [op for op in self._ops if op[0] == tick]
+
+    def recorded_read_count(self, tick: int = None) -> int:
+        return sum(1 for op in self.recorded_ops(tick) if op[1] != TRACE_OP_WRITE)
+
+    def begin_tick(self) -> None:
+        self._tick += 1
+        if self.loop and self._ticks:
+            self._tick %= len(self._ticks)
+        self._overlay = {}
+
+    def _get_page(self, page_address: int) -> tuple[bytes | bytearray, bytes | bytearray] | None:
+        if page_address in self._overlay:
+            return self._overlay[page_address]
+
+        if not 0 <= self._tick < len(self._ticks):
+            raise OSError(f'Trace has no tick: {self._tick}')
+
+        index = self._ticks[self._tick].get(page_address)
+        if index is None:
+            return None
+        page = self._pages[index]
+        return page[:self._page_size], page[self._page_size:]
+
+    def read_memory(self, h_process: int, address: int, size: int) -> bytes:
+        self._read_count += 1
+
+        chunks = []
+        position = 0
+        while position < size:
+            current = address + position
+            page_address = current - current % self._page_size
+            offset = current - page_address
+            length = min(self._page_size - offset, size - position)
+
+            page = self._get_page(page_address)
+            if page is None or 0 in page[1][offset:offset + length]:
+                raise OSError(f'Memory not recorded at: {hex(current)}')
+            chunks.append(page[0][offset:offset + length])
+
+            position += length
+
+        return b''.join(chunks)
+
+    def write_memory(self, h_process: int, address: int, data: bytes) -> bool:
+        if self._buffer_write(h_process=h_process, address=address, data=data):
+            return True
+
+        self._write_count += 1
+
+        position = 0
+        while position < len(data):
+            current = address + position
+            page_address = current - current % self._page_size
+            offset = current - page_address
+            length = min(self._page_size - offset, len(data) - position)
+
+            if page_address not in self._overlay:
+                page = self._get_page(page_address)
+                if page is None:
+                    page = (bytes(self._page_size), bytes(self._page_size))
+                self._overlay[page_address] = (bytearray(page[0]), bytearray(page[1]))
+
+            content, mask = self._overlay[page_address]
+            content[offset:offset + length] = data[position:position + length]
+            mask[offset:offset + length] = b'\x01' * length
+
+            position += length
+
+        return True
+
+    def get_h_process(self, pid: int) -> int:
+        return pid
+
+    def close_h_process(self, h_process: int) -> bool:
+        return True
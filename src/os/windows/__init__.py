@@ -3,7 +3,9 @@ from ctypes import wintypes, windll
 from typing import Callable
 
 from src.bases.os import OperatingSystemAPIPrototype
-from src.utils import hex_string_to_int_list
+from src.utils.memory import get_thread_buffer, as_ctypes_buffer, read_status
+from src.utils.regions import MemoryRegion
+from src.utils.scanners import BytePattern, BytePatternSet, scan_regions, scan_regions_many
 from src.os.windows.kernel32 import (
     Process,
     PageProtection,
@@ -63,6 +65,7 @@ from src.os.windows.wintypes_extended import (
     HANDLE,
     QWORD,
     DWORD,
+    SIZE_T,
 )
 from src.os.windows.user32 import (
     ShowWindowCommand,
@@ -72,117 +75,19 @@ from src.os.windows.user32 import (
     SetForegroundWindow,
     IsIconic
 )
-from src.constants.os import (
-    DOS_HEADER_SIZE,
-    E_LFANEW_OFFSET,
-    E_LFANEW_SIZE,
-    PE_HEADER_SIZE,
-    PE_SIGNATURE_SIZE,
-    VALID_PE_SIGNATURE,
-    OPTIONAL_HEADER_OFFSET,
-    OPTIONAL_HEADER_SIZE,
-    SYS32,
-    SYS64,
-    SYS32_DATA_DIR_OFFSET,
-    SYS64_DATA_DIR_OFFSET,
-    DATA_DIR_SIZE,
-    EXPORT_TABLE_SIZE,
-    NUM_OF_FUNC_OFFSET,
-    NUM_OF_FUNC_SIZE,
-    NUM_OF_NAME_OFFSET,
-    NUM_OF_NAME_SIZE,
-    FUNC_RVA_ARRAY_RAV_OFFSET,
-    FUNC_RVA_ARRAY_RAV_SIZE,
-    FUNC_NAME_RVA_ARRAY_RAV_OFFSET,
-    FUNC_NAME_RVA_ARRAY_RAV_SIZE,
-    FUNC_ORDINAL_RVA_ARRAY_OFFSET,
-    FUNC_ORDINAL_RVA_ARRAY_SIZE,
-    MAX_NUM_OF_NAME,
-    FUNC_NAME_SIZE,
-    FUNC_ORDINAL_SIZE,
-    FUNC_RVA_SIZE,
-    FUNC_NAME_RAV_ARRAY_ITEM_SIZE,
-)
+from src.constants.os import MAX_ADDRESS
 
 
 class WindowsAPI(OperatingSystemAPIPrototype):
     _termination_callbacks: dict = {}
 
-    def scan_file(self,
-                  filepath: str,
-                  pattern: list[str],
-                  chunk_size: int = 1 * 1024 * 1024,
-                  max_results: int = 1,
-                  ) -> list[int]:
+    def list_memory_regions(self,
+                            h_process: int,
+                            start_address: int = None,
+                            end_address: int = None,
+                            ) -> list[MemoryRegion]:
         results = []
 
-        pattern = hex_string_to_int_list(''.join(pattern).replace(' ', ''))
-
-        pattern_len = len(pattern)
-        if not pattern_len:
-            return results
-
-        # Precompute non-wildcard positions
-        non_wildcards = []
-        for idx, byte in enumerate(pattern):
-            if byte is not None:
-                non_wildcards.append((idx, byte))
-
-        current_address = 0
-        last_matched_address = None
-        with open(filepath, 'rb') as f:
-            for chunk in iter(lambda: f.read(chunk_size), b''):
-                chunk_length = len(chunk)
-                for offset in range(chunk_length - pattern_len + 1):
-
-                    # ignore if the offset is in the last matched function
-                    if last_matched_address is not None:
-                        if (current_address + offset) <= (last_matched_address + pattern_len):
-                            continue
-
-                    match = True
-                    for pos, val in non_wildcards:
-                        if chunk[offset + pos] != val:
-                            match = False
-                            break
-
-                    if match:
-                        matched_address = current_address + offset
-                        last_matched_address = matched_address
-                        results.append(matched_address)
-
-                        if len(results) >= max_results:
-                            break
-
-                current_address += chunk_length
-                if len(results) >= max_results:
-                    break
-
-        return results
-
-    def scan_memory(
-            self,
-            h_process: int,
-            pattern: list[str],
-            start_address: int = None,
-            end_address: int = None,
-            max_results: int = 1,
-            chunk_size: int = 1 * 1024 * 1024,  # 1MB chunks
-    ) -> list[int]:
-
-        pattern = hex_string_to_int_list(''.join(pattern).replace(' ', ''))
-        results = []
-
-        pattern_len = len(pattern)
-        if not pattern_len:
-            return results
-
-        # Precompute non-wildcard positions
-        non_wildcards = []
-        for idx, byte in enumerate(pattern):
-            if byte is not None:
-                non_wildcards.append((idx, byte))
-
         mbi = MemoryBasicInformation()
         mbi_size = ctypes.sizeof(mbi)
 
@@ -192,12 +97,11 @@ class WindowsAPI(OperatingSystemAPIPrototype):
 
         # Use max user space address if not specified
         if end_address is None:
-            end_address = 0x7FFFFFFFFFFFFFFF
+            end_address = MAX_ADDRESS
 
         current_address = start_address
-        last_matched_address = None
 
-        while (current_address < end_address) and len(results) < max_results:
+        while current_address < end_address:
             try:
                 # Query memory region
                 ret = VirtualQueryEx(h_process, current_address, ctypes.byref(mbi), mbi_size)
@@ -209,7 +113,11 @@ class WindowsAPI(OperatingSystemAPIPrototype):
                     break
                 raise
 
-            # Skip uncommitted or unreadable regions
+            region_start = mbi.BaseAddress or 0
+            # Move to next region
+            current_address = region_start + mbi.RegionSize
+
+            # Skip uncommitted regions
             if mbi.State != MemoryState.MEM_COMMIT:
                 continue
 
@@ -221,51 +129,48 @@ class WindowsAPI(OperatingSystemAPIPrototype):
                 PageProtection.WRITECOPY,
                 PageProtection.EXECUTE_WRITECOPY
             )
-            if not is_readable:
-                continue
-
-            # Move to next region
-            region_size = mbi.RegionSize
-            region_offset = 0
+            results.append(MemoryRegion(region_start, current_address, mbi.Protect, is_readable))
 
-            read_size = min(
-                chunk_size + pattern_len - 1,
-                region_size - region_offset,
-                end_address - current_address
-            )
+        return results
 
-            while (region_offset < read_size) and len(results) < max_results:
-                # Calculate chunk size with overlap for pattern
-
-                try:
-                    data = self.read_memory(h_process, current_address, read_size)
-                except OSError:
-                    break  # Skip inaccessible chunk
-                # Search pattern in this chunk
-                for offset in range(len(data) - pattern_len + 1):
-                    match = True
-
-                    address_at_this_point = current_address + offset
-
-                    # ignore if the offset is in the last matched function
-                    if last_matched_address is not None:
-                        if address_at_this_point <= (last_matched_address + pattern_len):
-                            continue
-
-                    for pos, val in non_wildcards:
-                        if data[offset + pos] != val:
-                            match = False
-                            break
-                    if match:
-                        last_matched_address = address_at_this_point
-                        results.append(address_at_this_point)
-                        if len(results) >= max_results:
-                            return results
-
-                current_address += read_size
-                region_offset += read_size
+    def scan_memory(
+            self,
+            h_process: int,
+            pattern: list[str] | str,
+            start_address: int = None,
+            end_address: int = None,
+            max_results: int = 1,
+            chunk_size: int = 1 * 1024 * 1024,  # 1MB chunks
+            max_workers: int = 1,
+    ) -> list[int]:
+        return scan_regions(
+            read=lambda address, size: self.read_memory(h_process, address, size),
+            pattern=BytePattern.from_hex(pattern),
+            regions=self._scan_ranges(h_process, start_address, end_address),
+            max_results=max_results,
+            chunk_size=chunk_size,
+            max_workers=max_workers
+        )
 
-        return results
+    def scan_memory_many(
+            self,
+            h_process: int,
+            patterns: dict[str, str | list[str]],
+            start_address: int = None,
+            end_address: int = None,
+            max_results: int = 1,
+            chunk_size: int = 1 * 1024 * 1024,  # 1MB chunks
+            max_workers: int = 1,
+    ) -> dict[str, list[int]]:
+        # every region is read once whatever the number of patterns
+        return scan_regions_many(
+            read=lambda address, size: self.read_memory(h_process, address, size),
+            patterns=BytePatternSet.from_hex(patterns),
+            regions=self._scan_ranges(h_process, start_address, end_address),
+            max_results=max_results,
+            chunk_size=chunk_size,
+            max_workers=max_workers
+        )
 
     def set_process_termination_callback(self, h_process: int, callback: Callable, context: int = None) -> int:
         w_handle = HANDLE()
@@ -389,6 +294,7 @@ class WindowsAPI(OperatingSystemAPIPrototype):
         if not allocate_addr:
             raise ctypes.WinError(ctypes.get_last_error())
 
+        self._refresh_region_range(h_process, allocate_addr, size.value)
         return allocate_addr
 
     def dealloc_memory(self,
@@ -413,22 +319,64 @@ class WindowsAPI(OperatingSystemAPIPrototype):
         if not freeing:
             print('vao day', ctypes.get_last_error())
             raise ctypes.WinError(ctypes.get_last_error())
+
+        self._refresh_region_range(h_process, address, size)
         return True
 
     def read_memory(self, h_process: int, address: int, size: int) -> bytes:
-        buffer = ctypes.create_string_buffer(size)
-        bytes_read = ctypes.c_ulong(0)
+        buffer = get_thread_buffer(size, name='read_memory')
+        bytes_read = self.read_into(h_process=h_process, address=address, buffer=buffer, size=size)
+        return ctypes.string_at(buffer, bytes_read)
+
+    @staticmethod
+    def _read_process_memory(h_process: int,
+                             address: int,
+                             buffer: bytearray | memoryview | ctypes.Array,
+                             offset: int,
+                             size: int,
+                             ) -> tuple[bool, int]:
+        bytes_read = SIZE_T(0)
         success = ReadProcessMemory(h_process,
-                                    ctypes.c_void_p(address),
-                                    buffer,
+                                    address,
+                                    as_ctypes_buffer(buffer, offset, size),
                                     size,
                                     ctypes.byref(bytes_read))
+        return bool(success), bytes_read.value
+
+    def read_into(self,
+                  h_process: int,
+                  address: int,
+                  buffer: bytearray | memoryview | ctypes.Array,
+                  offset: int = 0,
+                  size: int = None,
+                  ) -> int:
+        if size is None:
+            size = len(buffer) - offset
+
+        success, bytes_read = self._read_process_memory(h_process, address, buffer, offset, size)
         if not success:
             raise ctypes.WinError(ctypes.get_last_error())
 
-        return buffer.raw[:bytes_read.value]
+        return bytes_read
+
+    def try_read_into(self,
+                      h_process: int,
+                      address: int,
+                      buffer: bytearray | memoryview | ctypes.Array,
+                      offset: int = 0,
+                      size: int = None,
+                      ) -> tuple[int, int]:
+        # ERROR_PARTIAL_COPY still reports the bytes that were copied
+        if size is None:
+            size = len(buffer) - offset
+
+        _, bytes_read = self._read_process_memory(h_process, address, buffer, offset, size)
+        return read_status(bytes_read, size), bytes_read
 
     def write_memory(self, h_process: int, address: int, data: bytes):
+        if self._buffer_write(h_process=h_process, address=address, data=data):
+            return True
+
         bytes_written = ctypes.c_size_t(0)
         size = len(data)
 
@@ -491,6 +439,8 @@ class WindowsAPI(OperatingSystemAPIPrototype):
             found_module = Module32Next(snapshot, ctypes.byref(module_entry))
 
         CloseHandle(snapshot)
+
+        self._track_modules(pid, results)
         return results
 
     def open_thread(self, thread_id: int) -> int:
@@ -574,223 +524,6 @@ class WindowsAPI(OperatingSystemAPIPrototype):
 
         return thread_id.value, exit_code.value
 
-    def get_value_from_pointer(self,
-                               h_process: int,
-                               pointer: int,
-                               addr_size: int = None,
-                               value_size: int = None,
-                               value_signed: bool = False,
-                               offsets: list[int] = None,
-                               ) -> int | None:
-        if not value_size:
-            value_size = 8
-        if not addr_size:
-            addr_size = 8
-        try:
-            if offsets:
-                result = int.from_bytes(
-                    self.read_memory(
-                        h_process=h_process,
-                        address=pointer,
-                        size=addr_size
-                    ),
-                    byteorder='little',
-                )
-
-                for index, offset in enumerate(offsets):
-                    if index + 1 == len(offsets):
-                        size = value_size
-                        signed = value_signed
-                    else:
-                        size = addr_size
-                        signed = False
-                    result = int.from_bytes(
-                        self.read_memory(
-                            h_process=h_process,
-                            address=result + offset,
-                            size=size
-                        ),
-                        byteorder='little',
-                        signed=signed
-                    )
-            else:
-                result = int.from_bytes(
-                    self.read_memory(
-                        h_process=h_process,
-                        address=pointer,
-                        size=value_size
-                    ),
-                    byteorder='little',
-                    signed=value_signed
-                )
-        except OSError as e:
-            # error_data: dict = {
-            #     'error': e,
-            #     'h_process': h_process,
-            #     'pointer': hex(pointer),
-            #     'addr_size': addr_size,
-            #     'value_size': value_size,
-            #     'value_signed': value_signed,
-            #     'offsets': offsets,
-            # }
-            # if ENVIRONMENT != 'PRD':
-            #     print('get value from pointer failed', error_data)
-            return None
-        return result
-
-    def list_module_functions(self, pid: int, h_process: int, module_name: str) -> dict[str, int]:
-        result = dict()
-
-        modules = self.list_modules(pid=pid)
-        module_addr = modules.get(module_name)
-        if not module_addr:
-            raise OSError(f'Module not found: {module_name}')
-
-        dos_header = self.read_memory(
-            h_process=h_process,
-            address=module_addr,
-            size=DOS_HEADER_SIZE
-        )
-        if not dos_header:
-            raise OSError('Failed to read DOS header')
-
-        print('dos_header', dos_header)
-
-        e_lfanew = int.from_bytes(
-            dos_header[E_LFANEW_OFFSET:E_LFANEW_OFFSET + E_LFANEW_SIZE],
-            byteorder='little',
-            signed=False
-        )
-
-        print('e_lfanew', e_lfanew)
-        pe_header = self.read_memory(
-            h_process=h_process,
-            address=module_addr + e_lfanew,
-            size=PE_HEADER_SIZE
-        )
-        if not pe_header:
-            raise OSError(
-                'Failed to read PE header at e_lfanew'
-            )
-
-        signature = int.from_bytes(
-            pe_header[:PE_SIGNATURE_SIZE],
-            byteorder='little',
-            signed=False
-        )
-        if signature != VALID_PE_SIGNATURE:
-            raise OSError(
-                f'Invalid PE signature: {hex(signature)}'
-            )
-        opt_header = pe_header[OPTIONAL_HEADER_OFFSET: OPTIONAL_HEADER_OFFSET + OPTIONAL_HEADER_SIZE]
-        sys = int.from_bytes(opt_header, byteorder='little')
-
-        is32 = (sys == SYS32)
-        is64 = (sys == SYS64)
-
-        if not (is32 or is64):
-            raise OSError(f'Not a valid PE32 or PE32+ file: {sys}')
-
-        data_dir_offset = SYS32_DATA_DIR_OFFSET if is32 else SYS64_DATA_DIR_OFFSET
-        data_dir_addr = OPTIONAL_HEADER_OFFSET + data_dir_offset
-        export_rva = int.from_bytes(
-            pe_header[data_dir_addr: data_dir_addr + DATA_DIR_SIZE],
-            byteorder='little',
-            signed=False
-        )
-        if not export_rva:
-            raise OSError('Export RVA is 0, no export table found')
-
-        export_table_addr = module_addr + export_rva
-        export_table = self.read_memory(
-            h_process=h_process,
-            address=export_table_addr,
-            size=EXPORT_TABLE_SIZE
-        )
-        if not export_table:
-            raise OSError(f'Failed to read export table at: {export_table_addr}')
-
-        num_of_funcs = int.from_bytes(
-            export_table[NUM_OF_FUNC_OFFSET:NUM_OF_FUNC_OFFSET + NUM_OF_FUNC_SIZE],
-            byteorder='little', signed=True
-        )
-
-        num_of_names = int.from_bytes(
-            export_table[NUM_OF_NAME_OFFSET:NUM_OF_NAME_OFFSET + NUM_OF_NAME_SIZE],
-            byteorder='little', signed=True
-        )
-
-        func_rav_array_rav = int.from_bytes(
-            export_table[FUNC_RVA_ARRAY_RAV_OFFSET:FUNC_RVA_ARRAY_RAV_OFFSET + FUNC_RVA_ARRAY_RAV_SIZE],
-            byteorder='little', signed=False
-        )
-
-        func_name_rav_array_rav = int.from_bytes(
-            export_table[FUNC_NAME_RVA_ARRAY_RAV_OFFSET:FUNC_NAME_RVA_ARRAY_RAV_OFFSET + FUNC_NAME_RVA_ARRAY_RAV_SIZE],
-            byteorder='little', signed=False
-        )
-
-        func_ord_array_rav = int.from_bytes(
-            export_table[FUNC_ORDINAL_RVA_ARRAY_OFFSET:FUNC_ORDINAL_RVA_ARRAY_OFFSET + FUNC_ORDINAL_RVA_ARRAY_SIZE],
-            byteorder='little', signed=False
-        )
-
-        if num_of_funcs < 0 or num_of_names < 0:
-            raise OSError(
-                'Negative function/name count. Possibly invalid data or mismatched architecture.'
-            )
-
-        func_rav_array_addr = module_addr + func_rav_array_rav
-        func_name_rav_array_addr = module_addr + func_name_rav_array_rav
-        print('func_name_rav_array_addr', hex(func_name_rav_array_addr))
-        ord_array_addr = module_addr + func_ord_array_rav
-
-        max_names_to_check = min(num_of_names, MAX_NUM_OF_NAME)
-
-        for i in range(max_names_to_check):
-            name_rva = self.get_value_from_pointer(
-                h_process=h_process,
-                pointer=func_name_rav_array_addr + (i * FUNC_NAME_RAV_ARRAY_ITEM_SIZE),
-                value_size=FUNC_NAME_RAV_ARRAY_ITEM_SIZE
-            )
-            if not name_rva:
-                continue
-            print('name_rva', hex(name_rva))
-            func_name = self.read_memory(
-                h_process=h_process,
-                address=module_addr + name_rva,
-                size=FUNC_NAME_SIZE
-            )
-            if not func_name:
-                continue
-
-            ord_addr = ord_array_addr + (i * FUNC_ORDINAL_SIZE)
-            ord_data = self.read_memory(
-                h_process=h_process,
-                address=ord_addr,
-                size=FUNC_ORDINAL_SIZE
-            )
-            if not ord_data:
-                raise OSError(f'Failed to read function ordinal at: {ord_addr}')
-
-            ordinal = int.from_bytes(
-                ord_data,
-                byteorder='little',
-            )
-            func_rva_addr = func_rav_array_addr + (ordinal * FUNC_RVA_SIZE)
-            func_rva = self.read_memory(
-                h_process=h_process,
-                address=func_rva_addr,
-                size=FUNC_RVA_SIZE
-            )
-            if not func_rva:
-                raise OSError(f'Failed to read function rav at {func_rva_addr}')
-
-            func_rva = int.from_bytes(func_rva, byteorder='little')
-            result[func_name] = module_addr + func_rva
-
-        return result
-
     def get_file_version(self, filepath: str) -> str:
         # Get size of version info
         size = ctypes.windll.version.GetFileVersionInfoSizeW(filepath, None)
@@ -264,6 +264,9 @@ WriteProcessMemory.restype = BOOL
 WriteProcessMemory.errcheck = Win32API_errcheck
 
 ReadProcessMemory = ctypes.windll.kernel32.ReadProcessMemory
+ReadProcessMemory.argtypes = [HANDLE, LPCVOID, LPVOID, SIZE_T, ctypes.POINTER(SIZE_T)]
+ReadProcessMemory.restype = BOOL
+
 TerminateProcess = ctypes.windll.kernel32.TerminateProcess
 SuspendThread = ctypes.windll.kernel32.SuspendThread
 ResumeThread = ctypes.windll.kernel32.ResumeThread
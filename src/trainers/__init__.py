@@ -17,6 +17,7 @@ from src.bases.errors import Error
 from src.bases.engines import EngineMeta, GameServer, GameDatabase, EngineSettings
 from src.engines.unity_megamu import UnityMegaMUEngine, UnityMegaMUEngineMeta, UnityMegaMUSettings
 from src.constants import DATA_DIR, TMP_DIR
+from src.constants.os import SCAN_MAX_WORKERS
 from src.utils import scan_string, compress_data, decompress_data, load_data_file
 from config import ENVIRONMENT, ROOT_DIR, SECRET_KEY
 
@@ -471,6 +472,7 @@ class Trainer(TrainerPrototype):
 
                 total_funcs = len(game_functions)
                 scanned_funcs = 0
+                unresolved_funcs = dict()
 
                 for f_code, f in game_functions.items():
 
@@ -505,10 +507,9 @@ class Trainer(TrainerPrototype):
                                 scan_results.append(offsets_to_check[gf.index])
 
                     if not scan_results:
-                        raise Error(
-                            code='FailedToScanFunction',
-                            message=f'Failed to scan function: {f_code}, scan results: {len(scan_results)}'
-                        )
+                        # left for the byte scan of the module below
+                        unresolved_funcs[f_code] = gf
+                        continue
                     func_offsets[f_code] = scan_results[-1]
                     scanned_funcs += 1
 
@@ -523,6 +524,46 @@ class Trainer(TrainerPrototype):
                         )
                     )
                     await asyncio.sleep(0.1)
+
+                if unresolved_funcs:
+                    # the bytecodes of every unresolved function are searched in a single pass over the module
+                    game_assembly_addr = game_modules[game_assembly_module_name]
+                    scan_results = self._os_api.scan_memory_many(
+                        h_process=h_process,
+                        patterns={f_code: gf.bytecodes for f_code, gf in unresolved_funcs.items()},
+                        start_address=game_assembly_addr,
+                        end_address=game_assembly_addr + self._os_api.get_module_size(
+                            h_process=h_process,
+                            module_address=game_assembly_addr
+                        ),
+                        max_results=max(gf.index for gf in unresolved_funcs.values()) + 1,
+                        max_workers=SCAN_MAX_WORKERS
+                    )
+
+                    for f_code, gf in unresolved_funcs.items():
+                        f_addresses = scan_results[f_code]
+                        if len(f_addresses) == 1:
+                            f_address = f_addresses[0]
+                        elif len(f_addresses) >= gf.index + 1:
+                            f_address = f_addresses[gf.index]
+                        else:
+                            raise Error(
+                                code='FailedToScanFunction',
+                                message=f'Failed to scan function: {f_code}, scan results: {len(f_addresses)}'
+                            )
+                        func_offsets[f_code] = f_address - game_assembly_addr
+                        scanned_funcs += 1
+
+                    await self._websocket_server.send_message(
+                        self._websocket_server.client_connection,
+                        message=Message(
+                            type=STARTING_ENGINE_PROGRESS_WS_MSG_TYPE,
+                            data=dict(
+                                progress=scanned_funcs / total_funcs,
+                                first_time=first_time
+                            )
+                        )
+                    )
                 engine = UnityMegaMUEngine(
                     autologin_settings=autologin_settings,
                     game_server=self._game_server,
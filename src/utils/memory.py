@@ -0,0 +1,146 @@
+import bisect
+import ctypes
+import struct
+import threading
+
+from src.constants.os import THREAD_BUFFER_MAX_SIZE, READ_OK, READ_PARTIAL, READ_UNMAPPED
+
+U8 = struct.Struct('<B')
+U16 = struct.Struct('<H')
+U32 = struct.Struct('<I')
+U64 = struct.Struct('<Q')
+I8 = struct.Struct('<b')
+I16 = struct.Struct('<h')
+I32 = struct.Struct('<i')
+I64 = struct.Struct('<q')
+F32 = struct.Struct('<f')
+F64 = struct.Struct('<d')
+
+INT_STRUCTS = {
+    (1, False): U8,
+    (2, False): U16,
+    (4, False): U32,
+    (8, False): U64,
+    (1, True): I8,
+    (2, True): I16,
+    (4, True): I32,
+    (8, True): I64,
+}
+
+_thread_buffers = threading.local()
+
+
+def get_thread_buffer(size: int, name: str = 'default') -> ctypes.Array:
+    # a ctypes buffer of at least size bytes reused by every call of the thread with the same name,
+    # its content is only valid until the next call. buffers above THREAD_BUFFER_MAX_SIZE aren't kept
+    if size > THREAD_BUFFER_MAX_SIZE:
+        return ctypes.create_string_buffer(size)
+
+    buffers = getattr(_thread_buffers, 'buffers', None)
+    if buffers is None:
+        buffers = _thread_buffers.buffers = {}
+
+    buffer = buffers.get(name)
+    if buffer is None or len(buffer) < size:
+        capacity = 64
+        while capacity < size:
+            capacity *= 2
+        buffer = buffers[name] = ctypes.create_string_buffer(capacity)
+    return buffer
+
+
+def read_status(read: int, size: int) -> int:
+    if read >= size:
+        return READ_OK
+    if read > 0:
+        return READ_PARTIAL
+    return READ_UNMAPPED
+
+
+def as_ctypes_buffer(buffer: bytearray | memoryview | ctypes.Array, offset: int, size: int) -> ctypes.Array:
+    # a ctypes view of buffer[offset:offset + size], nothing is copied
+    return (ctypes.c_char * size).from_buffer(buffer, offset)
+
+
+def coalesce_spans(
+        spans: list[tuple[int, int]],
+        max_gap: int = 0,
+        max_read_size: int = None,
+        min_address: int = 1,
+        boundaries: list[int] = None,
+) -> list[tuple[int, int, list[int]]]:
+    # merge adjacent/overlapping/nearby spans into (address, size, span indexes) reads,
+    # spans below min_address are dropped. spans are never merged across one of the sorted
+    # boundaries, a read over a readable/unreadable border fails as a whole
+    order = sorted(
+        (index for index, (address, size) in enumerate(spans) if address >= min_address and size > 0),
+        key=lambda i: spans[i][0]
+    )
+
+    results = []
+
+    current_start = None
+    current_end = None
+    current_limit = None
+    current_indexes = []
+
+    for index in order:
+        address, size = spans[index]
+        end = address + size
+
+        if current_start is not None:
+            merged_end = max(current_end, end)
+            within_gap = address <= current_end + max_gap
+            within_size = max_read_size is None or (merged_end - current_start) <= max_read_size
+            within_region = current_limit is None or merged_end <= current_limit
+            if within_gap and within_size and within_region:
+                current_end = merged_end
+                current_indexes.append(index)
+                continue
+
+            results.append((current_start, current_end - current_start, current_indexes))
+
+        current_start = address
+        current_end = end
+        current_indexes = [index]
+
+        current_limit = None
+        if boundaries:
+            boundary_index = bisect.bisect_right(boundaries, address)
+            if boundary_index < len(boundaries):
+                current_limit = boundaries[boundary_index]
+
+    if current_start is not None:
+        results.append((current_start, current_end - current_start, current_indexes))
+
+    return results
+
+
+def merge_writes(writes: list[tuple[int, bytes]]) -> list[tuple[int, bytes]]:
+    # merge (address, data) writes into the fewest contiguous writes in address order,
+    # where writes overlap the later one wins
+    order = sorted(range(len(writes)), key=lambda i: writes[i][0])
+
+    groups = []
+    current_end = None
+    for index in order:
+        address, data = writes[index]
+        if not data:
+            continue
+        if current_end is not None and address <= current_end:
+            groups[-1].append(index)
+            current_end = max(current_end, address + len(data))
+            continue
+        groups.append([index])
+        current_end = address + len(data)
+
+    results = []
+    for group in groups:
+        start = writes[group[0]][0]
+        end = max(writes[index][0] + len(writes[index][1]) for index in group)
+        merged = bytearray(end - start)
+        for index in sorted(group):
+            address, data = writes[index]
+            merged[address - start:address - start + len(data)] = data
+        results.append((start, bytes(merged)))
+    return results
@@ -0,0 +1,198 @@
+import mmap
+import struct
+from typing import Callable, NamedTuple
+
+from src.constants.os import (
+    DOS_HEADER_SIZE,
+    E_LFANEW_OFFSET,
+    E_LFANEW_SIZE,
+    PE_HEADER_SIZE,
+    PE_SIGNATURE_SIZE,
+    VALID_PE_SIGNATURE,
+    OPTIONAL_HEADER_OFFSET,
+    OPTIONAL_HEADER_SIZE,
+    SIZE_OF_IMAGE_OFFSET,
+    SIZE_OF_IMAGE_SIZE,
+    SYS32,
+    SYS64,
+    SYS32_DATA_DIR_OFFSET,
+    SYS64_DATA_DIR_OFFSET,
+    DATA_DIR_SIZE,
+    EXPORT_TABLE_SIZE,
+    NUM_OF_FUNC_OFFSET,
+    NUM_OF_FUNC_SIZE,
+    NUM_OF_NAME_OFFSET,
+    NUM_OF_NAME_SIZE,
+    FUNC_RVA_ARRAY_RAV_OFFSET,
+    FUNC_RVA_ARRAY_RAV_SIZE,
+    FUNC_NAME_RVA_ARRAY_RAV_OFFSET,
+    FUNC_NAME_RVA_ARRAY_RAV_SIZE,
+    FUNC_ORDINAL_RVA_ARRAY_OFFSET,
+    FUNC_ORDINAL_RVA_ARRAY_SIZE,
+    MAX_NUM_OF_NAME,
+    FUNC_NAME_SIZE,
+    FUNC_ORDINAL_SIZE,
+    FUNC_RVA_SIZE,
+    FUNC_NAME_RAV_ARRAY_ITEM_SIZE,
+    NUMBER_OF_SECTIONS_OFFSET,
+    TIME_DATE_STAMP_OFFSET,
+    SIZE_OF_OPTIONAL_HEADER_OFFSET,
+    SECTION_HEADER_FORMAT,
+    SECTION_HEADER_SIZE,
+)
+
+# read(rva, size) of an image, it may return less than size bytes
+ImageReader = Callable[[int, int], bytes]
+
+
+class PESection(NamedTuple):
+    virtual_address: int
+    virtual_size: int
+    raw_pointer: int
+    raw_size: int
+
+
+class PEHeaders(NamedTuple):
+    timestamp: int
+    size_of_image: int
+    export_rva: int
+    export_size: int
+    sections: list[PESection]
+
+
+def _read_exact(read: ImageReader, rva: int, size: int, what: str) -> bytes:
+    data = read(rva, size)
+    if len(data) < size:
+        raise OSError(f'Failed to read {what} at: {hex(rva)}')
+    return data
+
+
+def _uint(data: bytes, offset: int, size: int) -> int:
+    return int.from_bytes(data[offset:offset + size], byteorder='little')
+
+
+def parse_pe_headers(read: ImageReader) -> PEHeaders:
+    dos_header = _read_exact(read, 0, DOS_HEADER_SIZE, 'DOS header')
+    e_lfanew = _uint(dos_header, E_LFANEW_OFFSET, E_LFANEW_SIZE)
+
+    pe_header = _read_exact(read, e_lfanew, PE_HEADER_SIZE, 'PE header')
+    signature = _uint(pe_header, 0, PE_SIGNATURE_SIZE)
+    if signature != VALID_PE_SIGNATURE:
+        raise OSError(f'Invalid PE signature: {hex(signature)}')
+
+    magic = _uint(pe_header, OPTIONAL_HEADER_OFFSET, OPTIONAL_HEADER_SIZE)
+    if magic not in (SYS32, SYS64):
+        raise OSError(f'Not a valid PE32 or PE32+ file: {magic}')
+
+    data_dir_offset = OPTIONAL_HEADER_OFFSET + (SYS32_DATA_DIR_OFFSET if magic == SYS32 else SYS64_DATA_DIR_OFFSET)
+
+    section_count = _uint(pe_header, NUMBER_OF_SECTIONS_OFFSET, 2)
+    section_table_rva = e_lfanew + OPTIONAL_HEADER_OFFSET + _uint(pe_header, SIZE_OF_OPTIONAL_HEADER_OFFSET, 2)
+    section_table = _read_exact(read, section_table_rva, section_count * SECTION_HEADER_SIZE, 'section table')
+    sections = [
+        PESection(virtual_address, virtual_size, raw_pointer, raw_size)
+        for _, virtual_size, virtual_address, raw_size, raw_pointer in struct.iter_unpack(
+            SECTION_HEADER_FORMAT, section_table
+        )
+    ]
+
+    return PEHeaders(
+        timestamp=_uint(pe_header, TIME_DATE_STAMP_OFFSET, 4),
+        size_of_image=_uint(pe_header, OPTIONAL_HEADER_OFFSET + SIZE_OF_IMAGE_OFFSET, SIZE_OF_IMAGE_SIZE),
+        export_rva=_uint(pe_header, data_dir_offset, DATA_DIR_SIZE),
+        export_size=_uint(pe_header, data_dir_offset + DATA_DIR_SIZE, DATA_DIR_SIZE),
+        sections=sections,
+    )
+
+
+def rva_to_file_offset(sections: list[PESection], rva: int) -> int | None:
+    # the headers come before the first section and are mapped as they are in the file
+    if not sections or rva < min(section.virtual_address for section in sections):
+        return rva
+
+    for section in sections:
+        if section.virtual_address <= rva < section.virtual_address + max(section.virtual_size, section.raw_size):
+            offset = rva - section.virtual_address
+            if offset >= section.raw_size:
+                # zero filled tail of the section, not in the file
+                return None
+            return section.raw_pointer + offset
+    return None
+
+
+def parse_exports(read: ImageReader, headers: PEHeaders, max_names: int = MAX_NUM_OF_NAME) -> dict[str, int]:
+    # exported function names to their RVA. the name, ordinal and function arrays are read
+    # once each and the names come from one read of the string pool
+    if not headers.export_rva:
+        raise OSError('Export RVA is 0, no export table found')
+
+    export_table = _read_exact(read, headers.export_rva, EXPORT_TABLE_SIZE, 'export table')
+
+    num_of_funcs = _uint(export_table, NUM_OF_FUNC_OFFSET, NUM_OF_FUNC_SIZE)
+    num_of_names = min(_uint(export_table, NUM_OF_NAME_OFFSET, NUM_OF_NAME_SIZE), max_names)
+    func_rva_array_rva = _uint(export_table, FUNC_RVA_ARRAY_RAV_OFFSET, FUNC_RVA_ARRAY_RAV_SIZE)
+    name_rva_array_rva = _uint(export_table, FUNC_NAME_RVA_ARRAY_RAV_OFFSET, FUNC_NAME_RVA_ARRAY_RAV_SIZE)
+    ordinal_array_rva = _uint(export_table, FUNC_ORDINAL_RVA_ARRAY_OFFSET, FUNC_ORDINAL_RVA_ARRAY_SIZE)
+
+    result = dict()
+    if not num_of_names:
+        return result
+
+    name_rvas = struct.unpack(
+        f'<{num_of_names}I',
+        _read_exact(read, name_rva_array_rva, num_of_names * FUNC_NAME_RAV_ARRAY_ITEM_SIZE, 'name RVAs')
+    )
+    ordinals = struct.unpack(
+        f'<{num_of_names}H',
+        _read_exact(read, ordinal_array_rva, num_of_names * FUNC_ORDINAL_SIZE, 'ordinals')
+    )
+    func_rvas = struct.unpack(
+        f'<{num_of_funcs}I',
+        _read_exact(read, func_rva_array_rva, num_of_funcs * FUNC_RVA_SIZE, 'function RVAs')
+    )
+
+    # the names are packed together, usually inside the export directory
+    valid_name_rvas = [rva for rva in name_rvas if rva]
+    pool_start = min(valid_name_rvas, default=0)
+    pool_end = max(valid_name_rvas, default=0) + FUNC_NAME_SIZE
+    export_end = headers.export_rva + headers.export_size
+    if headers.export_rva <= pool_start and max(valid_name_rvas, default=0) < export_end:
+        pool_end = export_end
+    pool = read(pool_start, pool_end - pool_start) if valid_name_rvas else b''
+
+    for name_rva, ordinal in zip(name_rvas, ordinals):
+        if not name_rva or ordinal >= num_of_funcs:
+            continue
+
+        offset = name_rva - pool_start
+        end = pool.find(b'\x00', offset, offset + FUNC_NAME_SIZE)
+        if end == -1:
+            # the pool read came back short, read the name on its own
+            name = read(name_rva, FUNC_NAME_SIZE)
+            end = name.find(b'\x00')
+            if end == -1:
+                continue
+            name = name[:end]
+        else:
+            name = pool[offset:end]
+
+        result[name.decode('utf-8', errors='replace')] = func_rvas[ordinal]
+
+    return result
+
+
+def read_file_exports(filepath: str, max_names: int = MAX_NUM_OF_NAME) -> dict[str, int]:
+    # parse_exports of a PE file on disk, RVAs are translated to file offsets through the sections
+    with open(filepath, 'rb') as rf:
+        with mmap.mmap(rf.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            sections = []
+
+            def read(rva: int, size: int) -> bytes:
+                offset = rva_to_file_offset(sections, rva)
+                if offset is None:
+                    return b''
+                return mm[offset:offset + size]
+
+            headers = parse_pe_headers(read)
+            sections.extend(headers.sections)
+            return parse_exports(read, headers, max_names=max_names)
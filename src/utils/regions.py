@@ -0,0 +1,144 @@
+import bisect
+import time
+from typing import NamedTuple
+
+from pydantic import PrivateAttr
+
+from src.bases.models import BaseModel
+from src.constants.os import MAX_ADDRESS
+
+
+class MemoryRegion(NamedTuple):
+    start: int
+    end: int
+    protection: int  # as reported by the backend
+    readable: bool
+
+
+class RegionMap(BaseModel):
+    # committed regions of a process sorted by address, lookups are O(log n)
+    _regions: list[MemoryRegion] = PrivateAttr()
+    _starts: list[int] = PrivateAttr()
+    _boundaries: list[int] = PrivateAttr()
+    _refreshed_at: float = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._regions = []
+        self._starts = []
+        self._boundaries = []
+        self._refreshed_at = 0.0
+
+    @property
+    def regions(self) -> list[MemoryRegion]:
+        return list(self._regions)
+
+    @property
+    def refreshed_at(self) -> float:
+        return self._refreshed_at
+
+    @property
+    def boundaries(self) -> list[int]:
+        # sorted addresses where readability changes, a read crossing one of them fails
+        return self._boundaries
+
+    def invalidate(self) -> None:
+        self._refreshed_at = 0.0
+
+    def replace(self, regions: list[MemoryRegion]) -> None:
+        self._regions = sorted(regions)
+        self._reindex()
+        self._refreshed_at = time.monotonic()
+
+    def update_range(self, start: int, end: int, regions: list[MemoryRegion]) -> None:
+        # regions are the fresh query of [start, end), they may reach past it
+        if regions:
+            start = min(start, regions[0].start)
+            end = max(end, regions[-1].end)
+
+        kept = [region for region in self._regions if region.end <= start or region.start >= end]
+        self._regions = sorted(kept + regions)
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._starts = [region.start for region in self._regions]
+
+        boundaries = []
+        readable_end = None
+        for region in self._regions:
+            if region.readable and readable_end == region.start:
+                readable_end = region.end
+                continue
+            if readable_end is not None:
+                boundaries.append(readable_end)
+            if region.readable:
+                boundaries.append(region.start)
+                readable_end = region.end
+            else:
+                readable_end = None
+        if readable_end is not None:
+            boundaries.append(readable_end)
+
+        self._boundaries = boundaries
+
+    def find(self, address: int) -> MemoryRegion | None:
+        index = bisect.bisect_right(self._starts, address) - 1
+        if index < 0:
+            return None
+        region = self._regions[index]
+        if address >= region.end:
+            return None
+        return region
+
+    def _covers(self, address: int, size: int, readable: bool) -> bool:
+        index = bisect.bisect_right(self._starts, address) - 1
+        if index < 0:
+            return False
+
+        end = address + size
+        current = address
+        while index < len(self._regions):
+            region = self._regions[index]
+            if region.start > current or (readable and not region.readable):
+                return False
+            current = region.end
+            if current >= end:
+                return True
+            index += 1
+        return False
+
+    def is_mapped(self, address: int, size: int = 1) -> bool:
+        return self._covers(address, size, readable=False)
+
+    def is_readable(self, address: int, size: int = 1) -> bool:
+        return self._covers(address, size, readable=True)
+
+    def is_unreadable(self, address: int) -> bool:
+        # only a committed region without read access is known to be unreadable,
+        # a gap may have been mapped since the last refresh
+        region = self.find(address)
+        return region is not None and not region.readable
+
+    def readable_ranges(self, start_address: int = None, end_address: int = None) -> list[tuple[int, int]]:
+        # (start, end) of the readable memory, adjacent regions are merged and the ranges clipped
+        if start_address is None:
+            start_address = 0
+        if end_address is None:
+            end_address = MAX_ADDRESS
+
+        results = []
+        index = max(bisect.bisect_right(self._starts, start_address) - 1, 0)
+        for region in self._regions[index:]:
+            if region.start >= end_address:
+                break
+            if not region.readable or region.end <= start_address:
+                continue
+
+            start = max(region.start, start_address)
+            end = min(region.end, end_address)
+            if results and results[-1][1] == start:
+                results[-1] = (results[-1][0], end)
+            else:
+                results.append((start, end))
+        return results
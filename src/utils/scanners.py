@@ -0,0 +1,367 @@
+import mmap
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable
+
+from pydantic import PrivateAttr
+
+from src.bases.models import BaseModel
+from src.utils import hex_string_to_int_list
+from src.constants.os import SCAN_SEGMENT_SIZE
+
+
+class BytePattern(BaseModel):
+    # array of bytes pattern, None is a wildcard byte
+    pattern: list[int | None]
+
+    _anchor: bytes = PrivateAttr()
+    _anchor_offset: int = PrivateAttr()
+    _regex: re.Pattern = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        # the longest run of literal bytes is searched with bytes.find, the rest is only
+        # verified at the candidates it finds
+        self._anchor = b''
+        self._anchor_offset = 0
+
+        run_start = None
+        for index, byte in enumerate(self.pattern + [None]):
+            if byte is not None:
+                if run_start is None:
+                    run_start = index
+                continue
+            if run_start is not None and index - run_start > len(self._anchor):
+                self._anchor = bytes(self.pattern[run_start:index])
+                self._anchor_offset = run_start
+            run_start = None
+
+        self._regex = re.compile(
+            b''.join(b'.' if byte is None else re.escape(bytes([byte])) for byte in self.pattern),
+            re.DOTALL
+        )
+
+    @classmethod
+    def from_hex(cls, pattern: str | list[str]) -> 'BytePattern':
+        return cls(pattern=hex_string_to_int_list(''.join(pattern).replace(' ', '')))
+
+    @property
+    def length(self) -> int:
+        return len(self.pattern)
+
+    def find_all(self,
+                 data: bytes | mmap.mmap,
+                 base_address: int = 0,
+                 max_results: int = 1,
+                 last_match: int = None,
+                 ) -> list[int]:
+        # matches never overlap, a match must start after the end of the previous one
+        results = []
+
+        length = len(self.pattern)
+        if not length:
+            return results
+
+        limit = len(data) - length
+        anchor_length = len(self._anchor)
+
+        offset = 0
+        if last_match is not None:
+            offset = max(offset, last_match + length + 1 - base_address)
+
+        while offset <= limit:
+            position = data.find(
+                self._anchor,
+                offset + self._anchor_offset,
+                limit + self._anchor_offset + anchor_length
+            )
+            if position == -1:
+                break
+
+            candidate = position - self._anchor_offset
+            if self._regex.match(data, candidate):
+                results.append(base_address + candidate)
+                if len(results) >= max_results:
+                    break
+                offset = candidate + length + 1
+            else:
+                offset = candidate + 1
+
+        return results
+
+
+def scan_range(read: Callable[[int, int], bytes],
+               pattern: BytePattern,
+               start_address: int,
+               end_address: int,
+               max_results: int = 1,
+               chunk_size: int = 1024 * 1024,
+               last_match: int = None,
+               ) -> list[int]:
+    # chunks overlap by the pattern length - 1 so matches across chunk borders are found,
+    # an unreadable chunk ends the scan of the range
+    results = []
+
+    length = pattern.length
+    if not length:
+        return results
+
+    current_address = start_address
+    while current_address + length <= end_address and len(results) < max_results:
+        read_size = min(chunk_size + length - 1, end_address - current_address)
+        try:
+            data = read(current_address, read_size)
+        except OSError:
+            break
+
+        matches = pattern.find_all(
+            data,
+            base_address=current_address,
+            max_results=max_results - len(results),
+            last_match=last_match
+        )
+        if matches:
+            results.extend(matches)
+            last_match = matches[-1]
+
+        if len(data) < read_size:
+            break
+        current_address += read_size - length + 1
+
+    return results
+
+
+class BytePatternSet(BaseModel):
+    # several patterns searched in the same buffers, a chunked scan reads the memory once
+    # whatever the number of patterns. results are keyed like the patterns
+    patterns: dict[str, BytePattern]
+
+    @classmethod
+    def from_hex(cls, patterns: dict[str, str | list[str]]) -> 'BytePatternSet':
+        return cls(patterns={key: BytePattern.from_hex(pattern) for key, pattern in patterns.items()})
+
+    @property
+    def max_length(self) -> int:
+        return max((pattern.length for pattern in self.patterns.values()), default=0)
+
+    def is_complete(self, results: dict[str, list[int]], max_results: int) -> bool:
+        return all(
+            len(results[key]) >= max_results
+            for key, pattern in self.patterns.items() if pattern.length
+        )
+
+    def find_all(self,
+                 data: bytes | mmap.mmap,
+                 base_address: int = 0,
+                 max_results: int = 1,
+                 last_matches: dict[str, int] = None,
+                 results: dict[str, list[int]] = None,
+                 ) -> dict[str, list[int]]:
+        # same non overlapping semantics as BytePattern.find_all, per pattern.
+        # last_matches and results are updated in place so chunked scans can carry them over
+        if last_matches is None:
+            last_matches = {}
+        if results is None:
+            results = {key: [] for key in self.patterns}
+
+        for key, pattern in self.patterns.items():
+            if len(results[key]) >= max_results:
+                continue
+
+            matches = pattern.find_all(
+                data,
+                base_address=base_address,
+                max_results=max_results - len(results[key]),
+                last_match=last_matches.get(key)
+            )
+            if matches:
+                results[key].extend(matches)
+                last_matches[key] = matches[-1]
+
+        return results
+
+
+def scan_range_many(read: Callable[[int, int], bytes],
+                    patterns: BytePatternSet,
+                    start_address: int,
+                    end_address: int,
+                    max_results: int = 1,
+                    chunk_size: int = 1024 * 1024,
+                    last_matches: dict[str, int] = None,
+                    results: dict[str, list[int]] = None,
+                    ) -> dict[str, list[int]]:
+    # a single pass over the range for all patterns, chunks overlap by the longest pattern - 1
+    if last_matches is None:
+        last_matches = {}
+    if results is None:
+        results = {key: [] for key in patterns.patterns}
+
+    length = patterns.max_length
+    if not length:
+        return results
+
+    current_address = start_address
+    while current_address < end_address and not patterns.is_complete(results, max_results):
+        read_size = min(chunk_size + length - 1, end_address - current_address)
+        try:
+            data = read(current_address, read_size)
+        except OSError:
+            break
+
+        patterns.find_all(
+            data,
+            base_address=current_address,
+            max_results=max_results,
+            last_matches=last_matches,
+            results=results
+        )
+
+        if len(data) < read_size or current_address + read_size >= end_address:
+            break
+        current_address += read_size - length + 1
+
+    return results
+
+
+def split_regions(regions: Iterable[tuple[int, int]],
+                  length: int,
+                  segment_size: int = SCAN_SEGMENT_SIZE,
+                  ) -> list[tuple[int, int]]:
+    # segments of a region overlap by length - 1 bytes, a match always starts in the segment that finds it
+    segments = []
+    for start, end in regions:
+        current = start
+        while current < end:
+            segment_end = min(current + segment_size, end)
+            segments.append((current, min(segment_end + length - 1, end)))
+            current = segment_end
+    return segments
+
+
+def scan_regions(read: Callable[[int, int], bytes],
+                 pattern: BytePattern,
+                 regions: Iterable[tuple[int, int]],
+                 max_results: int = 1,
+                 chunk_size: int = 1024 * 1024,
+                 max_workers: int = 1,
+                 segment_size: int = SCAN_SEGMENT_SIZE,
+                 ) -> list[int]:
+    # results are in address order whatever max_workers is. the reads release the GIL
+    # so segments are read and searched concurrently when max_workers > 1
+    results = []
+
+    if not pattern.length:
+        return results
+
+    if max_workers <= 1:
+        last_match = None
+        for start, end in regions:
+            matches = scan_range(
+                read=read,
+                pattern=pattern,
+                start_address=start,
+                end_address=end,
+                max_results=max_results - len(results),
+                chunk_size=chunk_size,
+                last_match=last_match
+            )
+            if matches:
+                results.extend(matches)
+                last_match = matches[-1]
+                if len(results) >= max_results:
+                    break
+        return results
+
+    segments = split_regions(regions, length=pattern.length, segment_size=segment_size)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(scan_range, read, pattern, start, end, max_results, chunk_size)
+            for start, end in segments
+        ]
+        try:
+            last_match = None
+            for (start, end), future in zip(segments, futures):
+                matches = future.result()
+                if matches and last_match is not None and matches[0] <= last_match + pattern.length:
+                    # overlaps a match of the previous segment, redo it the way a sequential scan would
+                    matches = scan_range(read, pattern, start, end, max_results, chunk_size, last_match)
+
+                matches = matches[:max_results - len(results)]
+                if matches:
+                    results.extend(matches)
+                    last_match = matches[-1]
+                    if len(results) >= max_results:
+                        break
+        finally:
+            for future in futures:
+                future.cancel()
+
+    return results
+
+
+def scan_regions_many(read: Callable[[int, int], bytes],
+                      patterns: BytePatternSet,
+                      regions: Iterable[tuple[int, int]],
+                      max_results: int = 1,
+                      chunk_size: int = 1024 * 1024,
+                      max_workers: int = 1,
+                      segment_size: int = SCAN_SEGMENT_SIZE,
+                      ) -> dict[str, list[int]]:
+    # scan_regions for a pattern set, every segment is read once for all patterns
+    results = {key: [] for key in patterns.patterns}
+
+    if not patterns.max_length:
+        return results
+
+    if max_workers <= 1:
+        last_matches = {}
+        for start, end in regions:
+            scan_range_many(
+                read=read,
+                patterns=patterns,
+                start_address=start,
+                end_address=end,
+                max_results=max_results,
+                chunk_size=chunk_size,
+                last_matches=last_matches,
+                results=results
+            )
+            if patterns.is_complete(results, max_results):
+                break
+        return results
+
+    segments = split_regions(regions, length=patterns.max_length, segment_size=segment_size)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(scan_range_many, read, patterns, start, end, max_results, chunk_size)
+            for start, end in segments
+        ]
+        try:
+            last_matches = {}
+            for (start, end), future in zip(segments, futures):
+                segment_results = future.result()
+                # shorter patterns can match in the overlap too, the next segment reports those
+                segment_end = min(start + segment_size, end)
+                for key, matches in segment_results.items():
+                    matches = [address for address in matches if address < segment_end]
+                    pattern = patterns.patterns[key]
+                    last_match = last_matches.get(key)
+                    if matches and last_match is not None and matches[0] <= last_match + pattern.length:
+                        matches = scan_range(read, pattern, start, end, max_results, chunk_size, last_match)
+                        matches = [address for address in matches if address < segment_end]
+
+                    matches = matches[:max_results - len(results[key])]
+                    if matches:
+                        results[key].extend(matches)
+                        last_matches[key] = matches[-1]
+
+                if patterns.is_complete(results, max_results):
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+
+    return results
@@ -1,17 +1,22 @@
 import datetime
+import struct
+from array import array
+from collections import OrderedDict
+from typing import NamedTuple
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from src.bases.models import BaseModel
 from src.bases.os import OperatingSystemAPIPrototype
+from src.constants.os import READ_OK
 from src.constants.type_parsers.csharp import *
 
 
-class CSharpDictEntry(BaseModel):
+class CSharpDictEntry(NamedTuple):
     hash_code: int
     next_index: int
-    value: int
     key: int
+    value: int
 
 
 class CSharpDict(BaseModel):
@@ -28,6 +33,39 @@ class CSharpTypeParser(BaseModel):
     pid: int
     h_process: int
 
+    # (address, options) -> ((items/entries address, count, version), decoded collection)
+    _collections: dict[tuple, tuple[tuple[int, int, int], CSharpList | CSharpDict]] = PrivateAttr()
+    # (address, is_32bit) -> (char count, first characters as bytes, decoded string), least recently used first
+    _strings: OrderedDict[tuple[int, bool], tuple[int, bytes, str]] = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._collections = {}
+        self._strings = OrderedDict()
+
+    def _read_collection_header(self, address: int) -> tuple[int, int, int] | None:
+        status, data = self.os_api.try_read(
+            h_process=self.h_process,
+            address=address,
+            size=struct.calcsize(GENERIC_COLLECTION_HEADER_FORMAT),
+        )
+        if status != READ_OK:
+            return None
+        return struct.unpack(GENERIC_COLLECTION_HEADER_FORMAT, data)
+
+    def _get_cached_collection(self, key: tuple, stamp: tuple[int, int, int]) -> CSharpList | CSharpDict | None:
+        cached = self._collections.get(key)
+        if cached is None or cached[0] != stamp:
+            return None
+        return cached[1]
+
+    def _cache_collection(self, key: tuple, stamp: tuple[int, int, int], collection: CSharpList | CSharpDict) -> None:
+        self._collections.pop(key, None)
+        if len(self._collections) >= GENERIC_COLLECTION_CACHE_MAX_SIZE:
+            self._collections.pop(next(iter(self._collections)))
+        self._collections[key] = (stamp, collection)
+
     def parse_datetime(self, address: int) -> datetime.datetime:
         value = self.os_api.get_value_from_pointer(
             h_process=self.h_process,
@@ -50,52 +88,85 @@ class CSharpTypeParser(BaseModel):
         if not count:
             return CSharpList(items=[])
 
-        items_as_bytes = self.os_api.read_memory(
+        items = array('Q')
+        items.frombytes(self.os_api.read_memory(
             h_process=self.h_process,
             address=address + LIST_FIRST_ITEM_OFFSET,
-            size=count * 8
-        )
-
-        items = []
+            size=count * items.itemsize
+        ))
 
-        for i in range(count):
-            item_addr = int.from_bytes(
-                items_as_bytes[i * 8: (i + 1) * 8],
-                byteorder='little'
-            )
-            if not item_addr and not keep_none:
-                continue
-
-            items.append(item_addr)
-
-        return CSharpList(items=items)
+        # decoded in bulk, the models skip validation since the values come straight from memory
+        if keep_none:
+            return CSharpList.model_construct(items=items.tolist())
+        return CSharpList.model_construct(items=[item for item in items if item])
 
     def parse_generic_list(self,
                            address: int,
                            keep_none: bool = False,
+                           use_version: bool = False,
                            ) -> CSharpList:
-        item_list_addr = self.os_api.get_value_from_pointer(
-            h_process=self.h_process,
-            pointer=address + GENERIC_LIST_ITEM_LIST_OFFSET,
-        )
-        return self.parse_list(item_list_addr, keep_none=keep_none)
+        # with use_version the items are only decoded again when the list's _items, _size or _version
+        # changed since the last call, the items themselves are not watched
+        if not use_version:
+            item_list_addr = self.os_api.get_value_from_pointer(
+                h_process=self.h_process,
+                pointer=address + GENERIC_LIST_ITEM_LIST_OFFSET,
+            )
+            return self.parse_list(item_list_addr, keep_none=keep_none)
+
+        stamp = self._read_collection_header(address + GENERIC_LIST_ITEM_LIST_OFFSET)
+        if stamp is None:
+            return CSharpList(items=[])
+
+        key = (address, 'list', keep_none)
+        result = self._get_cached_collection(key, stamp)
+        if result is None:
+            result = self.parse_list(stamp[0], keep_none=keep_none)
+            self._cache_collection(key, stamp, result)
+        return result
 
-    def parse_generic_dict(self, address: int, is_32bit: bool = False) -> CSharpDict:
+    def parse_generic_dict(self,
+                           address: int,
+                           is_32bit: bool = False,
+                           keep_free: bool = False,
+                           use_version: bool = False,
+                           ) -> CSharpDict:
         # https://referencesource.microsoft.com/#mscorlib/system/collections/generic/dictionary.cs,6d8e35702d74cf71
+        # free entries (removed keys) are dropped unless keep_free is set. with use_version the entries
+        # are only decoded again when the entries array, count or version changed since the last call
         header_size = GENERIC_DICT_32BIT_HEADER_LENGTH if is_32bit else GENERIC_DICT_64BIT_HEADER_LENGTH
-        count_offset = header_size + GENERIC_DICT_BUCKET_ADDR_LENGTH + GENERIC_DICT_ENTRY_LIST_ADDR_LENGTH
+        entry_list_offset = header_size + GENERIC_DICT_BUCKET_ADDR_LENGTH
+        count_offset = entry_list_offset + GENERIC_DICT_ENTRY_LIST_ADDR_LENGTH
+
+        if use_version:
+            stamp = self._read_collection_header(address + entry_list_offset)
+            if stamp is None:
+                return CSharpDict(entries=[], count=0)
+
+            key = (address, 'dict', is_32bit, keep_free)
+            result = self._get_cached_collection(key, stamp)
+            if result is None:
+                result = self._decode_dict_entries(stamp[0], stamp[1], keep_free=keep_free)
+                self._cache_collection(key, stamp, result)
+            return result
 
         count = self.os_api.get_value_from_pointer(
             h_process=self.h_process,
             pointer=address + count_offset,
             value_size=GENERIC_DICT_COUNT_LENGTH
         )
+        if not count:
+            return CSharpDict(entries=[], count=0)
 
-        entry_list_offset = header_size + GENERIC_DICT_BUCKET_ADDR_LENGTH
         entry_list_addr = self.os_api.get_value_from_pointer(
             h_process=self.h_process,
             pointer=address + entry_list_offset,
         )
+        return self._decode_dict_entries(entry_list_addr, count, keep_free=keep_free)
+
+    def _decode_dict_entries(self, entry_list_addr: int, count: int, keep_free: bool = False) -> CSharpDict:
+        if count <= 0:
+            return CSharpDict(entries=[], count=0)
 
         byte_entries = self.os_api.read_memory(
             h_process=self.h_process,
@@ -103,42 +174,91 @@ class CSharpTypeParser(BaseModel):
             size=GENERIC_DICT_ENTRY_LENGTH * count
         )
 
-        entries = []
-
-        entry_hash_code_size = 4
-        entry_next_index_size = 4
-        entry_value_size = 8
-        entry_key_size = 8
-
-        for i in range(count):
-            byte_entry = byte_entries[i * GENERIC_DICT_ENTRY_LENGTH:(i + 1) * GENERIC_DICT_ENTRY_LENGTH]
-            hash_code_offset = 0
-            hash_code = byte_entry[hash_code_offset:(hash_code_offset + entry_hash_code_size)]
-            next_index_offset = hash_code_offset + entry_hash_code_size
-            next_index = byte_entry[next_index_offset:(next_index_offset + entry_next_index_size)]
-            key_offset = next_index_offset + entry_next_index_size
-            key = byte_entry[key_offset:(key_offset + entry_key_size)]
-            value_offset = key_offset + entry_key_size
-            value = byte_entry[value_offset: (value_offset + entry_value_size)]
-
-            entries.append(CSharpDictEntry(
-                key=int.from_bytes(key, 'little'),
-                value=int.from_bytes(value, 'little'),
-                hash_code=int.from_bytes(hash_code, 'little'),
-                next_index=int.from_bytes(next_index, 'little'),
-            ))
-
-        return CSharpDict(
+        entries = [
+            CSharpDictEntry(*entry)
+            for entry in struct.iter_unpack(GENERIC_DICT_ENTRY_FORMAT, byte_entries)
+            if keep_free or entry[0] != GENERIC_DICT_FREE_ENTRY_HASH_CODE
+        ]
+
+        return CSharpDict.model_construct(
             entries=entries,
             count=count
         )
 
     def parse_string(self, address: int, is_32bit: bool = False) -> str:
-        if not address:
-            return ''
+        return self.parse_strings([address], is_32bit=is_32bit)[0]
+
+    def parse_strings(self, addresses: list[int], is_32bit: bool = False) -> list[str]:
+        # the header and the first characters of every string come from one batched read, only the
+        # longer strings need a second one. strings are immutable, a cached string is reused when its
+        # length and first characters still match what's at its address
+        results = [''] * len(addresses)
 
         # Skip object header (8 bytes for 32-bit, 16 bytes for 64-bit)
         header_size = STRING_32BIT_HEADER_LENGTH if is_32bit else STRING_64BIT_HEADER_LENGTH
+        chars_offset = header_size + STRING_CHAR_COUNT_LENGTH
+        speculative_size = chars_offset + STRING_SPECULATIVE_CHAR_COUNT * 2
+
+        indexes = [index for index, address in enumerate(addresses) if address]
+        heads = self.os_api.read_many(
+            h_process=self.h_process,
+            requests=[(addresses[index], speculative_size) for index in indexes]
+        )
+
+        long_strings = []
+        for index, head in zip(indexes, heads):
+            address = addresses[index]
+            if head is None:
+                # the string ends right before unreadable memory
+                results[index] = self._read_string(address, is_32bit=is_32bit)
+                continue
+
+            char_count = int.from_bytes(head[header_size:chars_offset], byteorder='little')
+            if not char_count:
+                continue
+
+            key = (address, is_32bit)
+            prefix = bytes(head[chars_offset:chars_offset + min(char_count, STRING_SPECULATIVE_CHAR_COUNT) * 2])
+
+            cached = self._strings.get(key)
+            if cached is not None and cached[0] == char_count and cached[1] == prefix:
+                self._strings.move_to_end(key)
+                results[index] = cached[2]
+                continue
+
+            if char_count <= STRING_SPECULATIVE_CHAR_COUNT:
+                results[index] = self._cache_string(key, char_count, prefix, prefix)
+                continue
+
+            long_strings.append((index, key, char_count, prefix))
+
+        tails = self.os_api.read_many(
+            h_process=self.h_process,
+            requests=[
+                (key[0] + speculative_size, (char_count - STRING_SPECULATIVE_CHAR_COUNT) * 2)
+                for _, key, char_count, _ in long_strings
+            ]
+        )
+        for (index, key, char_count, prefix), tail in zip(long_strings, tails):
+            if tail is None:
+                continue
+            results[index] = self._cache_string(key, char_count, prefix, prefix + bytes(tail))
+
+        return results
+
+    def _cache_string(self, key: tuple[int, bool], char_count: int, prefix: bytes, data: bytes) -> str:
+        # Decode to Python string (UTF-16 little-endian)
+        value = data.decode('utf-16-le')
+
+        self._strings[key] = (char_count, prefix, value)
+        self._strings.move_to_end(key)
+        if len(self._strings) > STRING_CACHE_MAX_SIZE:
+            self._strings.popitem(last=False)
+        return value
+
+    def _read_string(self, address: int, is_32bit: bool = False) -> str:
+        # length then payload, for strings the speculative read can't cover
+        header_size = STRING_32BIT_HEADER_LENGTH if is_32bit else STRING_64BIT_HEADER_LENGTH
 
         char_count = self.os_api.get_value_from_pointer(
             h_process=self.h_process,
@@ -156,24 +276,15 @@ class CSharpTypeParser(BaseModel):
         except OSError:
             return ''
 
-        # Decode to Python string (UTF-16 little-endian)
         return string_as_bytes.decode('utf-16-le')
 
     def write_list(self, address: int, data: list[int | None], item_length: int = 8) -> int:
-
-        item_entry_addr = address + LIST_COUNT_OFFSET + LIST_COUNT_LENGTH
-        for index, item in enumerate(data):
-            item_addr = item_entry_addr + item_length * index
-            self.os_api.write_memory(
-                h_process=self.h_process,
-                address=item_addr,
-                data=item.to_bytes(item_length, 'little')
-            )
-
+        # the count and the items are contiguous, a single write
+        items = b''.join(item.to_bytes(item_length, 'little') for item in data)
         self.os_api.write_memory(
             h_process=self.h_process,
             address=address + LIST_COUNT_OFFSET,
-            data=len(data).to_bytes(LIST_COUNT_LENGTH, 'little'),
+            data=len(data).to_bytes(LIST_COUNT_LENGTH, 'little') + items,
         )
 
         return address
@@ -0,0 +1,105 @@
+from typing import Generator, NamedTuple
+
+from pydantic import Field
+
+from src.bases.models import BaseModel
+from src.utils.type_parsers.csharp import CSharpTypeParser
+from src.utils.type_parsers.layouts import StructLayout, read_layouts, aread_layouts
+
+
+class ObjectSchema(BaseModel):
+    # what to read at an object: its layout, the objects its pointer fields lead to
+    # and the pointer fields holding strings
+    layout: StructLayout
+    children: dict[str, 'ObjectSchema'] = Field(default_factory=dict)
+    strings: list[str] = Field(default_factory=list)
+
+
+class WalkedObject(NamedTuple):
+    address: int
+    fields: dict[str, int | float]
+    # keyed by pointer field, None when the pointer is null or the object could not be read
+    children: dict[str, 'WalkedObject | None']
+    strings: dict[str, str]
+
+
+class ObjectGraphWalker(BaseModel):
+    # breadth first walk of object graphs, every depth is a single batched read whatever the
+    # number of objects and the strings of the whole walk are decoded together at the end
+    cs_type_parser: CSharpTypeParser
+
+    def walk(self, requests: list[tuple[ObjectSchema, int]]) -> list[WalkedObject | None]:
+        walk = self._walk(requests)
+        try:
+            layout_requests = next(walk)
+            while True:
+                layout_requests = walk.send(read_layouts(
+                    os_api=self.cs_type_parser.os_api,
+                    h_process=self.cs_type_parser.h_process,
+                    requests=layout_requests
+                ))
+        except StopIteration as stop:
+            return stop.value
+
+    async def awalk(self, requests: list[tuple[ObjectSchema, int]]) -> list[WalkedObject | None]:
+        # walk with the reads off the event loop
+        walk = self._walk(requests)
+        try:
+            layout_requests = next(walk)
+            while True:
+                layout_requests = walk.send(await aread_layouts(
+                    os_api=self.cs_type_parser.os_api,
+                    h_process=self.cs_type_parser.h_process,
+                    requests=layout_requests
+                ))
+        except StopIteration as stop:
+            return stop.value
+
+    def _walk(self,
+              requests: list[tuple[ObjectSchema, int]],
+              ) -> Generator[list[tuple[StructLayout, int]], list[dict | None], list[WalkedObject | None]]:
+        # yields the layouts to read at each depth, objects reached twice are read once
+        objects: dict[tuple[int, int], WalkedObject | None] = {}
+        queued = set()
+        child_links = []
+        string_links = []
+
+        level = []
+        for schema, address in requests:
+            key = (id(schema), address)
+            if address and key not in queued:
+                queued.add(key)
+                level.append((schema, address))
+
+        while level:
+            results = yield [(schema.layout, address) for schema, address in level]
+
+            next_level = []
+            for (schema, address), fields in zip(level, results):
+                if fields is None:
+                    objects[(id(schema), address)] = None
+                    continue
+
+                node = WalkedObject(address=address, fields=fields, children={}, strings={})
+                objects[(id(schema), address)] = node
+
+                for field, child_schema in schema.children.items():
+                    child_key = (id(child_schema), fields[field])
+                    child_links.append((node.children, field, child_key))
+                    if fields[field] and child_key not in queued:
+                        queued.add(child_key)
+                        next_level.append((child_schema, fields[field]))
+
+                for field in schema.strings:
+                    string_links.append((node.strings, field, fields[field]))
+
+            level = next_level
+
+        values = self.cs_type_parser.parse_strings([address for _, _, address in string_links])
+        for (strings, field, _), value in zip(string_links, values):
+            strings[field] = value
+
+        for children, field, child_key in child_links:
+            children[field] = objects.get(child_key)
+
+        return [objects.get((id(schema), address)) for schema, address in requests]
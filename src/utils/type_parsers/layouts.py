@@ -0,0 +1,159 @@
+import struct
+
+from pydantic import PrivateAttr
+
+from src.bases.errors import Error
+from src.bases.models import BaseModel
+from src.bases.os import OperatingSystemAPIPrototype
+from src.constants.type_parsers.layouts import (
+    STRUCT_LAYOUT_BYTE_ORDER,
+    STRUCT_LAYOUT_LENGTH_FORMATS,
+)
+
+
+class StructLayout(BaseModel):
+    # fields of one object: name -> (offset from the object addr, struct format)
+    name: str
+    fields: dict[str, tuple[int, str]]
+
+    _struct: struct.Struct = PrivateAttr()
+    _start: int = PrivateAttr()
+    _names: tuple[str, ...] = PrivateAttr()
+    _aliases: list[tuple[str, str]] = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        if not self.fields:
+            raise Error(message=f'Empty struct layout: {self.name}')
+
+        ordered = sorted(
+            self.fields.items(),
+            key=lambda i: (i[1][0], struct.calcsize(STRUCT_LAYOUT_BYTE_ORDER + i[1][1]))
+        )
+
+        self._start = ordered[0][1][0]
+
+        struct_format = STRUCT_LAYOUT_BYTE_ORDER
+        names = []
+        aliases = []
+
+        position = self._start
+        last_name = last_offset = last_format = None
+
+        for field_name, (offset, field_format) in ordered:
+            if offset == last_offset and field_format == last_format:
+                # same bytes declared twice, decode once
+                aliases.append((field_name, last_name))
+                continue
+
+            if offset < position:
+                raise Error(
+                    message=f'Overlapping fields in struct layout {self.name}: {last_name} and {field_name}'
+                )
+
+            if offset > position:
+                struct_format += f'{offset - position}x'
+
+            struct_format += field_format
+            position = offset + struct.calcsize(STRUCT_LAYOUT_BYTE_ORDER + field_format)
+
+            names.append(field_name)
+            last_name, last_offset, last_format = field_name, offset, field_format
+
+        self._struct = struct.Struct(struct_format)
+        self._names = tuple(names)
+        self._aliases = aliases
+
+    @classmethod
+    def from_meta(cls,
+                  name: str,
+                  meta: BaseModel,
+                  declaration: dict[str, tuple[str | int, str]],
+                  ) -> 'StructLayout':
+        # offsets and lengths can be meta attribute names, formats are plain struct formats
+        fields = {}
+        for field_name, (offset, field_format) in declaration.items():
+            if isinstance(offset, str):
+                offset = getattr(meta, offset)
+
+            if len(field_format) > 1:
+                length = getattr(meta, field_format)
+                if length not in STRUCT_LAYOUT_LENGTH_FORMATS:
+                    raise Error(message=f'Unsupported field length in struct layout {name}: {field_name}')
+                field_format = STRUCT_LAYOUT_LENGTH_FORMATS[length]
+
+            fields[field_name] = (offset, field_format)
+
+        return cls(name=name, fields=fields)
+
+    @property
+    def start(self) -> int:
+        return self._start
+
+    @property
+    def size(self) -> int:
+        return self._struct.size
+
+    def span(self, address: int) -> tuple[int, int]:
+        return address + self._start, self._struct.size
+
+    def unpack(self, data: bytes | memoryview) -> dict[str, int | float]:
+        result = dict(zip(self._names, self._struct.unpack(data)))
+        for alias, source in self._aliases:
+            result[alias] = result[source]
+        return result
+
+    def read(self,
+             os_api: OperatingSystemAPIPrototype,
+             h_process: int,
+             address: int,
+             ) -> dict[str, int | float] | None:
+        return read_layouts(os_api=os_api, h_process=h_process, requests=[(self, address)])[0]
+
+    def read_many(self,
+                  os_api: OperatingSystemAPIPrototype,
+                  h_process: int,
+                  addresses: list[int],
+                  ) -> list[dict[str, int | float] | None]:
+        return read_layouts(
+            os_api=os_api,
+            h_process=h_process,
+            requests=[(self, address) for address in addresses]
+        )
+
+
+def read_layouts(os_api: OperatingSystemAPIPrototype,
+                 h_process: int,
+                 requests: list[tuple[StructLayout, int]],
+                 ) -> list[dict[str, int | float] | None]:
+    # decode (layout, object addr) pairs, objects that could not be read are None
+    return _unpack_layouts(requests, os_api.read_many(
+        h_process=h_process,
+        requests=[layout.span(address) for layout, address in requests]
+    ))
+
+
+async def aread_layouts(os_api: OperatingSystemAPIPrototype,
+                        h_process: int,
+                        requests: list[tuple[StructLayout, int]],
+                        ) -> list[dict[str, int | float] | None]:
+    # read_layouts with the reads off the event loop
+    return _unpack_layouts(requests, await os_api.aread_many(
+        h_process=h_process,
+        requests=[layout.span(address) for layout, address in requests]
+    ))
+
+
+def _unpack_layouts(requests: list[tuple[StructLayout, int]],
+                    data_list: list[memoryview | None],
+                    ) -> list[dict[str, int | float] | None]:
+    results = []
+
+    for (layout, _), data in zip(requests, data_list):
+        if data is None:
+            results.append(None)
+            continue
+        results.append(layout.unpack(data))
+
+    return results
@@ -0,0 +1,76 @@
+import pytest
+
+from src.os.in_memory import InMemoryProcessAPI
+from src.utils.memory import coalesce_spans, merge_writes
+
+
+def test_coalesce_spans_merges_nearby_spans():
+    spans = [(0x10020, 0x8), (0x10000, 0x10), (0x10008, 0x4), (0x20000, 0x4)]
+
+    results = coalesce_spans(spans, max_gap=0x10)
+
+    assert results == [(0x10000, 0x28, [1, 2, 0]), (0x20000, 0x4, [3])]
+
+
+def test_coalesce_spans_keeps_gaps_and_drops_invalid_spans():
+    spans = [(0x10000, 0x4), (0x10010, 0x4), (0x0, 0x4), (0x10020, 0)]
+
+    results = coalesce_spans(spans, max_gap=0x8, min_address=0x10000)
+
+    assert results == [(0x10000, 0x4, [0]), (0x10010, 0x4, [1])]
+
+
+def test_coalesce_spans_respects_max_read_size():
+    spans = [(0x10000 + i * 0x10, 0x10) for i in range(4)]
+
+    results = coalesce_spans(spans, max_read_size=0x20)
+
+    assert results == [(0x10000, 0x20, [0, 1]), (0x10020, 0x20, [2, 3])]
+
+
+def test_coalesce_spans_never_crosses_a_boundary():
+    spans = [(0x10000, 0x8), (0x10008, 0x8)]
+
+    results = coalesce_spans(spans, boundaries=[0x10008])
+
+    assert results == [(0x10000, 0x8, [0]), (0x10008, 0x8, [1])]
+
+
+def test_read_many_matches_single_reads_with_fewer_reads():
+    os_api = InMemoryProcessAPI()
+    os_api.map_region(0x10000, bytes(range(256)) * 16)
+    requests = [(0x10000 + offset, 0x8) for offset in (0x0, 0x10, 0x30, 0x800, 0x808)]
+    requests.append((0x90000, 0x4))
+
+    expected = [os_api.read_memory(h_process=1, address=address, size=size) for address, size in requests[:-1]]
+    os_api.reset_counters()
+    results = os_api.read_many(h_process=1, requests=requests)
+
+    assert [bytes(data) for data in results[:-1]] == expected
+    assert results[-1] is None
+    assert os_api.read_count < len(requests)
+
+
+def test_merge_writes_merges_contiguous_writes_in_address_order():
+    writes = [(0x10004, b'\x05\x06'), (0x10000, b'\x01\x02\x03\x04'), (0x10010, b'\x10')]
+
+    assert merge_writes(writes) == [(0x10000, b'\x01\x02\x03\x04\x05\x06'), (0x10010, b'\x10')]
+
+
+def test_merge_writes_later_write_wins_where_writes_overlap():
+    writes = [(0x10000, b'\xaa\xaa\xaa\xaa'), (0x10001, b'\xbb\xbb'), (0x10006, b'')]
+
+    assert merge_writes(writes) == [(0x10000, b'\xaa\xbb\xbb\xaa')]
+
+
+def test_write_batch_stops_buffering_when_the_flush_fails():
+    os_api = InMemoryProcessAPI()
+    os_api.map_region(0x10000, bytearray(0x100))
+
+    with pytest.raises(OSError):
+        with os_api.write_batch(h_process=1):
+            os_api.write_memory(h_process=1, address=0x10000, data=b'\x01')
+            os_api.write_memory(h_process=1, address=0x90000, data=b'\x02')
+
+    os_api.write_memory(h_process=1, address=0x10010, data=b'\x03')
+    assert os_api.read_memory(h_process=1, address=0x10010, size=1) == b'\x03'
@@ -0,0 +1,46 @@
+import asyncio
+import threading
+
+from pydantic import PrivateAttr
+
+from src.os.in_memory import InMemoryProcessAPI
+from src.os.read_counter import ReadCounterAPI
+
+
+class ThreadRecordingAPI(InMemoryProcessAPI):
+    # remembers the thread every read of the spans ran on
+    _threads: list[str] = PrivateAttr(default_factory=list)
+
+    def _read_spans(self, h_process: int, spans: list[tuple[int, int]]) -> list[bytes | None]:
+        self._threads.append(threading.current_thread().name)
+        return super()._read_spans(h_process=h_process, spans=spans)
+
+
+def test_aread_many_reads_on_the_memory_io_thread():
+    os_api = ThreadRecordingAPI()
+    os_api.map_region(0x10000, bytes(range(256)))
+    requests = [(0x10000, 0x4), (0x10080, 0x8), (0x90000, 0x4)]
+
+    async def read() -> list[memoryview | None]:
+        return await os_api.aread_many(h_process=1, requests=requests)
+
+    try:
+        results = asyncio.run(read())
+    finally:
+        os_api.shutdown_io_executor(h_process=1)
+
+    assert [None if data is None else bytes(data) for data in results] == [
+        None if data is None else bytes(data) for data in os_api.read_many(h_process=1, requests=requests)
+    ]
+    assert os_api._threads[0].startswith('memory-io-1')
+    assert os_api._threads[1] == threading.current_thread().name
+
+
+def test_wrappers_share_the_memory_io_thread():
+    os_api = InMemoryProcessAPI()
+    wrapper = ReadCounterAPI(os_api=os_api)
+
+    try:
+        assert wrapper._io_executor(h_process=1) is os_api._io_executor(h_process=1)
+    finally:
+        wrapper.shutdown_io_executor(h_process=1)
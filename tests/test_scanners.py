@@ -0,0 +1,95 @@
+import random
+
+from src.utils.scanners import BytePattern, BytePatternSet, split_regions, scan_regions, scan_regions_many
+
+
+def naive_find_all(pattern: list[int | None], data: bytes, max_results: int) -> list[int]:
+    # every position checked byte by byte, matches don't overlap
+    results = []
+    offset = 0
+    while offset + len(pattern) <= len(data) and len(results) < max_results:
+        if all(byte is None or data[offset + index] == byte for index, byte in enumerate(pattern)):
+            results.append(offset)
+            offset += len(pattern) + 1
+        else:
+            offset += 1
+    return results
+
+
+def test_find_all_with_wildcards():
+    pattern = BytePattern.from_hex('48 8B ?? ?? 90')
+    data = b'\x00\x48\x8b\x01\x02\x90\x48\x8b\x90\x48\x8b\xff\xff\x90'
+
+    assert pattern.find_all(data, base_address=0x1000, max_results=10) == [0x1001, 0x1009]
+
+
+def test_find_all_stops_at_max_results_and_skips_past_last_match():
+    pattern = BytePattern.from_hex('AA')
+    data = b'\xaa\x00\xaa\x00\xaa'
+
+    assert pattern.find_all(data, max_results=2) == [0, 2]
+    assert pattern.find_all(data, max_results=10, last_match=0) == [2, 4]
+
+
+def test_find_all_matches_a_naive_scan():
+    rng = random.Random(0)
+    for _ in range(200):
+        data = bytes(rng.choice(b'\x00\x01\x02') for _ in range(256))
+        pattern = [rng.choice([0, 1, 2, None]) for _ in range(rng.randint(1, 6))]
+        if all(byte is None for byte in pattern):
+            pattern[0] = 0
+
+        byte_pattern = BytePattern(pattern=pattern)
+
+        assert byte_pattern.find_all(data, max_results=1000) == naive_find_all(pattern, data, 1000)
+
+
+def test_find_all_finds_planted_matches_in_a_large_buffer():
+    data = bytearray(random.Random(1).randrange(0x80, 0x100) for _ in range(0x10000))
+    for address in (0x10, 0x7FFE, 0xFFF0):
+        data[address:address + 4] = b'\x11\x00\x22\x01'
+
+    byte_pattern = BytePattern.from_hex('?? 00 ?? 01')
+
+    assert byte_pattern.find_all(bytes(data), max_results=1000) == [0x10, 0x7FFE, 0xFFF0]
+
+
+def test_pattern_set_matches_each_pattern_on_its_own():
+    data = bytes(random.Random(2).choice(b'\x00\x01\x02') for _ in range(512))
+    patterns = BytePatternSet.from_hex({'short': '01', 'long': '00 ?? 02 01', 'wildcard': '02 ?? 02'})
+
+    results = patterns.find_all(data, max_results=1000)
+
+    assert results == {
+        key: pattern.find_all(data, max_results=1000) for key, pattern in patterns.patterns.items()
+    }
+
+
+def test_split_regions_overlaps_segments_by_the_pattern_length():
+    segments = split_regions([(0x0, 0x25), (0x100, 0x108)], length=4, segment_size=0x10)
+
+    assert segments == [(0x0, 0x13), (0x10, 0x23), (0x20, 0x25), (0x100, 0x108)]
+
+
+def test_parallel_scans_match_sequential_scans():
+    patterns = BytePatternSet.from_hex({'short': '00 01', 'long': '00 01 ?? 02 00', 'single': '02'})
+    for seed in range(20):
+        rng = random.Random(seed)
+        data = bytes(rng.choice(b'\x00\x01\x02') for _ in range(600))
+        regions = [(0x0, 0x130), (0x130, 0x258)] if seed % 2 else [(0x0, 0x258)]
+
+        def read(address: int, size: int) -> bytes:
+            return data[address:address + size]
+
+        for max_results in (1, 7, 1000):
+            sequential = scan_regions_many(read, patterns, regions, max_results=max_results, chunk_size=17)
+            parallel = scan_regions_many(
+                read, patterns, regions, max_results=max_results, chunk_size=17, max_workers=4, segment_size=23
+            )
+            assert parallel == sequential
+
+            for key, pattern in patterns.patterns.items():
+                assert scan_regions(read, pattern, regions, max_results=max_results, chunk_size=17) == sequential[key]
+                assert scan_regions(
+                    read, pattern, regions, max_results=max_results, chunk_size=17, max_workers=4, segment_size=23
+                ) == sequential[key]